@@ -0,0 +1,230 @@
+"""
+Lokalny serwer udający Wykop API v3, na potrzeby benchmarków.
+
+Zwraca deterministyczne odpowiedzi o strukturze zbliżonej do prawdziwego API
+(wpisy, komentarze, strumień tagu, profile, tokeny) z konfigurowalnym opóźnieniem.
+
+Uruchomienie samodzielne:
+    python -m benchmarks.fake_server --port 8080 --latency 0.02
+"""
+import argparse
+import base64
+import functools
+import json
+import random
+import re
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+TOTAL_ENTRIES = 10_000
+
+
+def _jwt(exp: float) -> str:
+    def encode(data: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+
+    return f"{encode({'alg': 'HS256', 'typ': 'JWT'})}.{encode({'exp': int(exp), 'username': 'bench'})}.signature"
+
+
+def _author(rng: random.Random) -> dict:
+    username = f"user_{rng.randrange(5000)}"
+    return {
+        "username": username,
+        "gender": rng.choice(["m", "f", None]),
+        "company": False,
+        "avatar": f"https://wykop.pl/cdn/avatars/{username}.jpg",
+        "color": rng.choice(["orange", "green", "burgundy"]),
+        "status": "active",
+        "verified": False,
+        "rank": {"position": rng.randrange(100_000), "trend": 0},
+        "online": rng.random() < 0.2,
+    }
+
+
+def _content(rng: random.Random) -> str:
+    words = ["wykop", "mirko", "python", "sdk", "benchmark", "api", "tag", "wpis", "komentarz", "plusy"]
+    return " ".join(rng.choice(words) for _ in range(rng.randrange(10, 80)))
+
+
+def entry_comment(entry_id: int, comment_id: int) -> dict:
+    rng = random.Random(entry_id * 1_000 + comment_id)
+    return {
+        "id": comment_id,
+        "parent_id": entry_id,
+        "resource": "entry_comment",
+        "created_at": "2024-01-01 12:00:00",
+        "content": _content(rng),
+        "adult": False,
+        "author": _author(rng),
+        "media": {"photo": None, "embed": None},
+        "votes": {"up": rng.randrange(100), "down": 0, "users": []},
+        "voted": 0,
+        "favourite": False,
+        "deletable": False,
+        "editable": False,
+        "device": "",
+    }
+
+
+def entry(entry_id: int, comments: int = 2) -> dict:
+    rng = random.Random(entry_id)
+    return {
+        "id": entry_id,
+        "slug": f"wpis-{entry_id}",
+        "resource": "entry",
+        "created_at": "2024-01-01 12:00:00",
+        "content": _content(rng),
+        "adult": False,
+        "tags": [f"tag{rng.randrange(50)}" for _ in range(rng.randrange(1, 5))],
+        "author": _author(rng),
+        "media": {"photo": None, "embed": None, "survey": None},
+        "votes": {"up": rng.randrange(1000), "down": 0, "users": []},
+        "comments": {
+            "count": comments,
+            "items": [entry_comment(entry_id, i) for i in range(comments)],
+        },
+        "voted": 0,
+        "favourite": False,
+        "deletable": False,
+        "editable": False,
+        "deleted": None,
+        "device": "",
+    }
+
+
+def link(link_id: int) -> dict:
+    rng = random.Random(-link_id)
+    return {
+        "id": link_id,
+        "slug": f"znalezisko-{link_id}",
+        "resource": "link",
+        "title": _content(rng)[:80],
+        "description": _content(rng),
+        "source": {"url": f"https://example.com/{link_id}", "label": "example.com"},
+        "created_at": "2024-01-01 12:00:00",
+        "published_at": "2024-01-01 13:00:00",
+        "hot": rng.random() < 0.1,
+        "adult": False,
+        "tags": [f"tag{rng.randrange(50)}" for _ in range(rng.randrange(1, 5))],
+        "author": _author(rng),
+        "media": {"photo": None, "embed": None},
+        "votes": {"up": rng.randrange(5000), "down": rng.randrange(100), "count": 0},
+        "comments": {"count": rng.randrange(300)},
+    }
+
+
+def _page_number(query: dict) -> int:
+    try:
+        return max(1, int(query.get("page", ["1"])[0]))
+    except ValueError:
+        return 1
+
+
+def _limit(query: dict, default: int = 25) -> int:
+    return min(100, int(query.get("limit", [default])[0]))
+
+
+def entries_page(query: dict) -> dict:
+    page, limit = _page_number(query), _limit(query)
+    first = (page - 1) * limit
+    return {
+        "data": [entry(i) for i in range(first, min(first + limit, TOTAL_ENTRIES))],
+        "pagination": {"per_page": limit, "total": TOTAL_ENTRIES},
+    }
+
+
+def stream_page(tag: str, query: dict) -> dict:
+    # paginacja hashami, jak dla zalogowanych użytkowników
+    page = query.get("page", ["0"])[0]
+    index = int(page[1:]) if page.startswith("h") else 0
+    limit = _limit(query)
+    first = index * limit
+    data = [entry(i) if i % 3 else link(i) for i in range(first, first + limit)]
+    return {"data": data, "pagination": {"next": f"h{index + 1}", "prev": page}}
+
+
+ROUTES = [
+    ("POST", re.compile(r"/auth"), lambda m, q: {"data": {"token": _jwt(time.time() + 3600)}}),
+    ("POST", re.compile(r"/refresh-token"), lambda m, q: {
+        "data": {"token": _jwt(time.time() + 3600), "refresh_token": "refresh"}
+    }),
+    ("GET", re.compile(r"/entries"), lambda m, q: entries_page(q)),
+    ("GET", re.compile(r"/entries/(\d+)"), lambda m, q: {"data": entry(int(m[1]))}),
+    ("GET", re.compile(r"/entries/(\d+)/comments"), lambda m, q: {
+        "data": [entry_comment(int(m[1]), i) for i in range(_limit(q, 50))],
+        "pagination": {"per_page": _limit(q, 50), "total": _limit(q, 50)},
+    }),
+    ("GET", re.compile(r"/tags/([^/]+)/stream"), lambda m, q: stream_page(m[1], q)),
+    ("GET", re.compile(r"/profile/users/([^/]+)"), lambda m, q: {"data": _author(random.Random(m[1])) | {"username": m[1]}}),
+]
+
+
+def render(method: str, path: str, query: str) -> tuple[int, bytes]:
+    for route_method, pattern, handler in ROUTES:
+        if method == route_method and (match := pattern.fullmatch(path)):
+            return 200, json.dumps(handler(match, parse_qs(query))).encode()
+
+    return 404, json.dumps({"error": {"message": "Not found", "code": 404}}).encode()
+
+
+# odpowiedzi GET są deterministyczne, więc generowanie ich nie musi obciążać serwera przy każdym zapytaniu
+render_cached = functools.lru_cache(maxsize=4096)(render)
+
+
+class FakeWykopHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    latency = 0.0
+
+    def _respond(self, method: str):
+        url = urlparse(self.path)
+        path = url.path.removeprefix("/api/v3")
+
+        if length := int(self.headers.get("Content-Length") or 0):
+            self.rfile.read(length)
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        status, payload = (render_cached if method == "GET" else render)(method, path, url.query)
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        self._respond("GET")
+
+    def do_POST(self):
+        self._respond("POST")
+
+    def log_message(self, *args):
+        pass
+
+
+def create_server(host: str = "127.0.0.1", port: int = 0, latency: float = 0.0) -> ThreadingHTTPServer:
+    handler = type("Handler", (FakeWykopHandler,), {"latency": latency})
+
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="opóźnienie każdej odpowiedzi w sekundach")
+    args = parser.parse_args()
+
+    server = create_server(args.host, args.port, args.latency)
+    print(f"http://{args.host}:{server.server_address[1]}", flush=True)
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+"""
+Benchmarki SDK na lokalnym serwerze udającym Wykop API.
+
+Przykład:
+    python -m benchmarks.run --latency 0.005 --output wyniki.json
+    python -m benchmarks.run --compare wyniki.json
+"""
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Callable
+
+from requests.adapters import HTTPAdapter
+
+from src.wykop_sdk_reloaded.v3.client import ApiSession, AuthClient, WykopApiClient
+
+try:
+    import httpx
+    from src.wykop_sdk_reloaded.v3.async_client import AsyncApiSession, AsyncAuthClient, AsyncWykopApiClient
+except ImportError:
+    httpx = None
+
+
+API_ORIGIN = "https://wykop.pl"
+
+
+@dataclass
+class Result:
+    name: str
+    ops: int
+    requests: int
+    rps: float
+    p50_ms: float
+    p99_ms: float
+    cpu_ms_per_request: float
+    peak_memory_kb: float
+
+
+class RedirectAdapter(HTTPAdapter):
+    """
+    Adapter requests kierujący zapytania do wykop.pl na lokalny serwer
+    """
+    def __init__(self, target: str, **kwargs):
+        super().__init__(**kwargs)
+        self.target = target
+
+    def send(self, request, **kwargs):
+        request.url = request.url.replace(API_ORIGIN, self.target, 1)
+        return super().send(request, **kwargs)
+
+
+if httpx is not None:
+    class RedirectTransport(httpx.AsyncHTTPTransport):
+        """
+        Transport httpx kierujący zapytania do wykop.pl na lokalny serwer
+        """
+        def __init__(self, target: str, **kwargs):
+            super().__init__(**kwargs)
+            self.target = httpx.URL(target)
+
+        async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+            request.url = request.url.copy_with(scheme=self.target.scheme, host=self.target.host, port=self.target.port)
+            return await super().handle_async_request(request)
+
+
+def start_server(latency: float) -> tuple[subprocess.Popen, str]:
+    # serwer działa w osobnym procesie, żeby nie wliczał się do czasu CPU klienta
+    process = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.fake_server", "--port", "0", "--latency", str(latency)],
+        stdout=subprocess.PIPE,
+        text=True
+    )
+    return process, process.stdout.readline().strip()
+
+
+def sync_client(target: str, concurrency: int, **kwargs) -> WykopApiClient:
+    session = ApiSession(pool_maxsize=concurrency)
+    session.http.mount(API_ORIGIN, RedirectAdapter(target, pool_maxsize=concurrency))
+
+    auth = AuthClient(session=session)
+    auth.authenticate_app("key", "secret")
+    return WykopApiClient(auth, **kwargs)
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent))]
+
+
+def measure(name: str, op: Callable[[], None], ops: int, requests_per_op: int, memory_ops: int = 3) -> Result:
+    for _ in range(3):
+        op()
+
+    latencies = []
+    cpu_started = time.process_time()
+    started = time.perf_counter()
+
+    for _ in range(ops):
+        op_started = time.perf_counter()
+        op()
+        latencies.append(time.perf_counter() - op_started)
+
+    wall = time.perf_counter() - started
+    cpu = time.process_time() - cpu_started
+
+    # tracemalloc spowalnia wykonanie, więc pamięć jest mierzona w osobnym przebiegu
+    tracemalloc.start()
+    for _ in range(memory_ops):
+        op()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    requests = ops * requests_per_op
+    return Result(
+        name=name,
+        ops=ops,
+        requests=requests,
+        rps=requests / wall,
+        p50_ms=statistics.median(latencies) * 1000,
+        p99_ms=_percentile(latencies, 0.99) * 1000,
+        cpu_ms_per_request=cpu / requests * 1000,
+        peak_memory_kb=peak / 1024
+    )
+
+
+def sync_scenarios(target: str, ops: int, concurrency: int) -> list[Result]:
+    api = sync_client(target, concurrency)
+    results = [
+        measure("get_entry", lambda: api.entries_get_entry("1"), ops, 1),
+        measure("list_entries_limit_100", lambda: api.entries_list_entries(limit=100), ops, 1),
+        measure(
+            "paginate_5_pages",
+            lambda: sum(1 for _ in api.iter_tags_get_stream_of_tag("wykop", limit=50, max_pages=5)),
+            max(1, ops // 5),
+            5
+        ),
+        measure(
+            f"batch_get_entry_x{concurrency}",
+            lambda: api.batch([("entries_get_entry", str(i)) for i in range(concurrency)], concurrency=concurrency),
+            max(1, ops // concurrency),
+            concurrency
+        ),
+    ]
+
+    streaming = sync_client(target, concurrency, stream_pages=True)
+    results.append(measure(
+        "paginate_5_pages_streamed",
+        lambda: sum(1 for _ in streaming.iter_tags_get_stream_of_tag("wykop", limit=50, max_pages=5)),
+        max(1, ops // 5),
+        5
+    ))
+
+    models = sync_client(target, concurrency, models=True)
+    results.append(measure(
+        "list_entries_limit_100_models",
+        lambda: [entry.author.username for entry in models.entries_list_entries(limit=100)["data"]],
+        ops,
+        1
+    ))
+
+    return results
+
+
+def async_scenarios(target: str, ops: int, concurrency: int) -> list[Result]:
+    if httpx is None:
+        return []
+
+    loop = asyncio.new_event_loop()
+
+    async def create() -> AsyncWykopApiClient:
+        session = AsyncApiSession(max_connections=concurrency)
+        session.http = httpx.AsyncClient(
+            transport=RedirectTransport(target, limits=httpx.Limits(max_connections=concurrency)),
+            timeout=None
+        )
+
+        auth = AsyncAuthClient(session=session)
+        await auth.authenticate_app("key", "secret")
+        return AsyncWykopApiClient(auth)
+
+    api = loop.run_until_complete(create())
+
+    async def gather():
+        await asyncio.gather(*(api.entries_get_entry(str(i)) for i in range(concurrency)))
+
+    try:
+        return [measure(
+            f"async_get_entry_x{concurrency}",
+            lambda: loop.run_until_complete(gather()),
+            max(1, ops // concurrency),
+            concurrency
+        )]
+    finally:
+        loop.run_until_complete(api.session.close())
+        loop.close()
+
+
+def print_report(results: list[dict], baseline: dict[str, dict] | None = None):
+    header = f"{'scenariusz':<34}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'CPU ms/req':>12}{'pamięć KB':>12}"
+    print(header)
+    print("-" * len(header))
+
+    for result in results:
+        print(
+            f"{result['name']:<34}{result['rps']:>10.1f}{result['p50_ms']:>10.2f}{result['p99_ms']:>10.2f}"
+            f"{result['cpu_ms_per_request']:>12.3f}{result['peak_memory_kb']:>12.1f}"
+        )
+
+        previous = (baseline or {}).get(result["name"])
+        if previous:
+            deltas = [
+                f"{key}: {(result[key] / previous[key] - 1) * 100:+.1f}%"
+                for key in ("rps", "p50_ms", "p99_ms", "cpu_ms_per_request", "peak_memory_kb")
+                if previous[key]
+            ]
+            print(f"{'':<34}{', '.join(deltas)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.0, help="opóźnienie odpowiedzi serwera w sekundach")
+    parser.add_argument("--ops", type=int, default=200, help="liczba operacji w każdym scenariuszu")
+    parser.add_argument("--concurrency", type=int, default=16, help="liczba równoległych zapytań w scenariuszach współbieżnych")
+    parser.add_argument("--output", help="plik, do którego zostanie zapisany raport JSON")
+    parser.add_argument("--compare", help="raport JSON z poprzedniego uruchomienia, z którym zostaną porównane wyniki")
+    args = parser.parse_args()
+
+    server, target = start_server(args.latency)
+    try:
+        results = sync_scenarios(target, args.ops, args.concurrency)
+        results += async_scenarios(target, args.ops, args.concurrency)
+    finally:
+        server.terminate()
+        server.wait()
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "commit": git_commit(),
+            "latency": args.latency,
+            "ops": args.ops,
+            "concurrency": args.concurrency,
+            "created_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        },
+        "results": [asdict(result) for result in results],
+    }
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = {result["name"]: result for result in json.load(file)["results"]}
+
+    print_report(report["results"], baseline)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
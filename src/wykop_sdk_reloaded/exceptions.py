@@ -1,8 +1,14 @@
 class WykopApiError(Exception):
     """
     Generyczny błąd WykopApiv3
+
+    Jeśli błąd został zwrócony przez API, to odpowiedź HTTP jest dostępna w atrybucie response
     """
-    pass
+    response = None
+
+    @property
+    def status_code(self) -> int | None:
+        return self.response.status_code if self.response is not None else None
 
 
 class WykopApiLimitExceededError(WykopApiError):
@@ -33,5 +39,20 @@ class WykopApiNotFoundError(WykopApiError):
     pass
 
 
+class WykopApiDeadlineExceededError(WykopApiError):
+    """
+    Wywołanie nie zmieściło się w czasie wyznaczonym przez deadline() - razem z ponowieniami,
+    kolejnymi stronami i odświeżaniem tokenu
+    """
+    pass
+
+
 class AuthError(Exception):
     pass
+
+
+class ReplayError(Exception):
+    """
+    Odtwarzane nagranie (Cassette) nie zawiera odpowiedzi na wykonane zapytanie
+    """
+    pass
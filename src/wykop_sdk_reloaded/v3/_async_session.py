@@ -0,0 +1,146 @@
+import time
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from ._rate_limit import RateLimiter
+from ._retry import RetryPolicy
+from ._timeout import Timeouts, request_timeout
+from ._hooks import RequestHooks
+from ._cache import ResponseCache
+from ._json import JsonLoads, default_json_loads
+from ._coalesce import AsyncSingleFlight
+from ._replay import Cassette, AsyncRecordReplayTransport
+
+
+_TRACED_PHASES = {
+    "connection.connect_tcp": "connect",
+    "connection.start_tls": "tls",
+}
+
+
+def _tracer(timings: dict):
+    """
+    Zwraca callback rozszerzenia "trace" httpx, który zapisuje czasy poszczególnych etapów zapytania
+    """
+    phases = {}
+
+    async def trace(event: str, info: dict):
+        phase, _, stage = event.rpartition(".")
+        now = time.monotonic()
+
+        if stage == "started":
+            phases[phase] = now
+        elif stage == "complete":
+            if phase in _TRACED_PHASES:
+                timings[_TRACED_PHASES[phase]] = now - phases.get(phase, now)
+            elif phase.endswith(".send_request_body"):
+                phases["sent"] = now
+            elif phase.endswith(".receive_response_headers"):
+                # tak jak w ApiSession: od wysłania zapytania, bez zestawiania połączenia
+                timings["ttfb"] = now - phases.get("sent", now)
+
+    return trace
+
+
+class AsyncApiSession:
+    """
+    Nieblokująca pula połączeń HTTP do Wykop API oparta o httpx.AsyncClient.
+
+    Wymaga doinstalowania zależności: pip install wykop_sdk_reloaded[async]
+
+    params max_connections: maksymalna liczba jednocześnie otwartych połączeń
+    params max_keepalive_connections: maksymalna liczba bezczynnych połączeń utrzymywanych w puli
+    params keepalive_expiry: czas (w sekundach) po którym bezczynne połączenie zostaje zamknięte
+    params rate_limiter: limiter zapytań współdzielony przez wszystkich korzystających z sesji
+    params retry: polityka ponawiania nieudanych zapytań, domyślnie RetryPolicy(). RetryPolicy(max_retries=0) wyłącza ponawianie
+    params cache: pamięć podręczna odpowiedzi zapytań GET, domyślnie wyłączona
+    params coalesce: czy łączyć jednoczesne identyczne zapytania GET (ten sam adres, parametry i token) w jedno.
+        Wszyscy oczekujący dostają ten sam obiekt odpowiedzi, więc nie należy go modyfikować
+    params json_loads: funkcja dekodująca treść odpowiedzi z bytes, np. orjson.loads.
+        Domyślnie orjson lub ujson jeśli są zainstalowane, w przeciwnym razie json.loads
+    params timeout: limity czasu nawiązania połączenia i odczytu, domyślnie Timeouts() - 5s na połączenie i 30s na odczyt
+    params hooks: hooki wywoływane przy każdym zapytaniu, np. do zbierania metryk. Można je też rejestrować
+        później przez session.hooks.on_request/on_response/on_error
+    params cassette: nagranie, do którego są zapisywane odpowiedzi API (Cassette(path, mode="record"))
+        albo z którego są odtwarzane bez łączenia się z siecią (Cassette(path))
+    """
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        rate_limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+        cache: ResponseCache | None = None,
+        coalesce: bool = False,
+        json_loads: JsonLoads | None = None,
+        timeout: Timeouts | None = None,
+        hooks: RequestHooks | None = None,
+        cassette: Cassette | None = None
+    ):
+        if httpx is None:
+            raise ImportError("AsyncApiSession wymaga biblioteki httpx. Zainstaluj wykop_sdk_reloaded[async]")
+
+        self.rate_limiter = rate_limiter
+        self.retry = retry or RetryPolicy()
+        self.cache = cache
+        self.json_loads = json_loads or default_json_loads()
+        self.timeout = timeout or Timeouts()
+        self.hooks = hooks if hooks is not None else RequestHooks()
+        self.coalescing = AsyncSingleFlight() if coalesce else None
+
+        transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry
+            )
+        )
+        if cassette is not None:
+            transport = AsyncRecordReplayTransport(cassette, transport)
+
+        self.http = httpx.AsyncClient(transport=transport, timeout=None)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        stream: bool = False,
+        timings: dict | None = None,
+        **kwargs
+    ) -> "httpx.Response":
+        """
+        params stream: czy zwrócić odpowiedź przed pobraniem treści. Taką odpowiedź trzeba zamknąć przez aclose()
+        params timings: słownik, do którego zostaną zapisane czasy oczekiwania na limiter zapytań (queued),
+            nawiązania połączenia (connect, tls) i oczekiwania na nagłówki odpowiedzi po wysłaniu zapytania (ttfb)
+        """
+        if self.rate_limiter:
+            queued = await self.rate_limiter.acquire_async(url)
+            if timings is not None:
+                timings["queued"] = queued
+
+        connect, read = request_timeout(self.timeout, url)
+        kwargs["timeout"] = httpx.Timeout(read, connect=connect)
+
+        if timings is not None:
+            kwargs["extensions"] = {"trace": _tracer(timings)}
+
+        if stream:
+            return await self.http.send(self.http.build_request(method, url, **kwargs), stream=True)
+
+        return await self.http.request(method, url, **kwargs)
+
+    async def close(self):
+        """
+        Zamyka wszystkie otwarte połączenia z puli
+        """
+        await self.http.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
@@ -1,11 +1,35 @@
+import asyncio
+import threading
+import time
+
 from ..exceptions import AuthError
 
 from . import _urls
-from ._request import ApiRequester
+from ._request import ApiRequester, AsyncApiRequester
+from ._session import ApiSession
+from ._async_session import AsyncApiSession
+from ._utils import jwt_expiration
 
 
 class AuthClient:
-    def __init__(self):
+    def __init__(
+        self,
+        session: ApiSession | None = None,
+        auto_refresh_token: bool = True,
+        refresh_margin: float | None = 60
+    ):
+        """
+        params session: pula połączeń HTTP współdzielona z klientami utworzonymi na podstawie tego AuthClient
+        params auto_refresh_token: czy po odrzuceniu tokenu przez API (WykopApiAuthorizationError)
+            automatycznie go odświeżyć i ponowić zapytanie
+        params refresh_margin: ile sekund przed wygaśnięciem (claim exp tokenu JWT) token zostanie odświeżony
+            przy najbliższym zapytaniu. None wyłącza odświeżanie z wyprzedzeniem
+        """
+        self.session = session or ApiSession()
+        self.auto_refresh_token = auto_refresh_token
+        self.refresh_margin = refresh_margin
+        self._refresh_lock = threading.Lock()
+
         self.key = None
         self.secret = None
 
@@ -15,7 +39,7 @@ class AuthClient:
         self.jwt_user_refresh_token = None
 
     def __generate_jwt_app_token(self) -> str:
-        response = ApiRequester(url=_urls.AUTH_URL, token=None).post(data={"key": self.key, "secret": self.secret})
+        response = ApiRequester(url=_urls.AUTH_URL, token=None, session=self.session).post(data={"key": self.key, "secret": self.secret})
         assert response
         
         return response["data"]["token"]
@@ -32,7 +56,7 @@ class AuthClient:
         """
         Zwraca link laczacy aplikacje z kontem. Metoda wymagania do uzyskania danych logowania uzytkownika
         """
-        print(ApiRequester(url=_urls.CONNECT_URL, token=self.jwt_app_token).get()["data"]["connect_url"])
+        print(ApiRequester(url=_urls.CONNECT_URL, token=self.jwt_app_token, session=self.session).get()["data"]["connect_url"])
 
     def authenticate_app(self, key: str, secret: str):
         self.key = key
@@ -48,7 +72,7 @@ class AuthClient:
         if not self.jwt_user_refresh_token:
             raise AuthError("Wymagane zalogowanie uzytkownika. Wywołaj AuthClient.authenticate_user()")
 
-        response = ApiRequester(url=_urls.REFRESH_TOKEN_URL, token=None).post(
+        response = ApiRequester(url=_urls.REFRESH_TOKEN_URL, token=None, session=self.session).post(
             data={"refresh_token": self.jwt_user_refresh_token}
         )
 
@@ -64,3 +88,146 @@ class AuthClient:
         Wybiera bardziej sprawczy token
         """
         return self.jwt_user_token or self.jwt_app_token
+
+    def token_expires_at(self) -> float | None:
+        """
+        Zwraca czas wygaśnięcia (timestamp) aktualnie używanego tokenu albo None, jeśli nie jest znany
+        """
+        token = self.get_jwt_token()
+        return jwt_expiration(token) if token else None
+
+    def _token_expires_soon(self) -> bool:
+        if self.refresh_margin is None:
+            return False
+
+        expires_at = self.token_expires_at()
+        return expires_at is not None and expires_at - self.refresh_margin <= time.time()
+
+    def refresh_token_if_expiring(self):
+        """
+        Odświeża token, jeśli wygaśnie w ciągu refresh_margin sekund. Wywoływane przed każdym zapytaniem,
+        dzięki czemu zapytania nie trafiają na odrzucony token.
+        """
+        if self._token_expires_soon():
+            self.refresh_expired_token(self.get_jwt_token())
+
+    def _can_refresh(self) -> bool:
+        """
+        Czy można odświeżyć token zwracany przez get_jwt_token(). Nowy token aplikacji nie zastąpi tokenu użytkownika
+        """
+        if self.jwt_user_token:
+            return bool(self.jwt_user_refresh_token)
+
+        return bool(self.key and self.secret)
+
+    def refresh_expired_token(self, expired_token: str | None) -> bool:
+        """
+        Odświeża token odrzucony przez API. Gdy wiele wątków jednocześnie zgłosi ten sam token,
+        odświeżenie wykonuje tylko pierwszy z nich, a pozostałe czekają na jego wynik.
+
+        Zwraca True jeśli jest dostępny nowy token i zapytanie można ponowić.
+        """
+        with self._refresh_lock:
+            if expired_token != self.get_jwt_token():
+                return True
+
+            if not self._can_refresh():
+                return False
+
+            if self.jwt_user_token:
+                self.refresh_user_token()
+            else:
+                self.authenticate_app(self.key, self.secret)
+
+            return True
+
+
+class AsyncAuthClient(AuthClient):
+    """
+    Wersja AuthClient dla asyncio. Metody wykonujące zapytania do API są korutynami.
+    """
+    def __init__(
+        self,
+        session: AsyncApiSession | None = None,
+        auto_refresh_token: bool = True,
+        refresh_margin: float | None = 60
+    ):
+        """
+        params session: nieblokująca pula połączeń HTTP współdzielona z klientami utworzonymi na podstawie tego AsyncAuthClient
+        params auto_refresh_token: czy po odrzuceniu tokenu przez API (WykopApiAuthorizationError)
+            automatycznie go odświeżyć i ponowić zapytanie
+        params refresh_margin: ile sekund przed wygaśnięciem (claim exp tokenu JWT) token zostanie odświeżony
+            przy najbliższym zapytaniu. None wyłącza odświeżanie z wyprzedzeniem
+        """
+        super().__init__(
+            session=session or AsyncApiSession(),
+            auto_refresh_token=auto_refresh_token,
+            refresh_margin=refresh_margin
+        )
+        self._refresh_lock = asyncio.Lock()
+
+    async def wykop_connect(self):
+        """
+        Zwraca link laczacy aplikacje z kontem. Metoda wymagania do uzyskania danych logowania uzytkownika
+        """
+        response = await AsyncApiRequester(url=_urls.CONNECT_URL, token=self.jwt_app_token, session=self.session).get()
+        print(response["data"]["connect_url"])
+
+    async def authenticate_app(self, key: str, secret: str):
+        self.key = key
+        self.secret = secret
+
+        response = await AsyncApiRequester(url=_urls.AUTH_URL, token=None, session=self.session).post(
+            data={"key": self.key, "secret": self.secret}
+        )
+        assert response
+
+        self.jwt_app_token = response["data"]["token"]
+
+    async def authenticate_user(self, refresh_token: str):
+        self.jwt_user_refresh_token = refresh_token
+        await self.refresh_user_token()
+
+    async def refresh_user_token(self) -> dict:
+        if not self.jwt_user_refresh_token:
+            raise AuthError("Wymagane zalogowanie uzytkownika. Wywołaj AsyncAuthClient.authenticate_user()")
+
+        response = await AsyncApiRequester(url=_urls.REFRESH_TOKEN_URL, token=None, session=self.session).post(
+            data={"refresh_token": self.jwt_user_refresh_token}
+        )
+
+        assert response
+        response = response["data"]
+
+        self.jwt_user_token = response["token"]
+
+        return response
+
+    async def refresh_expired_token(self, expired_token: str | None) -> bool:
+        """
+        Odświeża token odrzucony przez API. Gdy wiele korutyn jednocześnie zgłosi ten sam token,
+        odświeżenie wykonuje tylko pierwsza z nich, a pozostałe czekają na jego wynik.
+
+        Zwraca True jeśli jest dostępny nowy token i zapytanie można ponowić.
+        """
+        async with self._refresh_lock:
+            if expired_token != self.get_jwt_token():
+                return True
+
+            if not self._can_refresh():
+                return False
+
+            if self.jwt_user_token:
+                await self.refresh_user_token()
+            else:
+                await self.authenticate_app(self.key, self.secret)
+
+            return True
+
+    async def refresh_token_if_expiring(self):
+        """
+        Odświeża token, jeśli wygaśnie w ciągu refresh_margin sekund
+        """
+        if self._token_expires_soon():
+            await self.refresh_expired_token(self.get_jwt_token())
+
@@ -0,0 +1,122 @@
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator
+
+
+BatchCall = Callable[[], Any] | tuple
+"""
+Pojedyncze wywołanie w batchu: funkcja bez argumentów (np. functools.partial)
+albo krotka (nazwa_metody, *argumenty), np. ("entries_get_entry", "123")
+"""
+
+
+@dataclass
+class BatchResult:
+    """
+    Wynik pojedynczego wywołania z batcha. Błąd (np. WykopApiNotFoundError)
+    jest zapisywany w polu error zamiast przerywać cały batch.
+    """
+    result: Any = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def unwrap(self) -> Any:
+        """
+        Zwraca wynik albo rzuca zapisany błąd
+        """
+        if self.error is not None:
+            raise self.error
+
+        return self.result
+
+
+def _resolve(client, call: BatchCall) -> Callable[[], Any]:
+    if callable(call):
+        return call
+
+    name, *args = call
+    return functools.partial(getattr(client, name), *args)
+
+
+def run_batch(client, calls: Iterable[BatchCall], concurrency: int) -> list[BatchResult]:
+    def run(call: BatchCall) -> BatchResult:
+        try:
+            return BatchResult(result=_resolve(client, call)())
+        except Exception as e:
+            return BatchResult(error=e)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        # wątki puli nie dziedziczą kontekstu, a od niego zależą deadline() i stream_pages
+        futures = [executor.submit(contextvars.copy_context().run, run, call) for call in calls]
+        return [future.result() for future in futures]
+
+
+async def async_run_batch(client, calls: Iterable[BatchCall], concurrency: int) -> list[BatchResult]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(call: BatchCall) -> BatchResult:
+        async with semaphore:
+            try:
+                return BatchResult(result=await _resolve(client, call)())
+            except Exception as e:
+                return BatchResult(error=e)
+
+    return list(await asyncio.gather(*(run(call) for call in calls)))
+
+
+def as_completed(calls: Iterable[Callable[[], Any]], concurrency: int) -> Iterator[Any]:
+    """
+    Wykonuje funkcje w puli wątków i zwraca ich wyniki w kolejności zakończenia.
+    Wykonywanych jest jednocześnie co najwyżej concurrency funkcji, a kolejne są pobierane z calls
+    dopiero gdy zwolni się miejsce. Błąd funkcji jest rzucany z generatora, a pozostałe zadania są porzucane.
+    """
+    calls = iter(calls)
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    pending = set()
+
+    try:
+        while True:
+            for call in calls:
+                pending.add(executor.submit(contextvars.copy_context().run, call))
+                if len(pending) >= concurrency:
+                    break
+
+            if not pending:
+                return
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def async_as_completed(calls: Iterable[Callable[[], Awaitable[Any]]], concurrency: int) -> AsyncIterator[Any]:
+    """
+    Wersja as_completed dla asyncio
+    """
+    calls = iter(calls)
+    pending = set()
+
+    try:
+        while True:
+            for call in calls:
+                pending.add(asyncio.ensure_future(call()))
+                if len(pending) >= concurrency:
+                    break
+
+            if not pending:
+                return
+
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
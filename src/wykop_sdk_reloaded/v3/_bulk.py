@@ -0,0 +1,381 @@
+import functools
+import math
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator
+
+from ._batch import as_completed, async_as_completed
+from ._pagination import _page_items, _page_pagination, next_page
+from ._utils import item_field
+from ..exceptions import WykopApiError
+
+
+BulkErrorHandler = Callable[[str, Exception], None]
+"""
+Funkcja wywoływana z identyfikatorem (np. id wpisu) i błędem, po którym element jest pomijany
+"""
+
+
+def _numbered_pages(response: dict) -> int | None:
+    """
+    Zwraca liczbę stron, jeśli API stronicuje numerami (per_page i total) - wtedy kolejne strony
+    można pobierać jednocześnie. Przy paginacji hashem next strony trzeba pobierać po kolei
+    """
+    pagination = _page_pagination(response) or {}
+    total, per_page = pagination.get("total"), pagination.get("per_page")
+
+    if "next" in pagination or not total or not per_page:
+        return None
+
+    return math.ceil(int(total) / int(per_page))
+
+
+def _count(response: dict) -> int | None:
+    """
+    Liczba elementów listy z paginacji albo None, jeśli API jej nie zwróciło - długość pierwszej strony
+    byłaby zaniżona do rozmiaru strony
+    """
+    total = (_page_pagination(response) or {}).get("total")
+    return int(total) if total is not None else None
+
+
+def _profile_parts(short: bool, follow_counts: bool) -> dict[str, tuple[str, Callable[[dict], Any]]]:
+    """
+    Części rekordu profilu: (metoda klienta przyjmująca nazwę użytkownika, funkcja wyciągająca wartość z odpowiedzi)
+    """
+    data = lambda response: response["data"]
+    parts = {
+        "profile": ("profiles_get_profile_short" if short else "profiles_get_profile", data),
+        "badges": ("profiles_get_profile_badges", data),
+        "tags": ("profiles_get_profile_tags", data),
+    }
+    if follow_counts:
+        parts["followers"] = ("profiles_get_profile_users_followers", _count)
+        parts["following"] = ("profiles_get_profile_users_following", _count)
+
+    return parts
+
+
+def _needs_expanding(comment: Any) -> bool:
+    """
+    Czy lista komentarzy podrzędnych zwrócona razem z komentarzem jest niepełna
+    """
+    replies = item_field(comment, "comments")
+    if not replies:
+        return False
+
+    count = item_field(replies, "count") or 0
+    return count > len(item_field(replies, "items") or [])
+
+
+def _embedded_comments(item: Any) -> list | None:
+    """
+    Zwraca komentarze zwrócone razem z elementem, jeśli są kompletne
+    """
+    replies = item_field(item, "comments")
+    if not replies or _needs_expanding(item):
+        return None
+
+    return list(item_field(replies, "items") or [])
+
+
+class _ProfileRecords:
+    """
+    Składa rekordy profili z części pobieranych jednocześnie. Każda nazwa użytkownika jest pobierana raz,
+    a gotowe rekordy trafiają do cache, z którego obsługiwane są kolejne wystąpienia nazwy
+    """
+    def __init__(self, usernames: Iterable[str], parts: dict, cache: dict | None, on_error: BulkErrorHandler | None):
+        self.usernames = usernames
+        self.parts = parts
+        self.cache = {} if cache is None else cache
+        self.on_error = on_error
+        self.index: dict[str, int] = {}
+        self.pending: dict[str, dict] = {}
+        self.failed: set[str] = set()
+
+    def calls(self, task: Callable[[str, str], Any], cached: list) -> Iterator[Callable]:
+        """
+        Zwraca zadania (nazwa, część) dla nowych nazw użytkowników. Nazwy obecne w cache trafiają do cached
+        """
+        for username in self.usernames:
+            if username in self.index:
+                continue
+            self.index[username] = len(self.index)
+
+            if username in self.cache:
+                cached.append((self.index[username], self.cache[username]))
+                continue
+
+            self.pending[username] = {}
+            for part in self.parts:
+                yield functools.partial(task, username, part)
+
+    def add(self, username: str, part: str, result: Any) -> tuple[int, dict] | None:
+        """
+        Dodaje część rekordu (albo błąd) i zwraca (indeks, rekord), gdy rekord jest kompletny
+        """
+        if username in self.failed:
+            return None
+
+        if isinstance(result, WykopApiError):
+            self.failed.add(username)
+            del self.pending[username]
+            if self.on_error is None:
+                raise result
+            self.on_error(username, result)
+            return None
+
+        values = self.pending[username]
+        values[part] = self.parts[part][1](result)
+        if len(values) < len(self.parts):
+            return None
+
+        del self.pending[username]
+        record = {"username": username, **{part: values[part] for part in self.parts}}
+        self.cache[username] = record
+        return self.index[username], record
+
+
+class _BulkFetcher:
+    """
+    Operacje wykonujące wiele zapytań jednocześnie na rzecz jednego wywołania klienta
+    """
+    def __init__(self, api):
+        self.api = api
+
+    def all_pages(self, fetch_page: Callable[[str | int | None], dict], concurrency: int) -> list:
+        """
+        Zwraca elementy ze wszystkich stron, w kolejności stron. Przy concurrency=1 strony są pobierane po kolei
+        """
+        first = fetch_page(None)
+        items = list(_page_items(first))
+        pages = _numbered_pages(first)
+
+        if pages is not None and concurrency > 1:
+            fetch = lambda page: (page, list(_page_items(fetch_page(page))))
+            results = dict(as_completed((functools.partial(fetch, page) for page in range(2, pages + 1)), concurrency))
+            for page in range(2, pages + 1):
+                items += results[page]
+
+            return items
+
+        page, response = None, first
+        while (page := next_page(_page_pagination(response), page)) is not None:
+            response = fetch_page(page)
+            page_items = list(_page_items(response))
+            if not page_items:
+                break
+            items += page_items
+
+        return items
+
+    def link_comment_tree(
+        self,
+        link_id: str,
+        sort,
+        concurrency: int,
+        on_error: BulkErrorHandler | None
+    ) -> Iterator[tuple[int, Any]]:
+        comments = self.all_pages(
+            lambda page: self.api.link_comments_list_comments(link_id, sort=sort, page=page),
+            concurrency
+        )
+
+        def expand(index: int, comment: Any) -> tuple[int, Any]:
+            if _needs_expanding(comment):
+                comment_id = item_field(comment, "id")
+                try:
+                    comment = self.api.link_comments_get_comment(link_id, comment_id)["data"]
+                except WykopApiError as e:
+                    if on_error is None:
+                        raise
+                    # komentarz zostaje w drzewie z odpowiedziami zwróconymi przy liście
+                    on_error(comment_id, e)
+            return index, comment
+
+        return as_completed(
+            (functools.partial(expand, index, comment) for index, comment in enumerate(comments)),
+            concurrency
+        )
+
+    def entries_with_comments(
+        self,
+        entry_ids: Iterable[str],
+        concurrency: int,
+        on_error: BulkErrorHandler | None
+    ) -> Iterator[tuple[int, tuple[Any, list]]]:
+        def hydrate(index: int, entry_id: str) -> tuple[int, tuple[Any, list] | None]:
+            try:
+                entry = self.api.entries_get_entry(entry_id)["data"]
+                comments = _embedded_comments(entry)
+                if comments is None:
+                    # strony komentarzy jednego wpisu są pobierane po kolei, równolegle przetwarzane są wpisy
+                    comments = self.all_pages(
+                        lambda page: self.api.entry_comments_list_comments(entry_id, page=page), concurrency=1
+                    )
+            except WykopApiError as e:
+                if on_error is None:
+                    raise
+                on_error(entry_id, e)
+                return index, None
+
+            return index, (entry, comments)
+
+        for index, result in as_completed(
+            (functools.partial(hydrate, index, entry_id) for index, entry_id in enumerate(entry_ids)),
+            concurrency
+        ):
+            if result is not None:
+                yield index, result
+
+    def profiles(
+        self,
+        usernames: Iterable[str],
+        short: bool,
+        follow_counts: bool,
+        concurrency: int,
+        cache: dict | None,
+        on_error: BulkErrorHandler | None
+    ) -> Iterator[tuple[int, dict]]:
+        records = _ProfileRecords(usernames, _profile_parts(short, follow_counts), cache, on_error)
+
+        def fetch(username: str, part: str) -> tuple[str, str, Any]:
+            if username in records.failed:
+                return username, part, None
+            try:
+                return username, part, getattr(self.api, records.parts[part][0])(username)
+            except WykopApiError as e:
+                return username, part, e
+
+        cached = []
+        for username, part, result in as_completed(records.calls(fetch, cached), concurrency):
+            yield from cached
+            cached.clear()
+            if (record := records.add(username, part, result)) is not None:
+                yield record
+
+        yield from cached
+
+
+class _AsyncBulkFetcher:
+    """
+    Wersja _BulkFetcher dla AsyncWykopApiClient
+    """
+    def __init__(self, api):
+        self.api = api
+
+    async def all_pages(self, fetch_page: Callable[[str | int | None], Any], concurrency: int) -> list:
+        first = await fetch_page(None)
+        items = list(_page_items(first))
+        pages = _numbered_pages(first)
+
+        if pages is not None and concurrency > 1:
+            async def fetch(page: int) -> tuple[int, list]:
+                return page, list(_page_items(await fetch_page(page)))
+
+            results = {
+                page: page_items
+                async for page, page_items in async_as_completed(
+                    (functools.partial(fetch, page) for page in range(2, pages + 1)), concurrency
+                )
+            }
+            for page in range(2, pages + 1):
+                items += results[page]
+
+            return items
+
+        page, response = None, first
+        while (page := next_page(_page_pagination(response), page)) is not None:
+            response = await fetch_page(page)
+            page_items = list(_page_items(response))
+            if not page_items:
+                break
+            items += page_items
+
+        return items
+
+    async def link_comment_tree(
+        self,
+        link_id: str,
+        sort,
+        concurrency: int,
+        on_error: BulkErrorHandler | None
+    ) -> AsyncIterator[tuple[int, Any]]:
+        comments = await self.all_pages(
+            lambda page: self.api.link_comments_list_comments(link_id, sort=sort, page=page),
+            concurrency
+        )
+
+        async def expand(index: int, comment: Any) -> tuple[int, Any]:
+            if _needs_expanding(comment):
+                comment_id = item_field(comment, "id")
+                try:
+                    comment = (await self.api.link_comments_get_comment(link_id, comment_id))["data"]
+                except WykopApiError as e:
+                    if on_error is None:
+                        raise
+                    on_error(comment_id, e)
+            return index, comment
+
+        async for result in async_as_completed(
+            (functools.partial(expand, index, comment) for index, comment in enumerate(comments)),
+            concurrency
+        ):
+            yield result
+
+    async def entries_with_comments(
+        self,
+        entry_ids: Iterable[str],
+        concurrency: int,
+        on_error: BulkErrorHandler | None
+    ) -> AsyncIterator[tuple[int, tuple[Any, list]]]:
+        async def hydrate(index: int, entry_id: str) -> tuple[int, tuple[Any, list] | None]:
+            try:
+                entry = (await self.api.entries_get_entry(entry_id))["data"]
+                comments = _embedded_comments(entry)
+                if comments is None:
+                    comments = await self.all_pages(
+                        lambda page: self.api.entry_comments_list_comments(entry_id, page=page), concurrency=1
+                    )
+            except WykopApiError as e:
+                if on_error is None:
+                    raise
+                on_error(entry_id, e)
+                return index, None
+
+            return index, (entry, comments)
+
+        async for index, result in async_as_completed(
+            (functools.partial(hydrate, index, entry_id) for index, entry_id in enumerate(entry_ids)),
+            concurrency
+        ):
+            if result is not None:
+                yield index, result
+
+    async def profiles(
+        self,
+        usernames: Iterable[str],
+        short: bool,
+        follow_counts: bool,
+        concurrency: int,
+        cache: dict | None,
+        on_error: BulkErrorHandler | None
+    ) -> AsyncIterator[tuple[int, dict]]:
+        records = _ProfileRecords(usernames, _profile_parts(short, follow_counts), cache, on_error)
+
+        async def fetch(username: str, part: str) -> tuple[str, str, Any]:
+            if username in records.failed:
+                return username, part, None
+            try:
+                return username, part, await getattr(self.api, records.parts[part][0])(username)
+            except WykopApiError as e:
+                return username, part, e
+
+        cached = []
+        async for username, part, result in async_as_completed(records.calls(fetch, cached), concurrency):
+            for record in cached:
+                yield record
+            cached.clear()
+            if (record := records.add(username, part, result)) is not None:
+                yield record
+
+        for record in cached:
+            yield record
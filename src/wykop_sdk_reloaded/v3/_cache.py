@@ -0,0 +1,114 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import NamedTuple
+from urllib.parse import urlencode
+
+from ._urls import endpoint_path
+
+
+def cache_key(url: str, params: dict | None, token: str | None) -> str:
+    """
+    Klucz odpowiedzi w cache. Zawiera skrót tokenu, więc odpowiedzi pobrane
+    z różnymi tokenami (aplikacji, różnych użytkowników) nigdy się nie mieszają.
+    """
+    scope = hashlib.sha256(token.encode()).hexdigest()[:32] if token else "anonymous"
+    query = urlencode(sorted((params or {}).items()))
+
+    return f"{scope}:{url}?{query}"
+
+
+class CacheEntry(NamedTuple):
+    """
+    Zapisana odpowiedź. Wygasła odpowiedź (fresh=False) jest zwracana tylko wtedy, gdy ma walidatory
+    (ETag albo Last-Modified) i może zostać odświeżona zapytaniem warunkowym
+    """
+    body: bytes
+    etag: str | None = None
+    last_modified: str | None = None
+    fresh: bool = True
+
+    def validators(self) -> dict:
+        """
+        Nagłówki zapytania warunkowego (If-None-Match, If-Modified-Since)
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class _ResponseCacheBase:
+    def __init__(self, ttl: float, max_entries: int, ttls: dict[str, float] | None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.ttls = ttls or {}
+
+    def ttl_for(self, url: str) -> float:
+        path = endpoint_path(url)
+
+        for pattern, ttl in self.ttls.items():
+            if fnmatchcase(path, pattern.strip("/")):
+                return ttl
+
+        return self.ttl
+
+
+class ResponseCache(_ResponseCacheBase):
+    """
+    Pamięć podręczna odpowiedzi zapytań GET przechowywana w pamięci procesu (TTL + LRU).
+
+    params ttl: domyślny czas życia odpowiedzi w sekundach
+    params max_entries: maksymalna liczba przechowywanych odpowiedzi, najdawniej używane są usuwane
+    params ttls: czasy życia dla konkretnych endpointów w postaci {wzorzec ścieżki: ttl},
+        gdzie wzorzec to ścieżka względem /api/v3 z gwiazdkami, np. {"tags/*/related": 3600, "notifications/*": 0}.
+        Wygrywa pierwszy pasujący wzorzec, ttl równy 0 wyłącza cache dla endpointu
+    """
+    def __init__(self, ttl: float = 60, max_entries: int = 1024, ttls: dict[str, float] | None = None):
+        super().__init__(ttl, max_entries, ttls)
+
+        self._entries: OrderedDict[str, tuple[float, CacheEntry]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CacheEntry | None:
+        """
+        Zwraca zapisaną odpowiedź albo None, jeśli jej nie ma lub wygasła i nie da się jej odświeżyć
+        """
+        with self._lock:
+            stored = self._entries.get(key)
+            if stored is None:
+                return None
+
+            expires_at, entry = stored
+            if expires_at <= time.monotonic():
+                if not (entry.etag or entry.last_modified):
+                    del self._entries[key]
+                    return None
+
+                entry = entry._replace(fresh=False)
+
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, url: str, body: bytes, etag: str | None = None, last_modified: str | None = None):
+        ttl = self.ttl_for(url)
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, CacheEntry(body, etag, last_modified))
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,99 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable
+
+from ..exceptions import WykopApiDeadlineExceededError
+
+
+def _shared(error: BaseException | None) -> bool:
+    """
+    Czy błąd lidera dotyczy wspólnego zapytania i trafia do oczekujących. Przekroczony deadline() lidera
+    i przerwanie jego wykonania (anulowanie zadania, KeyboardInterrupt) nie dotyczą pozostałych,
+    więc po nich oczekujący ponawiają zapytanie sami
+    """
+    return isinstance(error, Exception) and not isinstance(error, WykopApiDeadlineExceededError)
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Łączy jednoczesne identyczne wywołania w jedno. Pierwszy wątek wykonuje zapytanie,
+    a pozostałe, które w tym czasie poproszą o ten sam klucz, czekają i dostają ten sam wynik (albo błąd).
+    Jeśli lider przekroczy swój deadline() albo zostanie przerwany, jeden z oczekujących wykonuje zapytanie ponownie.
+    """
+    def __init__(self):
+        self._flights: dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, func: Callable[[], Any]) -> Any:
+        while True:
+            with self._lock:
+                flight = self._flights.get(key)
+                leader = flight is None
+
+                if leader:
+                    flight = self._flights[key] = _Flight()
+
+            if leader:
+                break
+
+            flight.done.wait()
+
+            if flight.error is None:
+                return flight.result
+            if _shared(flight.error):
+                raise flight.error
+
+        try:
+            flight.result = func()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+
+class AsyncSingleFlight:
+    """
+    Wersja SingleFlight dla asyncio
+    """
+    def __init__(self):
+        self._flights: dict[str, asyncio.Future] = {}
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        while (flight := self._flights.get(key)) is not None:
+            # asyncio.wait nie przekazuje anulowania lidera do oczekujących ani anulowania oczekującego do lidera
+            await asyncio.wait([flight])
+
+            if flight.cancelled():
+                continue
+            if flight.exception() is None:
+                return flight.result()
+            if _shared(flight.exception()):
+                raise flight.exception()
+
+        flight = self._flights[key] = asyncio.get_running_loop().create_future()
+
+        try:
+            result = await func()
+            flight.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except BaseException as e:
+            flight.set_exception(e)
+            # oznacza błąd jako odebrany, nawet jeśli nikt inny nie czekał na wynik
+            flight.exception()
+            raise
+        finally:
+            del self._flights[key]
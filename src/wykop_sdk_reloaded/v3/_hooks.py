@@ -0,0 +1,81 @@
+from dataclasses import dataclass, field
+from typing import Callable
+
+
+@dataclass
+class RequestEvent:
+    """
+    Informacje o pojedynczej próbie wykonania zapytania, przekazywane do hooków RequestHooks.
+
+    params template: szablon endpointu, np. "/entries/{id}/comments"
+    params attempt: numer próby, 0 dla pierwszej, kolejne to ponowienia (także po odświeżeniu tokenu)
+    params cache: "hit" gdy odpowiedź pochodzi z cache, "revalidated" gdy API potwierdziło jej aktualność (304),
+        "miss" gdy nie było jej w cache, None gdy cache nie dotyczy zapytania
+    params started: time.monotonic() w chwili rozpoczęcia próby
+    params timings: czasy w sekundach, takie same dla ApiSession i AsyncApiSession - "total" zawsze,
+        "ttfb" (od wysłania zapytania do otrzymania nagłówków odpowiedzi) gdy zapytanie trafiło do sieci,
+        "queued" (oczekiwanie na RateLimiter sesji, nie wliczane do "total") gdy sesja ma limiter,
+        "connect" (połączenie TCP, z rozwiązaniem nazwy) i "tls" gdy zostało zestawione nowe połączenie
+    """
+    method: str
+    url: str
+    template: str
+    attempt: int = 0
+    status_code: int | None = None
+    request_bytes: int | None = None
+    response_bytes: int | None = None
+    cache: str | None = None
+    started: float = 0.0
+    timings: dict[str, float] = field(default_factory=dict)
+    error: Exception | None = None
+
+
+RequestHook = Callable[[RequestEvent], None]
+
+
+class RequestHooks:
+    """
+    Hooki wywoływane przy każdej próbie wykonania zapytania przez sesję.
+
+    Każda próba wywołuje hooki request, a następnie dokładnie jeden z hooków response albo error.
+    Hooki są wywoływane synchronicznie, także w kliencie asyncio, więc powinny być szybkie.
+
+    Przykład:
+        session = ApiSession()
+
+        @session.hooks.on_response
+        def log_latency(event):
+            print(event.template, event.status_code, event.timings["total"])
+    """
+    def __init__(self):
+        self.request: list[RequestHook] = []
+        self.response: list[RequestHook] = []
+        self.error: list[RequestHook] = []
+
+    def __bool__(self) -> bool:
+        return bool(self.request or self.response or self.error)
+
+    def on_request(self, hook: RequestHook) -> RequestHook:
+        """
+        Rejestruje hook wywoływany przed wysłaniem zapytania
+        """
+        self.request.append(hook)
+        return hook
+
+    def on_response(self, hook: RequestHook) -> RequestHook:
+        """
+        Rejestruje hook wywoływany po otrzymaniu poprawnej odpowiedzi
+        """
+        self.response.append(hook)
+        return hook
+
+    def on_error(self, hook: RequestHook) -> RequestHook:
+        """
+        Rejestruje hook wywoływany gdy próba zakończyła się błędem (także takim, który zostanie ponowiony)
+        """
+        self.error.append(hook)
+        return hook
+
+    def emit(self, hooks: list[RequestHook], event: RequestEvent):
+        for hook in hooks:
+            hook(event)
@@ -0,0 +1,31 @@
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+JsonLoads = Callable[[bytes], Any]
+"""
+Funkcja dekodująca surową treść odpowiedzi (bytes) do obiektów Pythona.
+Przy błędnym JSONie powinna rzucać ValueError (lub wyjątek po nim dziedziczący)
+"""
+
+
+def default_json_loads() -> JsonLoads:
+    """
+    Zwraca najszybszy dostępny dekoder: orjson, ujson albo json z biblioteki standardowej
+    """
+    if orjson is not None:
+        return orjson.loads
+    if ujson is not None:
+        return ujson.loads
+
+    return json.loads
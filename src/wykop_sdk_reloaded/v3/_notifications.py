@@ -0,0 +1,201 @@
+import asyncio
+import threading
+from typing import Any, Callable
+
+from ._watch import (
+    AdaptiveInterval,
+    WatchErrorHandler,
+    _ASYNC_TRANSIENT_ERRORS,
+    _TRANSIENT_ERRORS,
+    _SeenItems,
+)
+
+
+# rodzaj powiadomień: (licznik w odpowiedzi notifinations_status, metoda klienta pobierająca listę)
+_NOTIFICATION_KINDS = {
+    "entries": ("entry_notification", "notifinations_list_entries"),
+    "pms": ("pm_notification", "notifinations_list_pms"),
+}
+
+NotificationCallback = Callable[[list], None]
+
+
+class _NotificationWatcherBase:
+    def __init__(
+        self,
+        api,
+        min_interval: float = 5.0,
+        max_interval: float = 60.0,
+        skip_existing: bool = False,
+        on_error: WatchErrorHandler | None = None
+    ):
+        """
+        params api: klient zalogowanego użytkownika (WykopApiClient albo AsyncWykopApiClient)
+        params min_interval: najkrótszy odstęp pomiędzy odpytaniami w sekundach
+        params max_interval: najdłuższy odstęp pomiędzy odpytaniami w sekundach
+        params skip_existing: czy pominąć powiadomienia nieprzeczytane w chwili pierwszego odpytania
+        params on_error: funkcja wywoływana z błędem API albo połączenia, po którym run() odczeka i spróbuje ponownie
+        """
+        self.api = api
+        self.interval = AdaptiveInterval(min_interval, max_interval)
+        self.skip_existing = skip_existing
+        self.on_error = on_error
+
+        self.callbacks: dict[str, list[NotificationCallback]] = {kind: [] for kind in _NOTIFICATION_KINDS}
+        self.counters: dict[str, Any] = {}
+        self._seen = {kind: _SeenItems() for kind in _NOTIFICATION_KINDS}
+        self._first = True
+        self._stopped = None
+
+    def on_entries(self, callback: NotificationCallback) -> NotificationCallback:
+        """
+        Rejestruje funkcję wywoływaną z listą nowych powiadomień o wpisach i komentarzach
+        """
+        self.callbacks["entries"].append(callback)
+        return callback
+
+    def on_pms(self, callback: NotificationCallback) -> NotificationCallback:
+        """
+        Rejestruje funkcję wywoływaną z listą nowych powiadomień o prywatnych wiadomościach
+        """
+        self.callbacks["pms"].append(callback)
+        return callback
+
+    def _changed_kinds(self, response: dict | None) -> list[tuple[str, Any]]:
+        """
+        Zwraca rodzaje powiadomień (z nową wartością licznika), których listy trzeba pobrać: mające zarejestrowane
+        funkcje, z niezerowym licznikiem, który zmienił się od poprzedniego odpytania
+        """
+        status = (response or {}).get("data") or {}
+
+        kinds = []
+        for kind, (counter, _) in _NOTIFICATION_KINDS.items():
+            if not self.callbacks[kind]:
+                continue
+
+            # przy nieznanym formacie odpowiedzi lista jest pobierana przy każdej zmianie statusu
+            value = status.get(counter, status)
+            if value and value != self.counters.get(kind):
+                kinds.append((kind, value))
+            else:
+                self.counters[kind] = value
+
+        return kinds
+
+    def _new_items(self, kind: str, value: Any, response: dict | None) -> list:
+        # licznik jest zapamiętywany dopiero po pobraniu listy, żeby nieudane pobranie zostało powtórzone
+        self.counters[kind] = value
+
+        items = list((response or {}).get("data") or [])
+        fresh, _ = self._seen[kind].scan(items, set())
+        self._seen[kind].remember(fresh)
+        return fresh
+
+    def _dispatch(self, kind: str, items: list) -> int:
+        if self._first and self.skip_existing or not items:
+            return 0
+
+        for callback in self.callbacks[kind]:
+            callback(items)
+
+        return len(items)
+
+
+class NotificationWatcher(_NotificationWatcherBase):
+    """
+    Obserwuje powiadomienia zalogowanego użytkownika, odpytując tylko lekki endpoint notifinations_status.
+    Listy powiadomień (notifinations_list_entries, notifinations_list_pms) są pobierane tylko gdy zmieni się
+    odpowiadający im licznik, a do zarejestrowanych funkcji trafiają tylko powiadomienia, których jeszcze nie przekazano.
+
+    Przykład:
+        watcher = NotificationWatcher(api)
+
+        @watcher.on_pms
+        def reply(notifications):
+            ...
+
+        watcher.run()
+    """
+    def poll(self) -> int:
+        """
+        Jednorazowo sprawdza status powiadomień i przekazuje nowe powiadomienia do zarejestrowanych funkcji.
+        Zwraca liczbę przekazanych powiadomień
+        """
+        new = 0
+        for kind, value in self._changed_kinds(self.api.notifinations_status()):
+            _, method = _NOTIFICATION_KINDS[kind]
+            new += self._dispatch(kind, self._new_items(kind, value, getattr(self.api, method)()))
+
+        self._first = False
+        return new
+
+    def run(self):
+        """
+        Odpytuje status powiadomień do czasu wywołania stop(). Odstęp pomiędzy odpytaniami skraca się,
+        gdy pojawiają się nowe powiadomienia, i wydłuża, gdy ich nie ma
+        """
+        self._stopped = threading.Event()
+
+        while not self._stopped.is_set():
+            try:
+                new = self.poll()
+            except _TRANSIENT_ERRORS as e:
+                if self.on_error is not None:
+                    self.on_error(e)
+                new = 0
+
+            self._stopped.wait(self.interval.update(new))
+
+    def stop(self):
+        """
+        Kończy run() (także wywołane w innym wątku) przed kolejnym odpytaniem
+        """
+        if self._stopped is not None:
+            self._stopped.set()
+
+
+class AsyncNotificationWatcher(_NotificationWatcherBase):
+    """
+    Wersja NotificationWatcher dla AsyncWykopApiClient. Funkcje zarejestrowane przez on_entries/on_pms
+    są wywoływane synchronicznie, więc powinny być szybkie (np. przekazywać powiadomienia do kolejki)
+    """
+    async def poll(self) -> int:
+        """
+        Jednorazowo sprawdza status powiadomień i przekazuje nowe powiadomienia do zarejestrowanych funkcji.
+        Zwraca liczbę przekazanych powiadomień
+        """
+        kinds = self._changed_kinds(await self.api.notifinations_status())
+        responses = await asyncio.gather(*(getattr(self.api, _NOTIFICATION_KINDS[kind][1])() for kind, _ in kinds))
+
+        new = 0
+        for (kind, value), response in zip(kinds, responses):
+            new += self._dispatch(kind, self._new_items(kind, value, response))
+
+        self._first = False
+        return new
+
+    async def run(self):
+        """
+        Odpytuje status powiadomień do czasu wywołania stop() albo anulowania zadania
+        """
+        self._stopped = asyncio.Event()
+
+        while not self._stopped.is_set():
+            try:
+                new = await self.poll()
+            except _ASYNC_TRANSIENT_ERRORS as e:
+                if self.on_error is not None:
+                    self.on_error(e)
+                new = 0
+
+            try:
+                await asyncio.wait_for(self._stopped.wait(), self.interval.update(new))
+            except asyncio.TimeoutError:
+                pass
+
+    def stop(self):
+        """
+        Kończy run() przed kolejnym odpytaniem
+        """
+        if self._stopped is not None:
+            self._stopped.set()
@@ -0,0 +1,148 @@
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator
+
+from ._stream import AsyncStreamedPage, StreamedPage, stream_pages
+
+
+def next_page(pagination: dict | None, page: str | int | None) -> str | int | None:
+    """
+    Wyznacza parametr page kolejnej strony na podstawie pola pagination odpowiedzi API.
+
+    Dla zalogowanych użytkowników API zwraca hash next, dla niezalogowanych
+    (oraz np. wykopaliska) numer strony trzeba zwiększać samemu.
+    Zwraca None gdy nie ma już kolejnej strony.
+    """
+    pagination = pagination or {}
+
+    if "next" in pagination:
+        next_hash = pagination["next"]
+        return next_hash if next_hash and next_hash != page else None
+
+    current = int(page or 1)
+    total = pagination.get("total")
+    per_page = pagination.get("per_page")
+
+    if total is not None and per_page and current * int(per_page) >= int(total):
+        return None
+
+    return current + 1
+
+
+def _page_items(response: Any) -> Any:
+    if isinstance(response, StreamedPage):
+        return response
+
+    return (response or {}).get("data") or []
+
+
+def _page_pagination(response: Any) -> dict | None:
+    if isinstance(response, StreamedPage):
+        return response.meta.get("pagination")
+
+    return response.get("pagination")
+
+
+async def _async_page_items(response: Any) -> AsyncIterator[Any]:
+    if isinstance(response, AsyncStreamedPage):
+        async for item in response:
+            yield item
+    else:
+        for item in _page_items(response):
+            yield item
+
+
+def paginate(
+    fetch_page: Callable[[str | int | None], dict],
+    max_items: int | None = None,
+    max_pages: int | None = None,
+    stream: bool = False
+) -> Iterator[dict]:
+    """
+    Zwraca kolejne elementy `data` ze wszystkich stron, pobierając strony dopiero gdy są potrzebne.
+
+    params fetch_page: funkcja pobierająca stronę dla zadanego parametru page (None oznacza pierwszą stronę)
+    params max_items: maksymalna liczba zwróconych elementów
+    params max_pages: maksymalna liczba pobranych stron
+    params stream: czy zwracać elementy w trakcie pobierania strony zamiast czekać na całą odpowiedź
+    """
+    page = None
+    pages = 0
+    items = 0
+
+    while max_pages is None or pages < max_pages:
+        if max_items is not None and items >= max_items:
+            return
+
+        token = stream_pages.set(stream)
+        try:
+            response = fetch_page(page)
+        finally:
+            stream_pages.reset(token)
+
+        pages += 1
+        page_items = 0
+
+        try:
+            for item in _page_items(response):
+                if max_items is not None and items >= max_items:
+                    return
+
+                items += 1
+                page_items += 1
+                yield item
+        finally:
+            if isinstance(response, StreamedPage):
+                response.close()
+
+        if not page_items:
+            return
+
+        page = next_page(_page_pagination(response), page)
+        if page is None:
+            return
+
+
+async def async_paginate(
+    fetch_page: Callable[[str | int | None], Awaitable[dict]],
+    max_items: int | None = None,
+    max_pages: int | None = None,
+    stream: bool = False
+) -> AsyncIterator[dict]:
+    """
+    Wersja paginate dla asyncio
+    """
+    page = None
+    pages = 0
+    items = 0
+
+    while max_pages is None or pages < max_pages:
+        if max_items is not None and items >= max_items:
+            return
+
+        token = stream_pages.set(stream)
+        try:
+            response = await fetch_page(page)
+        finally:
+            stream_pages.reset(token)
+
+        pages += 1
+        page_items = 0
+
+        try:
+            async for item in _async_page_items(response):
+                if max_items is not None and items >= max_items:
+                    return
+
+                items += 1
+                page_items += 1
+                yield item
+        finally:
+            if isinstance(response, AsyncStreamedPage):
+                await response.aclose()
+
+        if not page_items:
+            return
+
+        page = next_page(_page_pagination(response), page)
+        if page is None:
+            return
+
@@ -0,0 +1,123 @@
+import asyncio
+import threading
+import time
+
+from ._timeout import remaining
+from ._urls import endpoint_path
+from ..exceptions import WykopApiDeadlineExceededError
+
+
+def endpoint_group(url: str) -> str:
+    """
+    Zwraca grupę endpointu - pierwszy segment ścieżki za /api/v3, np. "entries" dla /api/v3/entries/1/comments
+    """
+    return endpoint_path(url).split("/", 1)[0]
+
+
+class TokenBucket:
+    """
+    Kubełek z tokenami uzupełniany w tempie rate tokenów na sekundę, mieszczący maksymalnie capacity tokenów.
+
+    Pobranie tokenu jest rezerwacją - stan kubełka może zejść poniżej zera, a zwracany jest czas
+    jaki trzeba odczekać. Dzięki temu sekcja krytyczna jest krótka i ten sam kubełek
+    może być bezpiecznie współdzielony przez wątki i korutyny.
+    """
+    def __init__(self, rate: float, capacity: float | None = None):
+        if rate <= 0:
+            raise ValueError("rate musi być większy od zera")
+
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Rezerwuje jeden token i zwraca liczbę sekund, którą należy odczekać przed wysłaniem zapytania
+        """
+        with self.lock:
+            now = time.monotonic()
+
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+
+            return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+    def release(self):
+        """
+        Oddaje zarezerwowany token, z którego ostatecznie nie skorzystano
+        """
+        with self.lock:
+            self.tokens = min(self.capacity, self.tokens + 1)
+
+
+class RateLimiter:
+    """
+    Kliencki limiter zapytań, który pilnuje by nie przekroczyć limitów Wykop API (WykopApiLimitExceededError).
+
+    params rate: globalna liczba zapytań na sekundę
+    params burst: ile zapytań można wykonać od razu, zanim limiter zacznie wyrównywać tempo (domyślnie rate)
+    params groups: osobne budżety dla grup endpointów w postaci {grupa: (rate, burst)},
+        gdzie grupa to pierwszy segment ścieżki, np. {"entries": (2, 5), "profile": (1, None)}
+    """
+    def __init__(
+        self,
+        rate: float,
+        burst: int | None = None,
+        groups: dict[str, tuple[float, int | None]] | None = None
+    ):
+        self.bucket = TokenBucket(rate, burst)
+        self.group_buckets = {
+            group: TokenBucket(group_rate, group_burst)
+            for group, (group_rate, group_burst) in (groups or {}).items()
+        }
+
+    def reserve(self, url: str) -> float:
+        delay = self.bucket.reserve()
+
+        group_bucket = self.group_buckets.get(endpoint_group(url))
+        if group_bucket:
+            delay = max(delay, group_bucket.reserve())
+
+        return delay
+
+    def release(self, url: str):
+        self.bucket.release()
+
+        group_bucket = self.group_buckets.get(endpoint_group(url))
+        if group_bucket:
+            group_bucket.release()
+
+    def _reserve_within_deadline(self, url: str) -> float:
+        delay = self.reserve(url)
+
+        # oczekiwanie, po którym i tak zostałby przekroczony deadline(), kończy się od razu błędem
+        left = remaining()
+        if delay and left is not None and left <= delay:
+            self.release(url)
+            raise WykopApiDeadlineExceededError("Limit zapytań nie pozwala wykonać zapytania przed upływem deadline()")
+
+        return delay
+
+    def acquire(self, url: str) -> float:
+        """
+        Blokuje wątek do momentu, w którym zapytanie na dany url mieści się w limicie, i zwraca czas oczekiwania.
+        Rzuca WykopApiDeadlineExceededError, jeśli to nie nastąpi przed upływem bieżącego deadline()
+        """
+        delay = self._reserve_within_deadline(url)
+        if delay:
+            time.sleep(delay)
+
+        return delay
+
+    async def acquire_async(self, url: str) -> float:
+        """
+        Wersja acquire dla asyncio, nie blokuje pętli zdarzeń
+        """
+        delay = self._reserve_within_deadline(url)
+        if delay:
+            await asyncio.sleep(delay)
+
+        return delay
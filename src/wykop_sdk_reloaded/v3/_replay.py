@@ -0,0 +1,198 @@
+import gzip
+import json
+import threading
+from urllib.parse import parse_qsl, urlparse
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from ._urls import endpoint_path, match_template
+from ..exceptions import ReplayError
+
+
+# nagłówki, od których zależy zachowanie SDK (cache, ponawianie); reszta nie jest zapisywana
+_RECORDED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Retry-After")
+
+# nagłówki nieaktualne po zdekodowaniu treści odpowiedzi
+_DECODED_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+
+class Cassette:
+    """
+    Plik z nagranymi parami zapytanie/odpowiedź, pozwalający wykonywać kod korzystający z SDK bez dostępu do sieci.
+
+    Każda odpowiedź jest zapisywana w osobnej linii JSON (plik .gz jest kompresowany). Nagłówki zapytań
+    (w tym token) i wysyłane dane nie są zapisywane, ale treść odpowiedzi /auth zawiera token - nie publikuj nagrań.
+
+    Przy odtwarzaniu zapytania są dopasowywane po metodzie, szablonie endpointu i parametrach (także tych w ścieżce).
+    Kolejne identyczne zapytania dostają kolejne nagrane odpowiedzi, a po ich wyczerpaniu ostatnią z nich.
+
+    params path: ścieżka do pliku, np. "nagranie.jsonl.gz"
+    params mode: "record" - nagrywa odpowiedzi prawdziwego API, "replay" - odtwarza je bez łączenia się z siecią
+    params match: "exact" - dopasowanie po metodzie, szablonie i parametrach, "template" - wystarczy metoda i szablon,
+        np. dowolny wpis zostanie odtworzony dla każdego entries_get_entry (przydatne w testach obciążeniowych)
+    """
+    def __init__(self, path: str, mode: str = "replay", match: str = "exact"):
+        if mode not in ("record", "replay"):
+            raise ValueError("mode musi mieć wartość 'record' albo 'replay'")
+        if match not in ("exact", "template"):
+            raise ValueError("match musi mieć wartość 'exact' albo 'template'")
+
+        self.path = path
+        self.mode = mode
+        self.match = match
+        self._lock = threading.Lock()
+        self._file = None
+        self._interactions: dict[tuple, list[dict]] = {}
+        self._played: dict[tuple, int] = {}
+
+        if mode == "replay":
+            with self._open("rt") as file:
+                for line in file:
+                    if line.strip():
+                        interaction = json.loads(line)
+                        self._interactions.setdefault(self._key(interaction), []).append(interaction)
+
+    def _open(self, mode: str):
+        if self.path.endswith(".gz"):
+            return gzip.open(self.path, mode, encoding="utf-8")
+
+        return open(self.path, mode, encoding="utf-8")
+
+    def _key(self, interaction: dict) -> tuple:
+        if self.match == "template":
+            return interaction["method"], interaction["template"]
+
+        return interaction["method"], interaction["path"], tuple(map(tuple, interaction["params"]))
+
+    @staticmethod
+    def _describe(method: str, url: str) -> dict:
+        return {
+            "method": method.upper(),
+            "template": match_template(url),
+            "path": f"/{endpoint_path(url)}",
+            "params": sorted(parse_qsl(urlparse(url).query, keep_blank_values=True)),
+        }
+
+    def record(self, method: str, url: str, status: int, headers, body: bytes):
+        """
+        Zapisuje odpowiedź na zapytanie
+        """
+        interaction = self._describe(method, url)
+        interaction["status"] = status
+        interaction["headers"] = {name: headers[name] for name in _RECORDED_HEADERS if name in headers}
+
+        try:
+            interaction["body"] = body.decode("utf-8")
+        except UnicodeDecodeError:
+            interaction["body"] = body.decode("latin-1")
+            interaction["encoding"] = "latin-1"
+
+        line = json.dumps(interaction, ensure_ascii=False, separators=(",", ":"))
+
+        with self._lock:
+            if self._file is None:
+                self._file = self._open("at")
+
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def play(self, method: str, url: str) -> tuple[int, dict, bytes]:
+        """
+        Zwraca nagraną odpowiedź (status, nagłówki, treść) na zapytanie
+        """
+        key = self._key(self._describe(method, url))
+
+        with self._lock:
+            interactions = self._interactions.get(key)
+            if not interactions:
+                raise ReplayError(f"Brak nagranej odpowiedzi dla {method.upper()} {url}")
+
+            index = self._played.get(key, 0)
+            self._played[key] = index + 1
+
+        interaction = interactions[min(index, len(interactions) - 1)]
+        body = interaction["body"].encode(interaction.get("encoding", "utf-8"))
+        return interaction["status"], interaction["headers"], body
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class RecordReplayAdapter(BaseAdapter):
+    """
+    Adapter requests, który nagrywa odpowiedzi przekazywane przez adapter (domyślnie HTTPAdapter)
+    albo odtwarza je z nagrania bez łączenia się z siecią
+    """
+    def __init__(self, cassette: Cassette, adapter: BaseAdapter | None = None):
+        super().__init__()
+        self.cassette = cassette
+        self.adapter = adapter or HTTPAdapter()
+
+    def send(self, request: requests.PreparedRequest, stream: bool = False, **kwargs) -> requests.Response:
+        if self.cassette.mode == "record":
+            response = self.adapter.send(request, stream=stream, **kwargs)
+            self.cassette.record(request.method, request.url, response.status_code, response.headers, response.content)
+            return response
+
+        status, headers, body = self.cassette.play(request.method, request.url)
+
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(headers)
+        response.headers["Content-Length"] = str(len(body))
+        response._content = body
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
+
+    def close(self):
+        self.adapter.close()
+
+
+if httpx is not None:
+    class AsyncRecordReplayTransport(httpx.AsyncBaseTransport):
+        """
+        Transport httpx, który nagrywa odpowiedzi przekazywane przez transport (domyślnie AsyncHTTPTransport)
+        albo odtwarza je z nagrania bez łączenia się z siecią
+        """
+        def __init__(self, cassette: Cassette, transport: "httpx.AsyncBaseTransport | None" = None):
+            self.cassette = cassette
+            self.transport = transport or httpx.AsyncHTTPTransport()
+
+        async def handle_async_request(self, request: "httpx.Request") -> "httpx.Response":
+            if self.cassette.mode == "record":
+                response = await self.transport.handle_async_request(request)
+                body = await response.aread()
+                await response.aclose()
+
+                # aread() zwraca treść już zdekodowaną (np. z gzip), więc nagłówki opisujące kodowanie są nieaktualne
+                headers = [
+                    (name, value) for name, value in response.headers.multi_items()
+                    if name.lower() not in _DECODED_HEADERS
+                ]
+                self.cassette.record(request.method, str(request.url), response.status_code, response.headers, body)
+                return httpx.Response(response.status_code, headers=headers, content=body)
+
+            status, headers, body = self.cassette.play(request.method, str(request.url))
+            return httpx.Response(status, headers=headers, content=body)
+
+        async def aclose(self):
+            await self.transport.aclose()
@@ -1,39 +1,213 @@
+import asyncio
+import itertools
+import json
+import time
+
 import requests
 
-from ..exceptions import WykopApiError, WykopApiAuthorizationError, WykopApiNotFoundError, WykopApiLimitExceededError, WykopApiBlockedError
+from ._session import ApiSession, get_default_session
+from ._async_session import AsyncApiSession
+from ._cache import CacheEntry, cache_key
+from ._json import JsonLoads
+from ._stream import STREAM_CHUNK_SIZE, AsyncStreamedPage, StreamedPage
+from ._timeout import remaining
+from ._hooks import RequestEvent
+from ._urls import endpoint_template
+from .models import item_converter, to_models
+from ..exceptions import (
+    WykopApiError,
+    WykopApiAuthorizationError,
+    WykopApiNotFoundError,
+    WykopApiLimitExceededError,
+    WykopApiBlockedError,
+    WykopApiDeadlineExceededError
+)
+
+
+def _error_message(response: requests.Response, json_loads: JsonLoads):
+    try:
+        return json_loads(response.content)["error"]
+    except (ValueError, KeyError, TypeError):
+        # np. strona błędu 502 z proxy zamiast odpowiedzi JSON
+        return response.text
 
 
-def handle_errors(response: requests.Response):
+def handle_errors(response: requests.Response, json_loads: JsonLoads = json.loads):
+    if response.status_code < 300:
+        return
+
     match response.status_code:
         case 404:
-            raise WykopApiNotFoundError(response.json()["error"])
+            error = WykopApiNotFoundError(_error_message(response, json_loads))
         case 400:
-            raise WykopApiLimitExceededError(response.json()["error"])
+            error = WykopApiLimitExceededError(_error_message(response, json_loads))
         case 401:
-            raise WykopApiBlockedError(response.json()["error"])
+            error = WykopApiBlockedError(_error_message(response, json_loads))
         case 403:
-            raise WykopApiAuthorizationError(response.json()["error"])
-        
-    if response.status_code >= 300:
-        raise WykopApiError(response.json()["error"])
+            error = WykopApiAuthorizationError(_error_message(response, json_loads))
+        case _:
+            error = WykopApiError(_error_message(response, json_loads))
+
+    error.response = response
+    raise error
+
+
+def _content_length(headers) -> int | None:
+    value = headers.get("Content-Length")
+    return int(value) if value is not None else None
 
 
 class ApiRequester:
-    def __init__(self, url: str, token: str | None):
+    def __init__(
+        self,
+        url: str,
+        token: str | None,
+        session: ApiSession | None = None,
+        auth=None,
+        models: bool = False,
+        stream: bool = False
+    ):
+        """
+        params auth: AuthClient, z którego pobierany jest aktualny token. Jeśli zostanie podany,
+            to po odrzuceniu tokenu przez API (WykopApiAuthorizationError) token jest odświeżany
+            i zapytanie wykonywane ponownie
+        params models: czy zamieniać pole data odpowiedzi na modele z wykop_sdk_reloaded.v3.models
+        params stream: czy zapytania GET mają zwracać StreamedPage, parsowaną przyrostowo w trakcie pobierania.
+            Takie zapytania pomijają cache i łączenie identycznych zapytań, a ponawiane są tylko
+            do momentu otrzymania nagłówków odpowiedzi
+        """
         self.url = url
+        self.session = session or get_default_session()
+        self.auth = auth
+        self.models = models
+        self.stream = stream
+        self._set_token(token)
+
+    def _set_token(self, token: str | None):
+        self.token = token
         self.header = {
             "Authorization": f"Bearer {token}"
         } if token else {}
 
+    def _can_refresh_token(self, error: Exception, refreshed: bool) -> bool:
+        return (
+            isinstance(error, WykopApiAuthorizationError)
+            and not refreshed
+            and self.auth is not None
+            and self.auth.auto_refresh_token
+        )
+
+    def _check_deadline(self, error: Exception, delay: float | None):
+        # nie ma sensu czekać na kolejną próbę, która i tak nie zmieści się w deadline()
+        left = remaining()
+        if left is not None and left <= (delay or 0.0):
+            raise WykopApiDeadlineExceededError("Przekroczono czas przeznaczony na wywołanie") from error
+
+    def _start_event(self, method: str, attempt: int, key: str | None, cached: CacheEntry | None) -> RequestEvent | None:
+        hooks = self.session.hooks
+        if not hooks:
+            return None
+
+        if key is None:
+            cache = None
+        else:
+            cache = "hit" if cached is not None and cached.fresh else "miss"
+
+        event = RequestEvent(
+            method=method,
+            url=self.url,
+            template=endpoint_template(self.url),
+            attempt=attempt,
+            cache=cache,
+            started=time.monotonic()
+        )
+        hooks.emit(hooks.request, event)
+        return event
+
+    def _finish_event(
+        self,
+        event: RequestEvent | None,
+        response=None,
+        error: Exception | None = None,
+        body: bytes | None = None,
+        streamed: bool = False
+    ):
+        if event is None:
+            return
+
+        # czas oczekiwania na kliencki limiter zapytań nie jest czasem odpowiedzi endpointu
+        event.timings["total"] = time.monotonic() - event.started - event.timings.get("queued", 0.0)
+        event.error = error
+
+        if response is None and error is not None:
+            response = getattr(error, "response", None)
+
+        if response is not None:
+            event.status_code = response.status_code
+            event.request_bytes = _content_length(response.request.headers)
+            # treść strumieniowanej odpowiedzi nie jest jeszcze pobrana
+            event.response_bytes = _content_length(response.headers) if streamed else len(response.content)
+
+            if response.status_code == 304 and event.cache == "miss":
+                event.cache = "revalidated"
+        elif body is not None:
+            event.response_bytes = len(body)
+
+        hooks = self.session.hooks
+        hooks.emit(hooks.error if error is not None else hooks.response, event)
+
+    def _streams(self, method: str) -> bool:
+        return self.stream and method == "GET"
+
+    def _cache_key(self, method: str, params: dict | None) -> str | None:
+        if method != "GET" or self.session.cache is None or self.stream:
+            return None
+
+        return cache_key(self.url, params, self.token)
+
+    def _handle_response(self, response: requests.Response, key: str | None, cached: CacheEntry | None) -> dict | None:
+        if cached is not None and response.status_code == 304:
+            # odpowiedź się nie zmieniła, wystarczy przedłużyć ważność zapisanej treści
+            self.session.cache.set(
+                key,
+                self.url,
+                cached.body,
+                etag=response.headers.get("ETag") or cached.etag,
+                last_modified=response.headers.get("Last-Modified") or cached.last_modified
+            )
+            return self.session.json_loads(cached.body)
+
+        handle_errors(response, self.session.json_loads)
+
+        body = response.content
+
+        if key is not None:
+            self.session.cache.set(
+                key,
+                self.url,
+                body,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified")
+            )
+
+        return self.session.json_loads(body) if body else None
+
+    def _converter(self):
+        return item_converter(self.url) if self.models else None
+
+    def _stream_page(self, response: requests.Response) -> StreamedPage:
+        # treść odpowiedzi z błędem jest pobierana w całości przez handle_errors
+        handle_errors(response, self.session.json_loads)
+
+        return StreamedPage(
+            response.iter_content(STREAM_CHUNK_SIZE), response.close, self._converter(), self.session.json_loads
+        )
+
     def get(self, params: dict | None = None) -> dict:
         if params:
             params = {k: v for k, v in params.items() if v} 
         
-        response = requests.get(self.url, params, headers=self.header)
-
-        handle_errors(response)
-        
-        return response.json()
+        return self._send("GET", params=params)
     
     def post(self, data: dict | None = None, params: dict | None = None, files: dict | None = None) -> dict | None:
         if data:
@@ -43,31 +217,174 @@ class ApiRequester:
         if files:
             files = {k: v for k, v in files.items() if v}
         
-        response = requests.post(
-            self.url,
+        return self._send(
+            "POST",
             params=params,
             json={"data": data} if data else None,
-            files=files if files else None,
-            headers=self.header
+            files=files if files else None
         )
 
-        handle_errors(response)
-        
-        return response.json() if response.text else None
+    def put(self, data: dict | None = None) -> dict | None:
+        return self._send("PUT", json={"data": data} if data else None)
     
+    def delete(self):
+        return self._send("DELETE")
 
-    def put(self, data: dict | None = None) -> dict | None:
-        response = requests.put(
-            self.url,
-            json={"data": data} if data else None,
-            headers=self.header
+    def _flight_key(self, method: str, params: dict | None) -> str | None:
+        if method != "GET" or self.session.coalescing is None or self.stream:
+            return None
+
+        token = self.auth.get_jwt_token() if self.auth is not None else self.token
+        return cache_key(self.url, params, token)
+
+    def _send(self, method: str, **kwargs) -> dict | None:
+        key = self._flight_key(method, kwargs.get("params"))
+        if key is not None:
+            response = self.session.coalescing.do(key, lambda: self._perform(method, **kwargs))
+        else:
+            response = self._perform(method, **kwargs)
+
+        return to_models(self.url, response) if self.models else response
+
+    def _perform(self, method: str, **kwargs) -> dict | None:
+        started = time.monotonic()
+        attempt = 0
+        refreshed = False
+
+        for tries in itertools.count():
+            if self.auth is not None:
+                self.auth.refresh_token_if_expiring()
+                self._set_token(self.auth.get_jwt_token())
+
+            key = self._cache_key(method, kwargs.get("params"))
+            cached = self.session.cache.get(key) if key is not None else None
+            event = self._start_event(method, tries, key, cached)
+
+            if cached is not None and cached.fresh:
+                self._finish_event(event, body=cached.body)
+                return self.session.json_loads(cached.body)
+
+            headers = {**self.header, **cached.validators()} if cached is not None else self.header
+
+            try:
+                response = self.session.request(
+                    method,
+                    self.url,
+                    headers=headers,
+                    stream=self._streams(method),
+                    timings=event.timings if event is not None else None,
+                    **kwargs
+                )
+
+                if self._streams(method):
+                    result = self._stream_page(response)
+                else:
+                    result = self._handle_response(response, key, cached)
+            except Exception as e:
+                self._finish_event(event, error=e)
+                if isinstance(e, WykopApiDeadlineExceededError):
+                    raise
+
+                if self._can_refresh_token(e, refreshed) and self.auth.refresh_expired_token(self.token):
+                    refreshed = True
+                    continue
+
+                delay = self.session.retry.next_delay(method, e, attempt, time.monotonic() - started)
+                self._check_deadline(e, delay)
+                if delay is None:
+                    raise
+
+                attempt += 1
+                time.sleep(delay)
+            else:
+                self._finish_event(event, response, streamed=self._streams(method))
+                return result
+
+
+class AsyncApiRequester(ApiRequester):
+    """
+    Wersja ApiRequester dla asyncio. Metody get/post/put/delete zwracają korutyny.
+    """
+    def __init__(
+        self,
+        url: str,
+        token: str | None,
+        session: AsyncApiSession,
+        auth=None,
+        models: bool = False,
+        stream: bool = False
+    ):
+        super().__init__(url=url, token=token, session=session, auth=auth, models=models, stream=stream)
+
+    async def _async_stream_page(self, response) -> AsyncStreamedPage:
+        if response.status_code >= 300:
+            await response.aread()
+            await response.aclose()
+            handle_errors(response, self.session.json_loads)
+
+        return AsyncStreamedPage(
+            response.aiter_bytes(STREAM_CHUNK_SIZE), response.aclose, self._converter(), self.session.json_loads
         )
 
-        handle_errors(response)
-        
-        return response.json() if response.text else None
-    
-    def delete(self):
-        response = requests.delete(self.url, headers=self.header)
+    async def _send(self, method: str, **kwargs) -> dict | None:
+        key = self._flight_key(method, kwargs.get("params"))
+        if key is not None:
+            response = await self.session.coalescing.do(key, lambda: self._perform(method, **kwargs))
+        else:
+            response = await self._perform(method, **kwargs)
+
+        return to_models(self.url, response) if self.models else response
+
+    async def _perform(self, method: str, **kwargs) -> dict | None:
+        started = time.monotonic()
+        attempt = 0
+        refreshed = False
+
+        for tries in itertools.count():
+            if self.auth is not None:
+                await self.auth.refresh_token_if_expiring()
+                self._set_token(self.auth.get_jwt_token())
+
+            key = self._cache_key(method, kwargs.get("params"))
+            cached = self.session.cache.get(key) if key is not None else None
+            event = self._start_event(method, tries, key, cached)
+
+            if cached is not None and cached.fresh:
+                self._finish_event(event, body=cached.body)
+                return self.session.json_loads(cached.body)
+
+            headers = {**self.header, **cached.validators()} if cached is not None else self.header
+
+            try:
+                response = await self.session.request(
+                    method,
+                    self.url,
+                    headers=headers,
+                    stream=self._streams(method),
+                    timings=event.timings if event is not None else None,
+                    **kwargs
+                )
+
+                if self._streams(method):
+                    result = await self._async_stream_page(response)
+                else:
+                    result = self._handle_response(response, key, cached)
+            except Exception as e:
+                self._finish_event(event, error=e)
+                if isinstance(e, WykopApiDeadlineExceededError):
+                    raise
+
+                if self._can_refresh_token(e, refreshed) and await self.auth.refresh_expired_token(self.token):
+                    refreshed = True
+                    continue
+
+                delay = self.session.retry.next_delay(method, e, attempt, time.monotonic() - started)
+                self._check_deadline(e, delay)
+                if delay is None:
+                    raise
 
-        handle_errors(response)
+                attempt += 1
+                await asyncio.sleep(delay)
+            else:
+                self._finish_event(event, response, streamed=self._streams(method))
+                return result
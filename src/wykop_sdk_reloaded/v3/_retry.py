@@ -0,0 +1,114 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from ..exceptions import WykopApiError, WykopApiLimitExceededError
+
+
+IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "DELETE"})
+
+_TRANSPORT_ERRORS = (requests.ConnectionError, requests.Timeout) + ((httpx.TransportError,) if httpx else ())
+
+
+def _retry_after(error: Exception) -> float | None:
+    response = getattr(error, "response", None)
+    value = response.headers.get("Retry-After") if response is not None else None
+
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """
+    Polityka ponawiania zapytań z wykładniczym odstępem (exponential backoff) i losowym rozrzutem (jitter).
+
+    Ponawiane są błędy połączenia, odpowiedzi 5xx/429 oraz przekroczony limit zapytań (WykopApiLimitExceededError).
+    Jeśli API zwróci nagłówek Retry-After, to jest on respektowany, a gdy przekracza max_backoff, zapytanie nie jest ponawiane.
+
+    params max_retries: maksymalna liczba ponowień pojedynczego zapytania
+    params backoff: bazowy odstęp w sekundach, podwajany przy każdej kolejnej próbie
+    params max_backoff: maksymalny odstęp pomiędzy próbami, także wynikający z Retry-After
+    params jitter: czy losować odstęp z przedziału [0, backoff] (full jitter)
+    params deadline: łączny czas w sekundach, po którym nie będą podejmowane kolejne próby
+    params methods: metody HTTP, które mogą być ponawiane. Domyślnie tylko idempotentne (GET, PUT, DELETE),
+        ponawianie POST (np. dodawanie wpisów, głosowanie) trzeba włączyć świadomie, bo może zdublować akcję
+    params statuses: kody HTTP, które są ponawiane
+    params retry_on_limit: czy ponawiać WykopApiLimitExceededError
+    """
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        deadline: float | None = None,
+        methods: frozenset[str] = IDEMPOTENT_METHODS,
+        statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504}),
+        retry_on_limit: bool = True
+    ):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.deadline = deadline
+        self.methods = frozenset(m.upper() for m in methods)
+        self.statuses = statuses
+        self.retry_on_limit = retry_on_limit
+
+    def is_retryable(self, method: str, error: Exception) -> bool:
+        if method.upper() not in self.methods:
+            return False
+
+        if isinstance(error, _TRANSPORT_ERRORS):
+            return True
+
+        if isinstance(error, WykopApiLimitExceededError):
+            return self.retry_on_limit
+
+        if isinstance(error, WykopApiError):
+            return error.status_code in self.statuses
+
+        return False
+
+    def next_delay(self, method: str, error: Exception, attempt: int, elapsed: float) -> float | None:
+        """
+        Zwraca liczbę sekund do kolejnej próby albo None, jeśli zapytanie nie powinno być ponowione
+
+        params attempt: liczba dotychczas wykonanych ponowień
+        params elapsed: czas w sekundach od pierwszej próby
+        """
+        if attempt >= self.max_retries or not self.is_retryable(method, error):
+            return None
+
+        delay = min(self.max_backoff, self.backoff * 2 ** attempt)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+
+        retry_after = _retry_after(error)
+        if retry_after is not None:
+            # na dłuższe oczekiwanie niż max_backoff lepiej zgłosić błąd niż blokować wątek
+            if retry_after > self.max_backoff:
+                return None
+            delay = max(delay, retry_after)
+
+        if self.deadline is not None and elapsed + delay > self.deadline:
+            return None
+
+        return delay
@@ -0,0 +1,189 @@
+import contextvars
+import threading
+import time
+from http.cookiejar import DefaultCookiePolicy
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from ._rate_limit import RateLimiter
+from ._retry import RetryPolicy
+from ._timeout import Timeouts, request_timeout
+from ._hooks import RequestHooks
+from ._cache import ResponseCache
+from ._json import JsonLoads, default_json_loads
+from ._coalesce import SingleFlight
+from ._replay import Cassette, RecordReplayAdapter
+
+
+# słownik timings zapytania wykonywanego w bieżącym wątku, uzupełniany przez połączenia urllib3
+_current_timings: contextvars.ContextVar[dict | None] = contextvars.ContextVar("timings", default=None)
+
+
+class _TimedConnectionMixin:
+    """
+    Zapisuje czasy nawiązania połączenia TCP (connect), negocjacji TLS (tls)
+    i oczekiwania na nagłówki odpowiedzi po wysłaniu zapytania (ttfb)
+    """
+    def _new_conn(self):
+        started = time.monotonic()
+        sock = super()._new_conn()
+        if (timings := _current_timings.get()) is not None:
+            timings["connect"] = time.monotonic() - started
+        return sock
+
+    def connect(self):
+        started = time.monotonic()
+        super().connect()
+        if (timings := _current_timings.get()) is not None and isinstance(self, HTTPSConnection):
+            timings["tls"] = time.monotonic() - started - timings.get("connect", 0.0)
+
+    def getresponse(self, *args, **kwargs):
+        started = time.monotonic()
+        response = super().getresponse(*args, **kwargs)
+        if (timings := _current_timings.get()) is not None:
+            timings["ttfb"] = time.monotonic() - started
+        return response
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter, którego połączenia zapisują czasy etapów zapytania do ApiSession.request(timings=...)
+    """
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+class ApiSession:
+    """
+    Współdzielona, bezpieczna wątkowo pula połączeń HTTP do Wykop API.
+
+    Jedna instancja powinna być współdzielona przez AuthClient i WykopApiClient,
+    dzięki czemu kolejne żądania korzystają z otwartych już połączeń (keep-alive)
+    zamiast za każdym razem zestawiać nowe połączenie TCP+TLS.
+
+    params pool_connections: liczba pul połączeń (osobna pula na każdy host)
+    params pool_maxsize: maksymalna liczba otwartych połączeń w puli jednego hosta
+    params pool_block: czy przy wyczerpanej puli czekać na wolne połączenie zamiast otwierać nowe
+    params keep_alive: czy utrzymywać połączenia otwarte pomiędzy żądaniami
+    params rate_limiter: limiter zapytań współdzielony przez wszystkich korzystających z sesji
+    params retry: polityka ponawiania nieudanych zapytań, domyślnie RetryPolicy(). RetryPolicy(max_retries=0) wyłącza ponawianie
+    params cache: pamięć podręczna odpowiedzi zapytań GET, domyślnie wyłączona
+    params coalesce: czy łączyć jednoczesne identyczne zapytania GET (ten sam adres, parametry i token) w jedno.
+        Wszyscy oczekujący dostają ten sam obiekt odpowiedzi, więc nie należy go modyfikować
+    params json_loads: funkcja dekodująca treść odpowiedzi z bytes, np. orjson.loads.
+        Domyślnie orjson lub ujson jeśli są zainstalowane, w przeciwnym razie json.loads
+    params timeout: limity czasu nawiązania połączenia i odczytu, domyślnie Timeouts() - 5s na połączenie i 30s na odczyt
+    params hooks: hooki wywoływane przy każdym zapytaniu, np. do zbierania metryk. Można je też rejestrować
+        później przez session.hooks.on_request/on_response/on_error
+    params cassette: nagranie, do którego są zapisywane odpowiedzi API (Cassette(path, mode="record"))
+        albo z którego są odtwarzane bez łączenia się z siecią (Cassette(path))
+    """
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        rate_limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+        cache: ResponseCache | None = None,
+        coalesce: bool = False,
+        json_loads: JsonLoads | None = None,
+        timeout: Timeouts | None = None,
+        hooks: RequestHooks | None = None,
+        cassette: Cassette | None = None
+    ):
+        self.rate_limiter = rate_limiter
+        self.retry = retry or RetryPolicy()
+        self.cache = cache
+        self.json_loads = json_loads or default_json_loads()
+        self.timeout = timeout or Timeouts()
+        self.hooks = hooks if hooks is not None else RequestHooks()
+        self.coalescing = SingleFlight() if coalesce else None
+
+        self.http = requests.Session()
+        # ciasteczka nie są potrzebne do komunikacji z API, a współdzielony słoik
+        # mógłby przenosić stan pomiędzy tokenami różnych użytkowników
+        self.http.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+        if not keep_alive:
+            self.http.headers["Connection"] = "close"
+
+        adapter = _TimedHTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        if cassette is not None:
+            adapter = RecordReplayAdapter(cassette, adapter)
+
+        self.http.mount("https://", adapter)
+        self.http.mount("http://", adapter)
+
+    def request(self, method: str, url: str, timings: dict | None = None, **kwargs) -> requests.Response:
+        """
+        params timings: słownik, do którego zostaną zapisane czasy oczekiwania na limiter zapytań (queued),
+            nawiązania połączenia (connect, tls) i oczekiwania na nagłówki odpowiedzi po wysłaniu zapytania (ttfb)
+        """
+        if self.rate_limiter:
+            queued = self.rate_limiter.acquire(url)
+            if timings is not None:
+                timings["queued"] = queued
+
+        token = _current_timings.set(timings)
+        try:
+            return self.http.request(method, url, timeout=request_timeout(self.timeout, url), **kwargs)
+        finally:
+            _current_timings.reset(token)
+
+    def close(self):
+        """
+        Zamyka wszystkie otwarte połączenia z puli
+        """
+        self.http.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+_default_session: ApiSession | None = None
+_default_session_lock = threading.Lock()
+
+
+def get_default_session() -> ApiSession:
+    """
+    Zwraca sesję współdzieloną przez wszystkie ApiRequestery utworzone bez jawnie podanej sesji
+    """
+    global _default_session
+
+    with _default_session_lock:
+        if _default_session is None:
+            _default_session = ApiSession()
+
+        return _default_session
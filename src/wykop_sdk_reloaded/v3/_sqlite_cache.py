@@ -0,0 +1,244 @@
+import sqlite3
+import threading
+import time
+import weakref
+
+from ._cache import CacheEntry, _ResponseCacheBase
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+"""
+
+
+class _Connection(sqlite3.Connection):
+    # sqlite3.Connection nie obsługuje słabych referencji, a podklasa tak
+    pass
+
+
+class SqliteResponseCache(_ResponseCacheBase):
+    """
+    Pamięć podręczna odpowiedzi zapytań GET zapisywana w pliku SQLite.
+
+    Przetrwa restart procesu i może być współdzielona przez wiele procesów (tryb WAL),
+    np. przez kilka workerów pobierających te same tagi i profile.
+
+    params path: ścieżka do pliku bazy
+    params ttl: domyślny czas życia odpowiedzi w sekundach
+    params max_entries: maksymalna liczba przechowywanych odpowiedzi, najdawniej używane są usuwane
+    params max_size: maksymalny łączny rozmiar zapisanych odpowiedzi w bajtach (None - bez limitu)
+    params ttls: czasy życia dla konkretnych endpointów, tak samo jak w ResponseCache
+    params timeout: ile sekund czekać na blokadę bazy trzymaną przez inny proces
+
+    Każdy wątek korzysta z własnego połączenia z bazą. close() zamyka połączenie bieżącego wątku,
+    a close_all() (także przy wyjściu z bloku with) połączenia wszystkich wątków.
+    """
+    def __init__(
+        self,
+        path: str,
+        ttl: float = 60,
+        max_entries: int = 100_000,
+        max_size: int | None = None,
+        ttls: dict[str, float] | None = None,
+        timeout: float = 5.0
+    ):
+        super().__init__(ttl, max_entries, ttls)
+
+        self.path = path
+        self.max_size = max_size
+        self.timeout = timeout
+        self._local = threading.local()
+        # połączenia zakończonych wątków są zamykane razem z ich threading.local
+        self._connections: weakref.WeakSet[_Connection] = weakref.WeakSet()
+        self._connections_lock = threading.Lock()
+        # klucze odczytane przez get() od ostatniego zapisu: {klucz: czas użycia}
+        self._touched: dict[str, float] = {}
+        self._touched_lock = threading.Lock()
+
+        with self._connection() as connection:
+            connection.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        # połączenia sqlite nie mogą być współdzielone przez wątki, każdy wątek ma własne
+        connection = getattr(self._local, "connection", None)
+
+        if connection is None or connection not in self._connections:
+            # check_same_thread=False pozwala close_all() zamknąć połączenia innych wątków
+            connection = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False, factory=_Connection
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+
+            with self._connections_lock:
+                self._connections.add(connection)
+
+        return connection
+
+    def close(self):
+        """
+        Zamyka połączenie z bazą bieżącego wątku. Kolejne użycie cache w tym wątku otworzy nowe
+        """
+        connection = getattr(self._local, "connection", None)
+        self._local.connection = None
+
+        if connection is not None:
+            with self._connections_lock:
+                self._connections.discard(connection)
+            connection.close()
+
+    def close_all(self):
+        """
+        Zamyka połączenia z bazą wszystkich wątków. Należy ją wywołać, gdy żaden wątek nie korzysta już z cache
+        """
+        with self._connections_lock:
+            connections = list(self._connections)
+            self._connections.clear()
+
+        for connection in connections:
+            connection.close()
+
+        self._local.connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close_all()
+
+    def get(self, key: str) -> CacheEntry | None:
+        """
+        Zwraca zapisaną odpowiedź albo None, jeśli jej nie ma lub wygasła i nie da się jej odświeżyć.
+        Odczyt niczego nie zapisuje w bazie, a błąd bazy (np. zablokowanej przez inny proces) jest traktowany jak brak odpowiedzi
+        """
+        try:
+            row = self._connection().execute(
+                "SELECT body, etag, last_modified, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+
+        if row is None:
+            return None
+
+        body, etag, last_modified, expires_at = row
+        now = time.time()
+
+        # wygasłe wpisy bez walidatorów usuwa purge_expired() albo eviction w set()
+        if expires_at <= now and not (etag or last_modified):
+            return None
+
+        # czas użycia trafia do bazy dopiero przy najbliższym set(), żeby odczyty nie blokowały bazy do zapisu
+        with self._touched_lock:
+            self._touched[key] = now
+
+        return CacheEntry(body, etag, last_modified, fresh=expires_at > now)
+
+    def set(self, key: str, url: str, body: bytes, etag: str | None = None, last_modified: str | None = None):
+        """
+        Zapisuje odpowiedź. Gdy baza jest zablokowana dłużej niż timeout, zapis jest pomijany
+        """
+        ttl = self.ttl_for(url)
+        if ttl <= 0:
+            return
+
+        now = time.time()
+
+        with self._touched_lock:
+            touched, self._touched = self._touched, {}
+
+        try:
+            connection = self._connection()
+            connection.execute("BEGIN IMMEDIATE")
+        except sqlite3.Error:
+            self._retouch(touched)
+            return
+
+        try:
+            connection.executemany(
+                "UPDATE responses SET accessed_at = MAX(accessed_at, ?) WHERE key = ?",
+                [(accessed_at, touched_key) for touched_key, accessed_at in touched.items()]
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, body, etag, last_modified, now + ttl, now, len(body))
+            )
+            self._evict(connection)
+            connection.execute("COMMIT")
+        except BaseException as e:
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            if not isinstance(e, sqlite3.Error):
+                raise
+            self._retouch(touched)
+
+    def _retouch(self, touched: dict[str, float]):
+        # czasy użycia z nieudanego zapisu zostaną zapisane przy kolejnym set()
+        with self._touched_lock:
+            for key, accessed_at in touched.items():
+                self._touched[key] = max(accessed_at, self._touched.get(key, 0))
+
+    def _evict(self, connection: sqlite3.Connection):
+        count, size = connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+
+        if count > self.max_entries:
+            connection.execute(
+                "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY accessed_at LIMIT ?)",
+                (count - self.max_entries,)
+            )
+            size = connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+        if self.max_size is not None and size > self.max_size:
+            # usuwa najdawniej używane wpisy, dopóki suma rozmiarów pozostałych przekracza limit
+            connection.execute(
+                """
+                DELETE FROM responses WHERE key IN (
+                    SELECT key FROM (
+                        SELECT key, SUM(size) OVER (ORDER BY accessed_at DESC, key) AS kept
+                        FROM responses
+                    ) WHERE kept > ?
+                )
+                """,
+                (self.max_size,)
+            )
+
+    def purge_expired(self) -> int:
+        """
+        Usuwa wygasłe odpowiedzi (także te z walidatorami) i zwraca liczbę usuniętych wpisów
+        """
+        return self._connection().execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),)).rowcount
+
+    def delete(self, url_pattern: str = "%") -> int:
+        """
+        Usuwa odpowiedzi, których adres pasuje do wzorca SQL LIKE, np. "%/tags/wykop/%".
+        Zwraca liczbę usuniętych wpisów
+        """
+        return self._connection().execute("DELETE FROM responses WHERE url LIKE ?", (url_pattern,)).rowcount
+
+    def clear(self):
+        self.delete()
+
+    def stats(self) -> dict:
+        """
+        Zwraca podsumowanie zawartości: liczbę wpisów, łączny rozmiar w bajtach i liczbę wygasłych wpisów
+        """
+        entries, size, expired = self._connection().execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(expires_at <= ?), 0) FROM responses",
+            (time.time(),)
+        ).fetchone()
+
+        return {"entries": entries, "size": size, "expired": expired}
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
@@ -0,0 +1,276 @@
+import re
+from contextvars import ContextVar
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, Iterator
+
+from ._json import JsonLoads, default_json_loads
+
+
+STREAM_CHUNK_SIZE = 8192
+
+stream_pages: ContextVar[bool] = ContextVar("stream_pages", default=False)
+"""
+Ustawiany przez paginację na czas pobierania strony - ApiRequester tworzony przez klienta
+w tym czasie parsuje odpowiedź przyrostowo zamiast buforować ją w całości
+"""
+
+_WHITESPACE = b" \t\n\r"
+_MISSING = object()
+
+# znaki strukturalne JSON są ASCII, a bajty znaków wielobajtowych UTF-8 nigdy ich nie udają,
+# więc granice wartości można wyznaczać bezpośrednio na bajtach
+_STRUCTURAL = re.compile(rb'["\[\]{}]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+_SCALAR_END = re.compile(rb"[\s,\]}]")
+
+_START, _KEY, _COLON, _VALUE, _ITEM, _END = range(6)
+
+
+class ListPageParser:
+    """
+    Przyrostowy parser odpowiedzi w postaci {"data": [...], ...}.
+
+    Kolejne fragmenty treści przekazuje się do feed(), który zwraca elementy listy data
+    sparsowane w całości do tej pory. Pozostałe pola obiektu (np. pagination) trafiają do meta.
+    Jeśli data nie jest listą, trafia w całości do meta["data"].
+
+    Parser tylko wyznacza granice kolejnych wartości (śledząc zagnieżdżenie i napisy, bez wracania do początku
+    wartości przy każdym fragmencie), a kompletne wartości dekoduje funkcją json_loads, np. ApiSession.json_loads
+
+    params json_loads: funkcja dekodująca pojedynczą wartość JSON z bytes, domyślnie default_json_loads()
+    """
+    def __init__(self, json_loads: JsonLoads | None = None):
+        self._loads = json_loads or default_json_loads()
+        self._buffer = bytearray()
+        self._pos = 0
+        self._state = _START
+        self._key = None
+        # stan wyznaczania granicy wartości zaczynającej się na _pos, zachowywany pomiędzy fragmentami
+        self._scan_pos = None
+        self._depth = 0
+        self._in_string = False
+        self.meta = {}
+
+    def feed(self, chunk: bytes) -> list:
+        self._compact()
+        self._buffer += chunk
+        return self._parse(final=False)
+
+    def close(self) -> list:
+        self._compact()
+        items = self._parse(final=True)
+
+        if self._state not in (_START, _END) or self._buffer[self._pos:].strip(_WHITESPACE):
+            raise ValueError("Niekompletna odpowiedź JSON")
+
+        return items
+
+    def _compact(self):
+        if self._pos:
+            del self._buffer[:self._pos]
+            if self._scan_pos is not None:
+                self._scan_pos -= self._pos
+            self._pos = 0
+
+    def _value_end(self, final: bool) -> int | None:
+        """
+        Zwraca pozycję końca wartości zaczynającej się na _pos albo None, jeśli nie została jeszcze pobrana w całości
+        """
+        buffer = self._buffer
+
+        if buffer[self._pos] not in b'{["':
+            match = _SCALAR_END.search(buffer, self._pos)
+            if match is not None:
+                return match.start()
+            # liczba na końcu bufora mogła zostać ucięta w połowie
+            return len(buffer) if final else None
+
+        if self._scan_pos is None:
+            self._scan_pos, self._depth, self._in_string = self._pos, 0, False
+
+        pos = self._scan_pos
+        while True:
+            if self._in_string:
+                match = _STRING_SPECIAL.search(buffer, pos)
+                if match is None or match.group() == b"\\" and match.end() >= len(buffer):
+                    break
+                if match.group() == b"\\":
+                    pos = match.end() + 1
+                    continue
+
+                self._in_string = False
+                pos = match.end()
+                if self._depth == 0:
+                    return self._value_found(pos)
+            else:
+                match = _STRUCTURAL.search(buffer, pos)
+                if match is None:
+                    break
+
+                char = match.group()
+                pos = match.end()
+                if char == b'"':
+                    self._in_string = True
+                elif char in b"[{":
+                    self._depth += 1
+                else:
+                    self._depth -= 1
+                    if self._depth == 0:
+                        return self._value_found(pos)
+
+        if final:
+            raise ValueError("Niekompletna odpowiedź JSON")
+
+        # kolejny fragment będzie przeszukiwany od miejsca, w którym skończyło się to przeszukiwanie
+        self._scan_pos = match.start() if match is not None else len(buffer)
+        return None
+
+    def _value_found(self, end: int) -> int:
+        self._scan_pos = None
+        return end
+
+    def _decode(self, final: bool) -> Any:
+        end = self._value_end(final)
+        if end is None:
+            return _MISSING
+
+        value = self._loads(bytes(self._buffer[self._pos:end]))
+        self._pos = end
+        return value
+
+    def _parse(self, final: bool) -> list:
+        items = []
+        buffer = self._buffer
+
+        while True:
+            while self._pos < len(buffer) and buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+
+            if self._pos >= len(buffer) or self._state == _END:
+                return items
+
+            char = buffer[self._pos:self._pos + 1]
+
+            if self._state == _START:
+                if char != b"{":
+                    raise ValueError("Odpowiedź nie jest obiektem JSON")
+                self._pos += 1
+                self._state = _KEY
+            elif self._state == _KEY:
+                if char == b"}":
+                    self._pos += 1
+                    self._state = _END
+                elif char == b",":
+                    self._pos += 1
+                else:
+                    key = self._decode(final)
+                    if key is _MISSING:
+                        return items
+                    self._key = key
+                    self._state = _COLON
+            elif self._state == _COLON:
+                if char != b":":
+                    raise ValueError(f"Oczekiwano ':' na pozycji {self._pos}")
+                self._pos += 1
+                self._state = _VALUE
+            elif self._state == _VALUE:
+                if self._key == "data" and char == b"[":
+                    self._pos += 1
+                    self._state = _ITEM
+                else:
+                    value = self._decode(final)
+                    if value is _MISSING:
+                        return items
+                    self.meta[self._key] = value
+                    self._state = _KEY
+            elif self._state == _ITEM:
+                if char == b"]":
+                    self._pos += 1
+                    self._state = _KEY
+                elif char == b",":
+                    self._pos += 1
+                else:
+                    item = self._decode(final)
+                    if item is _MISSING:
+                        return items
+                    items.append(item)
+
+
+class StreamedPage:
+    """
+    Strona listy, której elementy data są zwracane w trakcie pobierania odpowiedzi.
+
+    Można ją przeiterować tylko raz. Pola poza data (np. pagination) są dostępne w meta
+    po przeiterowaniu całej strony.
+    """
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        close: Callable[[], None],
+        convert: Callable[[Any], Any] | None = None,
+        json_loads: JsonLoads | None = None
+    ):
+        self._chunks = chunks
+        self._close = close
+        self._convert = convert
+        self._parser = ListPageParser(json_loads)
+        self.closed = False
+
+    @property
+    def meta(self) -> dict:
+        return self._parser.meta
+
+    def _items(self, items: list) -> list:
+        return [self._convert(item) for item in items] if self._convert else items
+
+    def __iter__(self) -> Iterator[Any]:
+        try:
+            for chunk in self._chunks:
+                yield from self._items(self._parser.feed(chunk))
+
+            yield from self._items(self._parser.close())
+        finally:
+            self.close()
+
+    def close(self):
+        """
+        Zamyka połączenie, np. gdy nie wszystkie elementy strony są potrzebne
+        """
+        if not self.closed:
+            self.closed = True
+            self._close()
+
+
+class AsyncStreamedPage(StreamedPage):
+    """
+    Wersja StreamedPage dla asyncio - iterowana przez async for
+    """
+    def __init__(
+        self,
+        chunks: AsyncIterable[bytes],
+        close: Callable[[], Awaitable[None]],
+        convert: Callable[[Any], Any] | None = None,
+        json_loads: JsonLoads | None = None
+    ):
+        super().__init__(chunks, close, convert, json_loads)
+
+    def __iter__(self):
+        raise TypeError("AsyncStreamedPage należy iterować przez async for")
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        try:
+            async for chunk in self._chunks:
+                for item in self._items(self._parser.feed(chunk)):
+                    yield item
+
+            for item in self._items(self._parser.close()):
+                yield item
+        finally:
+            await self.aclose()
+
+    def close(self):
+        raise TypeError("AsyncStreamedPage należy zamknąć przez aclose()")
+
+    async def aclose(self):
+        if not self.closed:
+            self.closed = True
+            await self._close()
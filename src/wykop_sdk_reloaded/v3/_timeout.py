@@ -0,0 +1,92 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from fnmatch import fnmatchcase
+from typing import Iterator
+
+from ._urls import endpoint_path
+from ..exceptions import WykopApiDeadlineExceededError
+
+
+Timeout = float | tuple[float, float]
+"""
+Limit czasu w sekundach: jedna wartość dla nawiązania połączenia i odczytu albo krotka (connect, read)
+"""
+
+
+class Timeouts:
+    """
+    Limity czasu pojedynczego zapytania HTTP.
+
+    params connect: czas na nawiązanie połączenia
+    params read: maksymalny czas oczekiwania na kolejne dane z serwera
+    params endpoints: limity dla konkretnych endpointów w postaci {wzorzec ścieżki: timeout},
+        gdzie wzorzec to ścieżka względem /api/v3 z gwiazdkami, np. {"tags/*/stream": (3, 60)}.
+        Wygrywa pierwszy pasujący wzorzec
+    """
+    def __init__(self, connect: float = 5.0, read: float = 30.0, endpoints: dict[str, Timeout] | None = None):
+        self.connect = connect
+        self.read = read
+        self.endpoints = endpoints or {}
+
+    def for_url(self, url: str) -> tuple[float, float]:
+        path = endpoint_path(url)
+
+        for pattern, timeout in self.endpoints.items():
+            if fnmatchcase(path, pattern.strip("/")):
+                return timeout if isinstance(timeout, tuple) else (timeout, timeout)
+
+        return self.connect, self.read
+
+
+_deadline: ContextVar[float | None] = ContextVar("deadline", default=None)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """
+    Wyznacza łączny czas na wszystkie zapytania wykonane wewnątrz bloku with - razem z ponowieniami,
+    pobieraniem kolejnych stron i odświeżaniem tokenu. Po jego upływie rzucany jest WykopApiDeadlineExceededError.
+    Zagnieżdżony deadline nie może wydłużyć zewnętrznego.
+
+    Przykład:
+        with deadline(10):
+            entries = list(api.iter_entries_list_entries(max_pages=5))
+    """
+    at = time.monotonic() + seconds
+    current = _deadline.get()
+
+    token = _deadline.set(at if current is None else min(at, current))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> float | None:
+    """
+    Zwraca liczbę sekund pozostałych do upływu bieżącego deadline() albo None, gdy nie został wyznaczony
+    """
+    at = _deadline.get()
+    return None if at is None else at - time.monotonic()
+
+
+def check_deadline() -> float | None:
+    left = remaining()
+    if left is not None and left <= 0:
+        raise WykopApiDeadlineExceededError("Przekroczono czas przeznaczony na wywołanie")
+
+    return left
+
+
+def request_timeout(timeouts: Timeouts, url: str) -> tuple[float, float]:
+    """
+    Zwraca limity (connect, read) dla zapytania na dany url, skrócone tak, by nie przekroczyć bieżącego deadline()
+    """
+    connect, read = timeouts.for_url(url)
+
+    left = check_deadline()
+    if left is not None:
+        connect, read = min(connect, left), min(read, left)
+
+    return connect, read
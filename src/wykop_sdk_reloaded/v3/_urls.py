@@ -1,90 +1,178 @@
+import functools
+import re
+from string import Formatter
+from typing import Callable
+from urllib.parse import urlparse
+
 API_URL = "https://wykop.pl/api/v3"
+_API_PATH = urlparse(API_URL).path
+
+
+def endpoint_path(url: str) -> str:
+    """
+    Zwraca ścieżkę endpointu względem API_URL, np. "entries/1/comments"
+    """
+    path = urlparse(url).path
+
+    if path.startswith(_API_PATH):
+        path = path[len(_API_PATH):]
+
+    return path.strip("/")
+
+
+class Url(str):
+    """
+    Adres endpointu, który pamięta swój szablon, np. "/entries/{id}/comments" dla .../entries/1/comments
+    """
+    template: str
+
+    def __new__(cls, url: str, template: str):
+        instance = super().__new__(cls, url)
+        instance.template = template
+        return instance
+
+    def __reduce__(self):
+        return Url, (str(self), self.template)
+
+
+_TEMPLATES: list[str] = []
+
+
+def endpoint_template(url: str) -> str:
+    """
+    Zwraca szablon endpointu. Dla adresów spoza tego modułu (np. z raw_request) zwraca samą ścieżkę
+    """
+    template = getattr(url, "template", None)
+    return template if template is not None else f"/{endpoint_path(url)}"
+
+
+@functools.cache
+def _template_patterns() -> list[tuple[re.Pattern, str]]:
+    # szablony z mniejszą liczbą parametrów wygrywają, np. /links/draft/{key} przed /links/{id}/comments
+    templates = sorted(set(_TEMPLATES), key=lambda template: template.count("{"))
+    return [
+        (re.compile(re.sub(r"\\{\w+\\}", "[^/]+", re.escape(template))), template)
+        for template in templates
+    ]
+
+
+def match_template(url: str) -> str:
+    """
+    Odtwarza szablon endpointu na podstawie samego adresu, np. "/entries/{id}" dla .../entries/1.
+    Dla nieznanych adresów zwraca samą ścieżkę
+    """
+    template = getattr(url, "template", None)
+    if template is not None:
+        return template
+
+    path = f"/{endpoint_path(url)}"
+    for pattern, template in _template_patterns():
+        if pattern.fullmatch(path):
+            return template
+
+    return path
+
+
+def _url(template: str) -> Url:
+    _TEMPLATES.append(template)
+    return Url(f"{API_URL}{template}", template)
+
+
+def _endpoint(template: str) -> Callable[..., Url]:
+    _TEMPLATES.append(template)
+    names = [name for _, name, _, _ in Formatter().parse(template) if name]
+
+    def build(*args, **kwargs) -> Url:
+        return Url(f"{API_URL}{template.format(**dict(zip(names, args)), **kwargs)}", template)
+
+    return build
+
 
-AUTH_URL = f"{API_URL}/auth"
-CONNECT_URL = f"{API_URL}/connect"
-REFRESH_TOKEN_URL = f"{API_URL}/refresh-token"
+AUTH_URL = _url("/auth")
+CONNECT_URL = _url("/connect")
+REFRESH_TOKEN_URL = _url("/refresh-token")
 
 # links
-LINKS_URL = f"{API_URL}/links"
-LINKS_LINK_URL = lambda id: f"{API_URL}/links/{id}"
-LINKS_VOTES_URL = lambda id: f"{API_URL}/links/{id}/votes"
-LINKS_VOTE_UP_URL = lambda id: f"{API_URL}/links/{id}/votes/up"
-LINKS_VOTE_DOWN_URL = lambda id, reason: f"{API_URL}/links/{id}/votes/down/{reason}"
+LINKS_URL = _url("/links")
+LINKS_LINK_URL = _endpoint("/links/{id}")
+LINKS_VOTES_URL = _endpoint("/links/{id}/votes")
+LINKS_VOTE_UP_URL = _endpoint("/links/{id}/votes/up")
+LINKS_VOTE_DOWN_URL = _endpoint("/links/{id}/votes/down/{reason}")
 
 # link comments
-LINK_COMMENTS_URL = lambda id: f"{API_URL}/links/{id}/comments"
-LINK_COMMENTS_COMMENT_URL = lambda id, comment_id: f"{API_URL}/links/{id}/comments/{comment_id}"
-LINK_COMMENTS_COMMENT_VOTE_URL = lambda id, comment_id, type: f"{API_URL}/links/{id}/comments/{comment_id}/votes/{type}"
-LINK_COMMENTS_COMMENT_VOTE_REVOKE_URL = lambda id, comment_id: f"{API_URL}/links/{id}/comments/{comment_id}/votes"
+LINK_COMMENTS_URL = _endpoint("/links/{id}/comments")
+LINK_COMMENTS_COMMENT_URL = _endpoint("/links/{id}/comments/{comment_id}")
+LINK_COMMENTS_COMMENT_VOTE_URL = _endpoint("/links/{id}/comments/{comment_id}/votes/{type}")
+LINK_COMMENTS_COMMENT_VOTE_REVOKE_URL = _endpoint("/links/{id}/comments/{comment_id}/votes")
 
 # link drafs
-LINK_DRAFTS_URL = f"{API_URL}/links/draft"
-LINK_DRAFTS_DRAFT_URL = lambda key: f"{API_URL}/links/draft/{key}"
+LINK_DRAFTS_URL = _url("/links/draft")
+LINK_DRAFTS_DRAFT_URL = _endpoint("/links/draft/{key}")
 
 # tags
-TAGS_POPULAR_URL = f"{API_URL}/tags/popular"
-TAGS_POPULAR_USER_URL = f"{API_URL}/tags/popular-user-tags"
-TAGS_RELATED_TAG_URL = lambda tag: f"{API_URL}/tags/{tag}/related"
-TAGS_DETAIL_TAG_URL = lambda tag: f"{API_URL}/tags/{tag}"
-TAGS_STREAM_TAG_URL = lambda tag: f"{API_URL}/tags/{tag}/stream"
-TAGS_TAG_OWNERS_URL = lambda tag: f"{API_URL}/tags/{tag}/users"
+TAGS_POPULAR_URL = _url("/tags/popular")
+TAGS_POPULAR_USER_URL = _url("/tags/popular-user-tags")
+TAGS_RELATED_TAG_URL = _endpoint("/tags/{tag}/related")
+TAGS_DETAIL_TAG_URL = _endpoint("/tags/{tag}")
+TAGS_STREAM_TAG_URL = _endpoint("/tags/{tag}/stream")
+TAGS_TAG_OWNERS_URL = _endpoint("/tags/{tag}/users")
 
 # articles
-ARTICLES_URL = f"{API_URL}/articles"
-ARTICLES_ARTICLE_URL= lambda id: f"{API_URL}/articles/{id}"
+ARTICLES_URL = _url("/articles")
+ARTICLES_ARTICLE_URL = _endpoint("/articles/{id}")
 
 # entries
-ENTRIES_URL = f"{API_URL}/entries"
-ENTRIES_SEARCH_URL = f"{API_URL}/search/entries"
-ENTRIES_ENTRY_URL = lambda id: f"{API_URL}/entries/{id}"
-ENTRIES_ENTRY_VOTES_URL = lambda id: f"{API_URL}/entries/{id}/votes"
+ENTRIES_URL = _url("/entries")
+ENTRIES_SEARCH_URL = _url("/search/entries")
+ENTRIES_ENTRY_URL = _endpoint("/entries/{id}")
+ENTRIES_ENTRY_VOTES_URL = _endpoint("/entries/{id}/votes")
 
 # entry comments
-ENTRY_COMMENTS_URL = lambda id: f"{API_URL}/entries/{id}/comments"
-ENTRY_COMMENTS_COMMENT_URL = lambda entry_id, comment_id: f"{API_URL}/entries/{entry_id}/comments/{comment_id}"
-ENTRY_COMMENTS_VOTES_URL = lambda entry_id, comment_id: f"{API_URL}/entries/{entry_id}/comments/{comment_id}/votes"
+ENTRY_COMMENTS_URL = _endpoint("/entries/{id}/comments")
+ENTRY_COMMENTS_COMMENT_URL = _endpoint("/entries/{entry_id}/comments/{comment_id}")
+ENTRY_COMMENTS_VOTES_URL = _endpoint("/entries/{entry_id}/comments/{comment_id}/votes")
 
 # notifications
-NOTIFICATIONS_STATUS_URL = f"{API_URL}/notifications/status"
+NOTIFICATIONS_STATUS_URL = _url("/notifications/status")
 
-NOTIFICATIONS_ENTRIES_URL = f"{API_URL}/notifications/entries"
-NOTIFICATIONS_ENTRIES_ALL_URL = f"{API_URL}/notifications/entries/all"
-NOTIFICATIONS_ENTRY_URL = lambda id: f"{API_URL}/notifications/entries/{id}"
+NOTIFICATIONS_ENTRIES_URL = _url("/notifications/entries")
+NOTIFICATIONS_ENTRIES_ALL_URL = _url("/notifications/entries/all")
+NOTIFICATIONS_ENTRY_URL = _endpoint("/notifications/entries/{id}")
 
-NOTIFICATIONS_PMS_URL = f"{API_URL}/notifications/pm"
-NOTIFICATIONS_PMS_ALL_URL = f"{API_URL}/notifications/pm/all"
-NOTIFICATIONS_PM_URL = lambda id: f"{API_URL}/notifications/pm/{id}"
+NOTIFICATIONS_PMS_URL = _url("/notifications/pm")
+NOTIFICATIONS_PMS_ALL_URL = _url("/notifications/pm/all")
+NOTIFICATIONS_PM_URL = _endpoint("/notifications/pm/{id}")
 
 # media - photos
-MEDIA_PHOTOS_UPLOAD_URL = f"{API_URL}/media/photos"
-MEDIA_PHOTOS_UPLOAD_FILE = f"{API_URL}/media/photos/upload"
-MEDIA_PHOTOS_GET_PHOTO_URL = lambda key: f"{API_URL}/media/photos/{key}"
+MEDIA_PHOTOS_UPLOAD_URL = _url("/media/photos")
+MEDIA_PHOTOS_UPLOAD_FILE = _url("/media/photos/upload")
+MEDIA_PHOTOS_GET_PHOTO_URL = _endpoint("/media/photos/{key}")
 
 # media - embed
-MEDIA_EMBED_UPLOAD_URL = f"{API_URL}/media/embed"
+MEDIA_EMBED_UPLOAD_URL = _url("/media/embed")
 
 # profile
-PROFILES_OWN_PROFILE_URL = f"{API_URL}/profile"
-PROFILES_OWN_SHORT_PROFILE_URL = f"{API_URL}/profile/short"
-PROFILES_PROFILE_URL = lambda username: f"{API_URL}/profile/users/{username}"
-PROFILES_PROFILE_SHORT_URL = lambda username: f"{API_URL}/profile/users/{username}/short"
-PROFILES_PROFILE_ACTIONS_URL = lambda username: f"{API_URL}/profile/users/{username}/actions"
-PROFILES_PROFILE_ENTRIES_ADDED_URL = lambda username: f"{API_URL}/profile/users/{username}/entries/added"
-PROFILES_PROFILE_ENTRIES_VOTED_URL = lambda username: f"{API_URL}/profile/users/{username}/entries/voted"
-PROFILES_PROFILE_ENTRIES_COMMENTED_URL = lambda username: f"{API_URL}/profile/users/{username}/entries/commented"
-PROFILES_PROFILE_LINKS_ADDED_URL = lambda username: f"{API_URL}/profile/users/{username}/links/added"
-PROFILES_PROFILE_LINKS_PUBLISHED_URL = lambda username: f"{API_URL}/profile/users/{username}/links/published"
-PROFILES_PROFILE_LINKS_UP_URL = lambda username: f"{API_URL}/profile/users/{username}/links/up"
-PROFILES_PROFILE_LINKS_DOWN_URL = lambda username: f"{API_URL}/profile/users/{username}/links/down"
-PROFILES_PROFILE_LINKS_COMMENTED_URL = lambda username: f"{API_URL}/profile/users/{username}/links/commented"
-PROFILES_PROFILE_LINKS_RELATED_URL = lambda username: f"{API_URL}/profile/users/{username}/links/related"
-PROFILES_PROFILE_BADGES_URL = lambda username: f"{API_URL}/profile/users/{username}/badges"
-PROFILES_PROFILE_TAGS_URL = lambda username: f"{API_URL}/profile/users/{username}/tags"
-PROFILES_PROFILE_OBSERVED_TAGS_URL = lambda username: f"{API_URL}/profile/users/{username}/observed/tags"
-PROFILES_PROFILE_OBSERVED_FOLLOWING_URL = lambda username: f"{API_URL}/profile/users/{username}/observed/users/following"
-PROFILES_PROFILE_OBSERVED_FOLLOWERS_URL = lambda username: f"{API_URL}/profile/users/{username}/observed/users/followers"
+PROFILES_OWN_PROFILE_URL = _url("/profile")
+PROFILES_OWN_SHORT_PROFILE_URL = _url("/profile/short")
+PROFILES_PROFILE_URL = _endpoint("/profile/users/{username}")
+PROFILES_PROFILE_SHORT_URL = _endpoint("/profile/users/{username}/short")
+PROFILES_PROFILE_ACTIONS_URL = _endpoint("/profile/users/{username}/actions")
+PROFILES_PROFILE_ENTRIES_ADDED_URL = _endpoint("/profile/users/{username}/entries/added")
+PROFILES_PROFILE_ENTRIES_VOTED_URL = _endpoint("/profile/users/{username}/entries/voted")
+PROFILES_PROFILE_ENTRIES_COMMENTED_URL = _endpoint("/profile/users/{username}/entries/commented")
+PROFILES_PROFILE_LINKS_ADDED_URL = _endpoint("/profile/users/{username}/links/added")
+PROFILES_PROFILE_LINKS_PUBLISHED_URL = _endpoint("/profile/users/{username}/links/published")
+PROFILES_PROFILE_LINKS_UP_URL = _endpoint("/profile/users/{username}/links/up")
+PROFILES_PROFILE_LINKS_DOWN_URL = _endpoint("/profile/users/{username}/links/down")
+PROFILES_PROFILE_LINKS_COMMENTED_URL = _endpoint("/profile/users/{username}/links/commented")
+PROFILES_PROFILE_LINKS_RELATED_URL = _endpoint("/profile/users/{username}/links/related")
+PROFILES_PROFILE_BADGES_URL = _endpoint("/profile/users/{username}/badges")
+PROFILES_PROFILE_TAGS_URL = _endpoint("/profile/users/{username}/tags")
+PROFILES_PROFILE_OBSERVED_TAGS_URL = _endpoint("/profile/users/{username}/observed/tags")
+PROFILES_PROFILE_OBSERVED_FOLLOWING_URL = _endpoint("/profile/users/{username}/observed/users/following")
+PROFILES_PROFILE_OBSERVED_FOLLOWERS_URL = _endpoint("/profile/users/{username}/observed/users/followers")
 
 # pms
-PMS_READ_ALL_URL = f"{API_URL}/pm/read-all"
-PMS_CONVERSATIONS_URL = f"{API_URL}/pm/conversations"
-PMS_CONVERSATION_URL = lambda username: f"{API_URL}/pm/conversations/{username}"
+PMS_READ_ALL_URL = _url("/pm/read-all")
+PMS_CONVERSATIONS_URL = _url("/pm/conversations")
+PMS_CONVERSATION_URL = _endpoint("/pm/conversations/{username}")
@@ -1,4 +1,7 @@
+import base64
 import functools
+import json
+from typing import Any
 
 
 def auth_user_required(func):
@@ -10,3 +13,26 @@ def auth_user_required(func):
 
         return func(*args, **kwargs)
     return wrapper
+
+
+@functools.lru_cache(maxsize=64)
+def jwt_expiration(token: str) -> float | None:
+    """
+    Zwraca czas wygaśnięcia (claim exp, timestamp) tokenu JWT albo None, jeśli nie da się go odczytać.
+    Podpis tokenu nie jest weryfikowany.
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload))["exp"]
+        return float(exp)
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+
+def item_field(item: Any, name: str) -> Any:
+    """
+    Zwraca pole elementu odpowiedzi, zarówno słownika, jak i modelu (WykopApiClient(models=True))
+    """
+    return item.get(name) if isinstance(item, dict) else getattr(item, name, None)
@@ -0,0 +1,199 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator
+
+import requests
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from ._pagination import _page_items, _page_pagination, next_page
+from ._utils import item_field
+from ..exceptions import WykopApiError
+
+
+# błędy pojedynczego odpytania, po których watcher odczekuje i próbuje dalej
+_TRANSIENT_ERRORS = (WykopApiError, requests.RequestException)
+_ASYNC_TRANSIENT_ERRORS = (WykopApiError, httpx.HTTPError) if httpx is not None else (WykopApiError,)
+
+WatchErrorHandler = Callable[[Exception], None]
+
+
+class AdaptiveInterval:
+    """
+    Odstęp pomiędzy kolejnymi odpytaniami API. Skraca się o połowę, gdy pojawiły się nowe elementy,
+    i wydłuża (backoff razy), gdy ich nie było.
+
+    params min_interval: najkrótszy odstęp w sekundach
+    params max_interval: najdłuższy odstęp w sekundach
+    params backoff: mnożnik odstępu po odpytaniu bez nowych elementów
+    """
+    def __init__(self, min_interval: float = 5.0, max_interval: float = 300.0, backoff: float = 1.5):
+        if min_interval > max_interval:
+            raise ValueError("min_interval nie może być większy od max_interval")
+
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.current = min_interval
+
+    def update(self, new_items: int) -> float:
+        """
+        Zwraca odstęp do kolejnego odpytania po odpytaniu, które przyniosło new_items nowych elementów
+        """
+        if new_items:
+            self.current = max(self.min_interval, self.current / 2)
+        else:
+            self.current = min(self.max_interval, self.current * self.backoff)
+
+        return self.current
+
+
+class _SeenItems:
+    """
+    Ostatnio widziane elementy strumienia. Wpisy i znaleziska mają osobne numeracje id,
+    dlatego element jest rozpoznawany po parze (resource, id)
+    """
+    def __init__(self, size: int = 1000):
+        self.size = size
+        self.keys: OrderedDict[tuple, None] = OrderedDict()
+
+    def scan(self, items: list, pending: set[tuple]) -> tuple[list, bool]:
+        """
+        Zwraca nowe elementy strony (od najnowszego) oraz informację, czy strona doszła do już znanych elementów.
+        Elementy z pending (zebrane z poprzednich stron tego samego odpytania) są pomijane, bo przy paginacji
+        numerami stron nowe elementy przesuwają kolejne strony
+        """
+        fresh = []
+        for item in items:
+            key = (item_field(item, "resource"), item_field(item, "id"))
+            if key in self.keys:
+                return fresh, True
+            if key not in pending:
+                pending.add(key)
+                fresh.append(item)
+
+        return fresh, False
+
+    def remember(self, items: list):
+        for item in items:
+            self.keys[(item_field(item, "resource"), item_field(item, "id"))] = None
+
+        while len(self.keys) > self.size:
+            self.keys.popitem(last=False)
+
+
+def _poll(fetch_page: Callable[[str | int | None], dict], seen: _SeenItems, max_pages: int) -> list:
+    page = None
+    new = []
+    pending = set()
+
+    for _ in range(max_pages):
+        response = fetch_page(page)
+        items = list(_page_items(response))
+        fresh, reached_known = seen.scan(items, pending)
+        new += fresh
+
+        if reached_known or not items:
+            break
+        page = next_page(_page_pagination(response), page)
+        if page is None:
+            break
+
+    seen.remember(new)
+    return new
+
+
+async def _async_poll(fetch_page: Callable[[str | int | None], Awaitable[dict]], seen: _SeenItems, max_pages: int) -> list:
+    page = None
+    new = []
+    pending = set()
+
+    for _ in range(max_pages):
+        response = await fetch_page(page)
+        items = list(_page_items(response))
+        fresh, reached_known = seen.scan(items, pending)
+        new += fresh
+
+        if reached_known or not items:
+            break
+        page = next_page(_page_pagination(response), page)
+        if page is None:
+            break
+
+    seen.remember(new)
+    return new
+
+
+def watch(
+    fetch_page: Callable[[str | int | None], dict],
+    interval: AdaptiveInterval,
+    max_pages: int = 3,
+    skip_existing: bool = True,
+    on_error: WatchErrorHandler | None = None
+) -> Iterator[Any]:
+    """
+    Odpytuje w nieskończoność strumień posortowany od najnowszych i zwraca tylko nowe elementy, od najstarszego.
+    W każdym odpytaniu pobiera kolejne strony tylko dopóki nie dojdzie do znanych już elementów.
+
+    Błąd API albo połączenia w pojedynczym odpytaniu (już po ponowieniach sesji) nie przerywa obserwowania:
+    watcher przekazuje go do on_error, wydłuża odstęp i próbuje ponownie. Pozostałe błędy (np. AuthError) są rzucane.
+
+    params fetch_page: funkcja pobierająca stronę dla zadanego parametru page (None oznacza pierwszą stronę)
+    params interval: odstępy pomiędzy odpytaniami
+    params max_pages: maksymalna liczba stron pobranych w jednym odpytaniu
+    params skip_existing: czy pominąć elementy obecne w strumieniu przy pierwszym odpytaniu
+    params on_error: funkcja wywoływana z błędem nieudanego odpytania
+    """
+    seen = _SeenItems()
+    first = skip_existing
+
+    while True:
+        try:
+            new = _poll(fetch_page, seen, 1 if first else max_pages)
+        except _TRANSIENT_ERRORS as e:
+            if on_error is not None:
+                on_error(e)
+            time.sleep(interval.update(0))
+            continue
+
+        if first:
+            new = []
+        first = False
+
+        yield from reversed(new)
+        time.sleep(interval.update(len(new)))
+
+
+async def async_watch(
+    fetch_page: Callable[[str | int | None], Awaitable[dict]],
+    interval: AdaptiveInterval,
+    max_pages: int = 3,
+    skip_existing: bool = True,
+    on_error: WatchErrorHandler | None = None
+) -> AsyncIterator[Any]:
+    """
+    Wersja watch dla asyncio
+    """
+    seen = _SeenItems()
+    first = skip_existing
+
+    while True:
+        try:
+            new = await _async_poll(fetch_page, seen, 1 if first else max_pages)
+        except _ASYNC_TRANSIENT_ERRORS as e:
+            if on_error is not None:
+                on_error(e)
+            await asyncio.sleep(interval.update(0))
+            continue
+
+        if first:
+            new = []
+        first = False
+
+        for item in reversed(new):
+            yield item
+        await asyncio.sleep(interval.update(len(new)))
@@ -0,0 +1,156 @@
+import functools
+from typing import Any, AsyncIterator, Iterable
+
+from ._pagination import async_paginate
+from ._watch import AdaptiveInterval, async_watch
+from ._batch import BatchCall, BatchResult, async_run_batch
+from ._bulk import _AsyncBulkFetcher
+from ._stream import stream_pages
+from ._request import AsyncApiRequester
+from ._async_session import AsyncApiSession
+from ._rate_limit import RateLimiter
+from ._retry import RetryPolicy
+from ._timeout import Timeouts, deadline
+from ._hooks import RequestEvent, RequestHooks
+from ._replay import Cassette
+from ._notifications import AsyncNotificationWatcher
+from ._cache import ResponseCache
+from ._sqlite_cache import SqliteResponseCache
+from ._auth import AsyncAuthClient
+from .client import (
+    _WykopApiClientBase,
+    _WykopApiClientLinksMixin,
+    _WykopApiClientLinkCommentsMixin,
+    _WykopApiClientLinkDraftMixin,
+    _WykopApiClientArticleMixin,
+    _WykopApiClientTagsMixin,
+    _WykopApiClientEntriesMixin,
+    _WykopApiClientEntryCommentsMixin,
+    _WykopApiClientNotificationsMixin,
+    _WykopApiClientMediaPhotosMixin,
+    _WykopApiClientMediaEmedMixin,
+    _WykopApiClientProfileMixin,
+    _WykopApiClientPMMixin
+)
+
+
+__all__ = [
+    "AsyncWykopApiClient",
+    "AsyncAuthClient",
+    "AsyncApiSession",
+    "RateLimiter",
+    "RetryPolicy",
+    "Timeouts",
+    "deadline",
+    "RequestEvent",
+    "RequestHooks",
+    "Cassette",
+    "AsyncNotificationWatcher",
+    "ResponseCache",
+    "SqliteResponseCache",
+    "AdaptiveInterval",
+    "BatchCall",
+    "BatchResult",
+]
+
+
+_ENDPOINT_MIXINS = (
+    _WykopApiClientLinksMixin,
+    _WykopApiClientLinkCommentsMixin,
+    _WykopApiClientLinkDraftMixin,
+    _WykopApiClientArticleMixin,
+    _WykopApiClientTagsMixin,
+    _WykopApiClientEntriesMixin,
+    _WykopApiClientEntryCommentsMixin,
+    _WykopApiClientNotificationsMixin,
+    _WykopApiClientMediaPhotosMixin,
+    _WykopApiClientMediaEmedMixin,
+    _WykopApiClientProfileMixin,
+    _WykopApiClientPMMixin
+)
+
+
+class _AsyncWykopApiClientBase(_WykopApiClientBase):
+    def __init__(
+        self,
+        auth: AsyncAuthClient,
+        session: AsyncApiSession | None = None,
+        models: bool = False,
+        stream_pages: bool = False
+    ):
+        """
+        params session: nieblokująca pula połączeń HTTP, domyślnie współdzielona z przekazanym AsyncAuthClient
+        params models: czy zwracać w polu data modele (Entry, Link, Profile...) zamiast słowników
+        params stream_pages: czy metody iter_* mają zwracać elementy w trakcie pobierania strony,
+            zamiast czekać na całą odpowiedź. Przydatne przy dużych wartościach limit
+        """
+        super().__init__(auth, session=session, models=models, stream_pages=stream_pages)
+
+    def _requester(self, url: str) -> AsyncApiRequester:
+        return AsyncApiRequester(
+            url=url,
+            token=self.auth.get_jwt_token(),
+            session=self.session,
+            auth=self.auth,
+            models=self.models,
+            stream=stream_pages.get()
+        )
+
+    def _paginate(self, fetch_page, max_items: int | None = None, max_pages: int | None = None) -> AsyncIterator[dict]:
+        return async_paginate(fetch_page, max_items=max_items, max_pages=max_pages, stream=self.stream_pages)
+
+    def _watch(self, fetch_page, interval: AdaptiveInterval, **kwargs) -> AsyncIterator[dict]:
+        return async_watch(fetch_page, interval, **kwargs)
+
+    def _bulk(self) -> _AsyncBulkFetcher:
+        return _AsyncBulkFetcher(self)
+
+    async def _in_order(self, results: AsyncIterator[tuple[int, Any]]) -> list:
+        return [result for _, result in sorted([result async for result in results], key=lambda result: result[0])]
+
+    async def _unordered(self, results: AsyncIterator[tuple[int, Any]]) -> AsyncIterator:
+        async for _, result in results:
+            yield result
+
+
+def _as_coroutine_function(func):
+    """
+    Metody mixinów budują zapytanie synchronicznie i zwracają korutynę z AsyncApiRequester.
+    Wrapper zamienia je w pełnoprawne metody `async def`. Metody iter_* i watch_* nie wymagają opakowania,
+    bo _paginate i _watch zwracają w tym kliencie asynchroniczne iteratory.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await func(*args, **kwargs)
+    return wrapper
+
+
+class AsyncWykopApiClient(_AsyncWykopApiClientBase, *_ENDPOINT_MIXINS):
+    """
+    Główna klasa klienta dla asyncio. Udostępnia te same akcje co WykopApiClient,
+    ale każda z nich jest korutyną, a metody iter_* i watch_* zwracają asynchroniczne iteratory.
+
+    Przykład:
+        auth = AsyncAuthClient()
+        await auth.authenticate_app("<APP_KEY>", "<APP_SECRET>")
+
+        api = AsyncWykopApiClient(auth)
+        await api.entries_list_entries()
+    """
+    async def batch(self, calls: Iterable[BatchCall], concurrency: int = 32) -> list[BatchResult]:
+        """
+        Wykonuje współbieżnie wiele niezależnych akcji klienta.
+
+        Wyniki są zwracane w kolejności wywołań. Błąd pojedynczego wywołania (np. WykopApiNotFoundError)
+        trafia do BatchResult.error i nie przerywa pozostałych.
+
+        params calls: krotki (nazwa_metody, *argumenty) albo funkcje bez argumentów zwracające korutynę
+        params concurrency: maksymalna liczba jednocześnie wykonywanych zapytań
+        """
+        return await async_run_batch(self, calls, concurrency)
+
+
+for _mixin in (_WykopApiClientBase, *_ENDPOINT_MIXINS):
+    for _name, _func in vars(_mixin).items():
+        if not _name.startswith(("_", "iter_", "watch_")) and callable(_func):
+            setattr(AsyncWykopApiClient, _name, _as_coroutine_function(_func))
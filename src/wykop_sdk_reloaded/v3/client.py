@@ -1,6 +1,22 @@
+from typing import Any, Callable, Iterable, Iterator
+
 from . import _urls
 from ._utils import auth_user_required
+from ._pagination import paginate
+from ._watch import AdaptiveInterval, watch
+from ._batch import BatchCall, BatchResult, run_batch
+from ._bulk import BulkErrorHandler, _BulkFetcher
+from ._stream import stream_pages
 from ._request import ApiRequester
+from ._session import ApiSession
+from ._rate_limit import RateLimiter
+from ._retry import RetryPolicy
+from ._timeout import Timeouts, deadline
+from ._hooks import RequestEvent, RequestHooks
+from ._replay import Cassette
+from ._notifications import NotificationWatcher
+from ._cache import ResponseCache
+from ._sqlite_cache import SqliteResponseCache
 from ._auth import AuthClient
 from .types import (
     LinkType,
@@ -15,11 +31,82 @@ from .types import (
 )
 
 
+__all__ = [
+    "WykopApiClient",
+    "AuthClient",
+    "ApiSession",
+    "RateLimiter",
+    "RetryPolicy",
+    "Timeouts",
+    "deadline",
+    "RequestEvent",
+    "RequestHooks",
+    "Cassette",
+    "NotificationWatcher",
+    "ResponseCache",
+    "SqliteResponseCache",
+    "AdaptiveInterval",
+    "BatchCall",
+    "BatchResult",
+    "BulkErrorHandler",
+    "LinkType",
+    "LinkVoteDownReason",
+    "LinkCommentSortType",
+    "LinkCommentVoteType",
+    "RequestType",
+    "EntriesSortType",
+    "EntriesLastUpdateType",
+    "MediaPhotosType",
+    "StreamSortType",
+]
+
+
 class _WykopApiClientBase:
-    def __init__(self, auth: AuthClient):
+    def __init__(
+        self,
+        auth: AuthClient,
+        session: ApiSession | None = None,
+        models: bool = False,
+        stream_pages: bool = False
+    ):
+        """
+        params session: pula połączeń HTTP, domyślnie współdzielona z przekazanym AuthClient
+        params models: czy zwracać w polu data modele (Entry, Link, Profile...) zamiast słowników
+        params stream_pages: czy metody iter_* mają zwracać elementy w trakcie pobierania strony,
+            zamiast czekać na całą odpowiedź. Przydatne przy dużych wartościach limit
+        """
         self.auth = auth
         self.auth.check_authentication()
 
+        self.session = session or auth.session
+        self.models = models
+        self.stream_pages = stream_pages
+
+    def _requester(self, url: str) -> ApiRequester:
+        return ApiRequester(
+            url=url,
+            token=self.auth.get_jwt_token(),
+            session=self.session,
+            auth=self.auth,
+            models=self.models,
+            stream=stream_pages.get()
+        )
+
+    def _paginate(self, fetch_page, max_items: int | None = None, max_pages: int | None = None) -> Iterator[dict]:
+        return paginate(fetch_page, max_items=max_items, max_pages=max_pages, stream=self.stream_pages)
+
+    def _watch(self, fetch_page, interval: AdaptiveInterval, **kwargs) -> Iterator[dict]:
+        return watch(fetch_page, interval, **kwargs)
+
+    def _bulk(self) -> _BulkFetcher:
+        return _BulkFetcher(self)
+
+    def _in_order(self, results: Iterable[tuple[int, Any]]) -> list:
+        return [result for _, result in sorted(results, key=lambda result: result[0])]
+
+    def _unordered(self, results: Iterable[tuple[int, Any]]) -> Iterator:
+        return (result for _, result in results)
+
     def raw_request(self, url: str, type: RequestType, data: dict | None = None, params: dict | None = None) -> dict | None:
         """
         Umozliwia bezposrednie odpytanie Wykop API
@@ -29,19 +116,19 @@ class _WykopApiClientBase:
                 if data:
                     raise WykopApiClient("Metoda GET nie obsługuje wysyłania danych, moze chodzilo ci o parametr params?")
                 
-                return ApiRequester(url=url, token=self.auth.get_jwt_token()).get(params=params)
+                return self._requester(url).get(params=params)
             case RequestType.POST:
-                return ApiRequester(url=url, token=self.auth.get_jwt_token()).post(data=data, params=params)
+                return self._requester(url).post(data=data, params=params)
             case RequestType.PUT:
                 if params:
                     raise WykopApiClient("Metoda PUT nie obsługuje wysyłania parametrów, moze chodzilo ci o parametr data?")
 
-                return ApiRequester(url=url, token=self.auth.get_jwt_token()).put(data=data)
+                return self._requester(url).put(data=data)
             case RequestType.DELETE:
                 if params or data:
                     raise WykopApiClient("Metoda DELETE nie obsługuje wysyłania parametrów i danych.")
                 
-                return ApiRequester(url=url, token=self.auth.get_jwt_token()).delete()
+                return self._requester(url).delete()
 
 
 class _WykopApiClientLinksMixin(_WykopApiClientBase):
@@ -60,15 +147,32 @@ class _WykopApiClientLinksMixin(_WykopApiClientBase):
         UWAGA2: Standardowa paginacja jest dostępna tylko dla użytkowników niezalogowanych. Paginacja dla użytkowników zalogowanych będzie zwracać hash next dla następnej strony i prev dla poprzedniej.
         UWAGA3: Dla parametru type=upcoming (wykopalisko) paginacja przyjmuje parametr page jako int z nr strony, zarówno dla użytkowników zalogowanych i niezalogowanych
         """
-        return ApiRequester(
-            url=_urls.LINKS_URL,
-            token=self.auth.get_jwt_token()
-        ).get(params={
+        return self._requester(_urls.LINKS_URL).get(params={
             "type": type.value,
             "page": page,
             "limit": limit
         })
-    
+
+    def iter_links_list_links(
+            self,
+            type: LinkType,
+            limit: int | None = None,
+            max_items: int | None = None,
+            max_pages: int | None = None
+        ) -> Iterator[dict]:
+        """
+        Generator zwracający kolejne znaleziska ze wszystkich stron listy znalezisk.
+        Sam dobiera rodzaj paginacji (numer strony albo hash next) i pobiera kolejne strony dopiero gdy są potrzebne.
+
+        params max_items: maksymalna liczba zwróconych elementów
+        params max_pages: maksymalna liczba pobranych stron
+        """
+        return self._paginate(
+            lambda page: self.links_list_links(type, page=page, limit=limit),
+            max_items=max_items,
+            max_pages=max_pages
+        )
+
     def links_get_link(
             self,
             link_id: str
@@ -78,10 +182,7 @@ class _WykopApiClientLinksMixin(_WykopApiClientBase):
 
         Szczególy znaleziska
         """
-        return ApiRequester(
-            url=_urls.LINKS_LINK_URL(link_id),
-            token=self.auth.get_jwt_token()
-        ).get()
+        return self._requester(_urls.LINKS_LINK_URL(link_id)).get()
     
     @auth_user_required
     def links_delete_link(
@@ -93,10 +194,7 @@ class _WykopApiClientLinksMixin(_WykopApiClientBase):
 
         Usuwanie znaleziska
         """
-        return ApiRequester(
-            url=_urls.LINKS_LINK_URL(link_id),
-            token=self.auth.get_jwt_token()
-        ).delete()
+        return self._requester(_urls.LINKS_LINK_URL(link_id)).delete()
     
     @auth_user_required
     def links_update_link(
@@ -120,10 +218,7 @@ class _WykopApiClientLinksMixin(_WykopApiClientBase):
         Akceptowane są tylko pliki przesłane jako typ links.
         params tags: Tagi. Można wysłać do 6 tagów (bez '#').
         """
-        return ApiRequester(
-            url=_urls.LINKS_LINK_URL(link_id),
-            token=self.auth.get_jwt_token()
-        ).post({
+        return self._requester(_urls.LINKS_LINK_URL(link_id)).post({
             "title": title,
             "description": description,
             "tags": tags,
@@ -141,10 +236,7 @@ class _WykopApiClientLinksMixin(_WykopApiClientBase):
 
         Wykopanie znaleziska
         """
-        return ApiRequester(
-            url=_urls.LINKS_VOTE_UP_URL(link_id),
-            token=self.auth.get_jwt_token()
-        ).post()
+        return self._requester(_urls.LINKS_VOTE_UP_URL(link_id)).post()
     
     @auth_user_required
     def links_vote_down_link(
@@ -157,10 +249,7 @@ class _WykopApiClientLinksMixin(_WykopApiClientBase):
 
         Zakopanie znaleziska
         """
-        return ApiRequester(
-            url=_urls.LINKS_VOTE_DOWN_URL(link_id, reason.value),
-            token=self.auth.get_jwt_token()
-        ).post()
+        return self._requester(_urls.LINKS_VOTE_DOWN_URL(link_id, reason.value)).post()
     
     @auth_user_required
     def links_vote_revoke_link(
@@ -172,10 +261,7 @@ class _WykopApiClientLinksMixin(_WykopApiClientBase):
 
         Cofnięcie wykopania lub zakopania znaleziska
         """
-        return ApiRequester(
-            url=_urls.LINKS_VOTES_URL(link_id),
-            token=self.auth.get_jwt_token()
-        ).delete()
+        return self._requester(_urls.LINKS_VOTES_URL(link_id)).delete()
 
 
 class _WykopApiClientLinkCommentsMixin(_WykopApiClientBase):
@@ -192,15 +278,72 @@ class _WykopApiClientLinkCommentsMixin(_WykopApiClientBase):
         """
         Komentarze do znaleziska
         """
-        return ApiRequester(
-            url=_urls.LINK_COMMENTS_URL(link_id),
-            token=self.auth.get_jwt_token()
-        ).get(params={
+        return self._requester(_urls.LINK_COMMENTS_URL(link_id)).get(params={
             "sort": sort.value,
             "page": page,
             "limit": limit
         })
-    
+
+    def iter_link_comments_list_comments(
+            self,
+            link_id: str,
+            sort: LinkCommentSortType = LinkCommentSortType.NEWEST,
+            limit: int | None = None,
+            max_items: int | None = None,
+            max_pages: int | None = None
+        ) -> Iterator[dict]:
+        """
+        Generator zwracający kolejne komentarze do znaleziska ze wszystkich stron.
+        Sam dobiera rodzaj paginacji (numer strony albo hash next) i pobiera kolejne strony dopiero gdy są potrzebne.
+
+        params max_items: maksymalna liczba zwróconych elementów
+        params max_pages: maksymalna liczba pobranych stron
+        """
+        return self._paginate(
+            lambda page: self.link_comments_list_comments(link_id, sort=sort, page=page, limit=limit),
+            max_items=max_items,
+            max_pages=max_pages
+        )
+
+    def link_comments_get_comment(self, link_id: str, comment_id: str) -> dict:
+        """
+        Komentarz do znaleziska razem z komentarzami podrzędnymi
+        """
+        return self._requester(_urls.LINK_COMMENTS_COMMENT_URL(link_id, comment_id)).get()
+
+    def link_comments_get_comment_tree(
+            self,
+            link_id: str,
+            sort: LinkCommentSortType = LinkCommentSortType.NEWEST,
+            concurrency: int = 8,
+            on_error: BulkErrorHandler | None = None
+        ) -> list[dict]:
+        """
+        Zwraca wszystkie komentarze do znaleziska razem z pełnymi listami komentarzy podrzędnych.
+
+        Strony komentarzy są pobierane jednocześnie (gdy API stronicuje numerami stron), a komentarze,
+        pod którymi API nie zwróciło wszystkich odpowiedzi, są uzupełniane przez link_comments_get_comment.
+        Limit zapytań sesji (RateLimiter) obowiązuje dla każdego z tych zapytań.
+
+        params concurrency: maksymalna liczba jednocześnie wykonywanych zapytań
+        params on_error: funkcja wywoływana z id komentarza i błędem API przy jego uzupełnianiu - komentarz zostaje
+            wtedy z odpowiedziami zwróconymi przy liście. Domyślnie błąd przerywa pobieranie
+        """
+        return self._in_order(self._bulk().link_comment_tree(link_id, sort, concurrency, on_error))
+
+    def iter_link_comments_comment_tree(
+            self,
+            link_id: str,
+            sort: LinkCommentSortType = LinkCommentSortType.NEWEST,
+            concurrency: int = 8,
+            on_error: BulkErrorHandler | None = None
+        ) -> Iterator[dict]:
+        """
+        Wersja link_comments_get_comment_tree zwracająca komentarze najwyższego poziomu (z pełnymi listami odpowiedzi)
+        w kolejności ich uzupełnienia, zamiast czekać na całe drzewo
+        """
+        return self._unordered(self._bulk().link_comment_tree(link_id, sort, concurrency, on_error))
+
     @auth_user_required
     def link_comments_create_comment(
             self,
@@ -216,10 +359,7 @@ class _WykopApiClientLinkCommentsMixin(_WykopApiClientBase):
 
         Dodawanie nowego komentarza do wykopaliska
         """
-        return ApiRequester(
-            url=_urls.LINK_COMMENTS_URL(link_id),
-            token=self.auth.get_jwt_token()
-        ).post(data={
+        return self._requester(_urls.LINK_COMMENTS_URL(link_id)).post(data={
             "content": content,
             "photo": photo,
             "embed": embed,
@@ -242,10 +382,7 @@ class _WykopApiClientLinkCommentsMixin(_WykopApiClientBase):
 
         Dodawanie nowego podkomentarza do istniejącego komentarza
         """
-        return ApiRequester(
-            url=_urls.LINK_COMMENTS_COMMENT_URL(link_id, comment_id),
-            token=self.auth.get_jwt_token()
-        ).post(data={
+        return self._requester(_urls.LINK_COMMENTS_COMMENT_URL(link_id, comment_id)).post(data={
             "content": content,
             "photo": photo,
             "embed": embed,
@@ -268,10 +405,7 @@ class _WykopApiClientLinkCommentsMixin(_WykopApiClientBase):
 
         Edycja komentarza do wykopaliska
         """
-        return ApiRequester(
-            url=_urls.LINK_COMMENTS_COMMENT_URL(link_id, comment_id),
-            token=self.auth.get_jwt_token()
-        ).put(data={
+        return self._requester(_urls.LINK_COMMENTS_COMMENT_URL(link_id, comment_id)).put(data={
             "content": content,
             "photo": photo,
             "embed": embed,
@@ -289,10 +423,7 @@ class _WykopApiClientLinkCommentsMixin(_WykopApiClientBase):
 
         Usuwanie komentarza do wykopaliska
         """
-        return ApiRequester(
-            url=_urls.LINK_COMMENTS_COMMENT_URL(link_id, comment_id),
-            token=self.auth.get_jwt_token()
-        ).delete()
+        return self._requester(_urls.LINK_COMMENTS_COMMENT_URL(link_id, comment_id)).delete()
     
     @auth_user_required
     def link_comments_vote_comment(
@@ -306,10 +437,7 @@ class _WykopApiClientLinkCommentsMixin(_WykopApiClientBase):
 
         Glosowanie na komentarz do wykopaliska
         """
-        return ApiRequester(
-            url=_urls.LINK_COMMENTS_COMMENT_VOTE_URL(link_id, comment_id, type.value),
-            token=self.auth.get_jwt_token()
-        ).post()
+        return self._requester(_urls.LINK_COMMENTS_COMMENT_VOTE_URL(link_id, comment_id, type.value)).post()
    
     @auth_user_required
     def link_comments_vote_revoke_comment(
@@ -322,10 +450,7 @@ class _WykopApiClientLinkCommentsMixin(_WykopApiClientBase):
 
         Cofanie oceny komentarza do wykopaliska
         """
-        return ApiRequester(
-            url=_urls.LINK_COMMENTS_COMMENT_VOTE_REVOKE_URL(link_id, comment_id),
-            token=self.auth.get_jwt_token()
-        ).delete()
+        return self._requester(_urls.LINK_COMMENTS_COMMENT_VOTE_REVOKE_URL(link_id, comment_id)).delete()
 
 
 class _WykopApiClientLinkDraftMixin(_WykopApiClientBase):
@@ -340,10 +465,7 @@ class _WykopApiClientLinkDraftMixin(_WykopApiClientBase):
         Lista wersji roboczych linków zalogowanego użytkownika
         Wersje robocze są kasowane po upływie 24h.
         """
-        return ApiRequester(
-            url=_urls.LINK_DRAFTS_URL,
-            token=self.auth.get_jwt_token()
-        ).get()
+        return self._requester(_urls.LINK_DRAFTS_URL).get()
     
     @auth_user_required
     def links_draft_create_draft_step_one(self, url: str):
@@ -352,10 +474,7 @@ class _WykopApiClientLinkDraftMixin(_WykopApiClientBase):
 
         Dodawanie nowego linku w wersji roboczej krok pierwszy
         """
-        return ApiRequester(
-            url=_urls.LINK_DRAFTS_URL,
-            token=self.auth.get_jwt_token()
-        ).post({"url": url})
+        return self._requester(_urls.LINK_DRAFTS_URL).post({"url": url})
     
     @auth_user_required
     def links_draft_create_draft_step_two(
@@ -376,10 +495,7 @@ class _WykopApiClientLinkDraftMixin(_WykopApiClientBase):
         Akceptowane są tylko pliki przesłane jako typ links.
         params tags: Tagi. Można wysłać do 6 tagów (bez '#').
         """
-        return ApiRequester(
-            url=_urls.LINK_DRAFTS_DRAFT_URL(key),
-            token=self.auth.get_jwt_token()
-        ).post({
+        return self._requester(_urls.LINK_DRAFTS_DRAFT_URL(key)).post({
             "title": title,
             "description": description,
             "tags": tags,
@@ -407,10 +523,7 @@ class _WykopApiClientLinkDraftMixin(_WykopApiClientBase):
         Akceptowane są tylko pliki przesłane jako typ links.
         params tags: Tagi. Można wysłać do 6 tagów (bez '#').
         """
-        return ApiRequester(
-            url=_urls.LINK_DRAFTS_DRAFT_URL(key),
-            token=self.auth.get_jwt_token()
-        ).put({
+        return self._requester(_urls.LINK_DRAFTS_DRAFT_URL(key)).put({
             "title": title,
             "description": description,
             "tags": tags,
@@ -426,10 +539,7 @@ class _WykopApiClientLinkDraftMixin(_WykopApiClientBase):
 
         Zwraca wersję robocza linku
         """
-        return ApiRequester(
-            url=_urls.LINK_DRAFTS_DRAFT_URL(key),
-            token=self.auth.get_jwt_token()
-        ).get()
+        return self._requester(_urls.LINK_DRAFTS_DRAFT_URL(key)).get()
 
     @auth_user_required
     def links_draft_delete_draft(self, key: str):
@@ -438,10 +548,7 @@ class _WykopApiClientLinkDraftMixin(_WykopApiClientBase):
 
         Usuwa wersję robocza linku
         """
-        return ApiRequester(
-            url=_urls.LINK_DRAFTS_DRAFT_URL(key),
-            token=self.auth.get_jwt_token()
-        ).delete()
+        return self._requester(_urls.LINK_DRAFTS_DRAFT_URL(key)).delete()
 
 
 class _WykopApiClientTagsMixin(_WykopApiClientBase):
@@ -452,37 +559,25 @@ class _WykopApiClientTagsMixin(_WykopApiClientBase):
         """
         Zwraca listę popularnych tagów.
         """
-        return ApiRequester(
-            url=_urls.TAGS_POPULAR_URL,
-            token=self.auth.get_jwt_token()
-        ).get()
+        return self._requester(_urls.TAGS_POPULAR_URL).get()
     
     def tags_get_popular_user_tags(self) -> dict:
         """
         Kolekcja popularnych tagów autorskich (max do 10 wyników)
         """
-        return ApiRequester(
-            url=_urls.TAGS_POPULAR_USER_URL,
-            token=self.auth.get_jwt_token()
-        ).get()
+        return self._requester(_urls.TAGS_POPULAR_USER_URL).get()
         
     def tags_get_related_tag(self, tag: str) -> dict:
         """
         Kolekcja powiązanych tagów (max do 10 wyników)
         """
-        return ApiRequester(
-            url=_urls.TAGS_RELATED_TAG_URL(tag),
-            token=self.auth.get_jwt_token()
-        ).get()
+        return self._requester(_urls.TAGS_RELATED_TAG_URL(tag)).get()
     
     def tags_get_detail_of_tag(self, tag: str) -> dict:
         """
         Szczegóły tagu
         """
-        return ApiRequester(
-            url=_urls.TAGS_DETAIL_TAG_URL(tag),
-            token=self.auth.get_jwt_token()
-        ).get()
+        return self._requester(_urls.TAGS_DETAIL_TAG_URL(tag)).get()
     
     @auth_user_required
     def tags_edit_tag(self, tag: str, photo: str, description: str) -> dict | None:
@@ -491,10 +586,7 @@ class _WykopApiClientTagsMixin(_WykopApiClientBase):
 
         Właściciel tagu może modyfikować tło (base64 str) oraz opis tagu.
         """
-        return ApiRequester(
-            url=_urls.TAGS_DETAIL_TAG_URL(tag),
-            token=self.auth.get_jwt_token()
-        ).put({
+        return self._requester(_urls.TAGS_DETAIL_TAG_URL(tag)).put({
             "photo": photo,
             "description": description
         })
@@ -514,17 +606,67 @@ class _WykopApiClientTagsMixin(_WykopApiClientBase):
         UWAGA2: Standardowa paginacja jest dostępna tylko dla użytkowników niezalogowanych. 
         Paginacja dla użytkowników zalogowanych będzie zwracać hash next dla następnej strony i prev dla poprzedniej.
         """
-        return ApiRequester(
-            url=_urls.TAGS_STREAM_TAG_URL(tag),
-            token=self.auth.get_jwt_token()
-        ).get(params={
+        return self._requester(_urls.TAGS_STREAM_TAG_URL(tag)).get(params={
             "sort": sort.value,
             "page": page,
             "limit": limit,
             "year": year,
             "month": month
         })
-    
+
+    def iter_tags_get_stream_of_tag(
+            self,
+            tag: str,
+            sort: StreamSortType = StreamSortType.ALL,
+            limit: int | None = None,
+            year: int | None = None,
+            month: int | None = None,
+            max_items: int | None = None,
+            max_pages: int | None = None
+        ) -> Iterator[dict]:
+        """
+        Generator zwracający kolejne wpisy i znaleziska z konkretnego tagu ze wszystkich stron.
+        Sam dobiera rodzaj paginacji (numer strony albo hash next) i pobiera kolejne strony dopiero gdy są potrzebne.
+
+        params max_items: maksymalna liczba zwróconych elementów
+        params max_pages: maksymalna liczba pobranych stron
+        """
+        return self._paginate(
+            lambda page: self.tags_get_stream_of_tag(tag, sort=sort, page=page, limit=limit, year=year, month=month),
+            max_items=max_items,
+            max_pages=max_pages
+        )
+
+    def watch_tag(
+            self,
+            tag: str,
+            limit: int | None = None,
+            min_interval: float = 5.0,
+            max_interval: float = 300.0,
+            max_pages: int = 3,
+            skip_existing: bool = True,
+            on_error: Callable[[Exception], None] | None = None
+        ) -> Iterator[dict]:
+        """
+        Nieskończony generator zwracający tylko nowe wpisy i znaleziska z konkretnego tagu, od najstarszego.
+        Przy każdym odpytaniu pobiera strumień tagu (StreamSortType.ALL) tylko do pierwszego znanego już elementu.
+        Odstęp pomiędzy odpytaniami skraca się, gdy w tagu pojawiają się nowe elementy, i wydłuża, gdy ich nie ma.
+
+        params min_interval: najkrótszy odstęp pomiędzy odpytaniami w sekundach
+        params max_interval: najdłuższy odstęp pomiędzy odpytaniami w sekundach
+        params max_pages: maksymalna liczba stron pobranych w jednym odpytaniu
+        params skip_existing: czy pominąć elementy obecne w tagu w chwili uruchomienia
+        params on_error: funkcja wywoływana z błędem API albo połączenia, po którym watcher odczeka i spróbuje ponownie.
+            Pozostałe błędy (np. AuthError) kończą generator
+        """
+        return self._watch(
+            lambda page: self.tags_get_stream_of_tag(tag, sort=StreamSortType.ALL, page=page, limit=limit),
+            AdaptiveInterval(min_interval, max_interval),
+            max_pages=max_pages,
+            skip_existing=skip_existing,
+            on_error=on_error
+        )
+
     def tags_get_tag_owners(
             self,
             tag: str,
@@ -532,10 +674,7 @@ class _WykopApiClientTagsMixin(_WykopApiClientBase):
         """
         Kolekcja autorów tagu (short profile)
         """
-        return ApiRequester(
-            url=_urls.TAGS_TAG_OWNERS_URL(tag),
-            token=self.auth.get_jwt_token()
-        ).get()
+        return self._requester(_urls.TAGS_TAG_OWNERS_URL(tag)).get()
 
 
 class _WykopApiClientArticleMixin(_WykopApiClientBase):
@@ -557,10 +696,7 @@ class _WykopApiClientArticleMixin(_WykopApiClientBase):
         UWAGA2: Standardowa paginacja jest dostępna tylko dla użytkowników niezalogowanych. 
         Paginacja dla użytkowników zalogowanych będzie zwracać hash next dla następnej strony i prev dla poprzedniej.
         """
-        return ApiRequester(
-            url=_urls.TAGS_STREAM_TAG_URL(tag),
-            token=self.auth.get_jwt_token()
-        ).get(params={
+        return self._requester(_urls.TAGS_STREAM_TAG_URL(tag)).get(params={
             "type": "article",
             "sort": sort.value,
             "page": page,
@@ -568,7 +704,30 @@ class _WykopApiClientArticleMixin(_WykopApiClientBase):
             "year": year,
             "month": month
         })
-    
+
+    def iter_articles_list_articles_by_tag(
+            self,
+            tag: str,
+            sort: StreamSortType = StreamSortType.ALL,
+            limit: int | None = None,
+            year: int | None = None,
+            month: int | None = None,
+            max_items: int | None = None,
+            max_pages: int | None = None
+        ) -> Iterator[dict]:
+        """
+        Generator zwracający kolejne artykuły konkretnego tagu ze wszystkich stron.
+        Sam dobiera rodzaj paginacji (numer strony albo hash next) i pobiera kolejne strony dopiero gdy są potrzebne.
+
+        params max_items: maksymalna liczba zwróconych elementów
+        params max_pages: maksymalna liczba pobranych stron
+        """
+        return self._paginate(
+            lambda page: self.articles_list_articles_by_tag(tag, sort=sort, page=page, limit=limit, year=year, month=month),
+            max_items=max_items,
+            max_pages=max_pages
+        )
+
     def articles_get_article(
         self,
         article_id: str
@@ -576,10 +735,7 @@ class _WykopApiClientArticleMixin(_WykopApiClientBase):
         """
         Pobranie informacji o artykule
         """
-        return ApiRequester(
-            url=_urls.ARTICLES_ARTICLE_URL(article_id),
-            token=self.auth.get_jwt_token()
-        ).get()
+        return self._requester(_urls.ARTICLES_ARTICLE_URL(article_id)).get()
 
 
 class _WykopApiClientEntriesMixin(_WykopApiClientBase):
@@ -600,10 +756,7 @@ class _WykopApiClientEntriesMixin(_WykopApiClientBase):
 
         Dodawanie nowego wpisu na mikroblogu
         """
-        return ApiRequester(
-            url=_urls.ENTRIES_URL,
-            token=self.auth.get_jwt_token()
-        ).post(data={
+        return self._requester(_urls.ENTRIES_URL).post(data={
             "content": content,
             "photo": photo,
             "embed": embed,
@@ -623,16 +776,34 @@ class _WykopApiClientEntriesMixin(_WykopApiClientBase):
         UWAGA2: Standardowa paginacja jest dostępna tylko dla użytkowników niezalogowanych. 
         Paginacja dla użytkowników zalogowanych będzie zwracać hash next dla następnej strony i prev dla poprzedniej.
         """
-        return ApiRequester(
-            url=_urls.ENTRIES_URL,
-            token=self.auth.get_jwt_token()
-        ).get(params={
+        return self._requester(_urls.ENTRIES_URL).get(params={
             "sort": sort.value,
             "last_update": last_update.value,
             "page": page,
             "limit": limit
         })
-    
+
+    def iter_entries_list_entries(
+            self,
+            sort: EntriesSortType = EntriesSortType.HOT,
+            last_update: EntriesLastUpdateType = EntriesLastUpdateType.TWELVE,
+            limit: int | None = None,
+            max_items: int | None = None,
+            max_pages: int | None = None
+        ) -> Iterator[dict]:
+        """
+        Generator zwracający kolejne wpisy z mikrobloga ze wszystkich stron.
+        Sam dobiera rodzaj paginacji (numer strony albo hash next) i pobiera kolejne strony dopiero gdy są potrzebne.
+
+        params max_items: maksymalna liczba zwróconych elementów
+        params max_pages: maksymalna liczba pobranych stron
+        """
+        return self._paginate(
+            lambda page: self.entries_list_entries(sort=sort, last_update=last_update, page=page, limit=limit),
+            max_items=max_items,
+            max_pages=max_pages
+        )
+
     def entries_list_entries_by_tag(
             self,
             tag: str,
@@ -648,10 +819,7 @@ class _WykopApiClientEntriesMixin(_WykopApiClientBase):
         UWAGA2: Standardowa paginacja jest dostępna tylko dla użytkowników niezalogowanych. 
         Paginacja dla użytkowników zalogowanych będzie zwracać hash next dla następnej strony i prev dla poprzedniej.
         """
-        return ApiRequester(
-            url=_urls.TAGS_STREAM_TAG_URL(tag),
-            token=self.auth.get_jwt_token()
-        ).get(params={
+        return self._requester(_urls.TAGS_STREAM_TAG_URL(tag)).get(params={
             "type": "entry",
             "sort": sort.value,
             "page": page,
@@ -659,7 +827,30 @@ class _WykopApiClientEntriesMixin(_WykopApiClientBase):
             "year": year,
             "month": month
         })
-    
+
+    def iter_entries_list_entries_by_tag(
+            self,
+            tag: str,
+            sort: StreamSortType = StreamSortType.ALL,
+            limit: int | None = None,
+            year: int | None = None,
+            month: int | None = None,
+            max_items: int | None = None,
+            max_pages: int | None = None
+        ) -> Iterator[dict]:
+        """
+        Generator zwracający kolejne wpisy konkretnego tagu ze wszystkich stron.
+        Sam dobiera rodzaj paginacji (numer strony albo hash next) i pobiera kolejne strony dopiero gdy są potrzebne.
+
+        params max_items: maksymalna liczba zwróconych elementów
+        params max_pages: maksymalna liczba pobranych stron
+        """
+        return self._paginate(
+            lambda page: self.entries_list_entries_by_tag(tag, sort=sort, page=page, limit=limit, year=year, month=month),
+            max_items=max_items,
+            max_pages=max_pages
+        )
+
     def entries_get_entry(
         self,
         entry_id: str
@@ -667,10 +858,28 @@ class _WykopApiClientEntriesMixin(_WykopApiClientBase):
         """
         Pobranie wpisu z mikrobloga
         """
-        return ApiRequester(
-            url=_urls.ENTRIES_ENTRY_URL(entry_id),
-            token=self.auth.get_jwt_token()
-        ).get()
+        return self._requester(_urls.ENTRIES_ENTRY_URL(entry_id)).get()
+
+    def iter_entries_with_comments(
+            self,
+            entry_ids: Iterable[str],
+            concurrency: int = 8,
+            on_error: BulkErrorHandler | None = None
+        ) -> Iterator[tuple[dict, list[dict]]]:
+        """
+        Pobiera jednocześnie wiele wpisów razem z wszystkimi komentarzami i zwraca pary (wpis, komentarze)
+        w kolejności zakończenia pobierania. Komentarze są pobierane przez entry_comments_list_comments
+        tylko wtedy, gdy wpis nie zawiera ich wszystkich.
+
+        Jednocześnie przetwarzanych jest co najwyżej concurrency wpisów, a limit zapytań sesji (RateLimiter)
+        obowiązuje dla każdego zapytania.
+
+        params entry_ids: identyfikatory wpisów, mogą być generatorem - są pobierane w miarę przetwarzania
+        params concurrency: maksymalna liczba jednocześnie przetwarzanych wpisów
+        params on_error: funkcja wywoływana z id wpisu i błędem API (np. WykopApiNotFoundError dla usuniętego wpisu),
+            po którym wpis jest pomijany. Domyślnie błąd przerywa pobieranie
+        """
+        return self._unordered(self._bulk().entries_with_comments(entry_ids, concurrency, on_error))
     
     @auth_user_required
     def entries_update_entry(
@@ -686,10 +895,7 @@ class _WykopApiClientEntriesMixin(_WykopApiClientBase):
 
         Edycja wpisu z mikrobloga
         """
-        return ApiRequester(
-            url=_urls.ENTRIES_ENTRY_URL(entry_id),
-            token=self.auth.get_jwt_token()
-        ).put({
+        return self._requester(_urls.ENTRIES_ENTRY_URL(entry_id)).put({
             "content": content,
             "photo": photo,
             "embed": embed,
@@ -706,10 +912,7 @@ class _WykopApiClientEntriesMixin(_WykopApiClientBase):
 
         Usuwanie wpisu z mikrobloga
         """
-        return ApiRequester(
-            url=_urls.ENTRIES_ENTRY_URL(entry_id),
-            token=self.auth.get_jwt_token()
-        ).delete()
+        return self._requester(_urls.ENTRIES_ENTRY_URL(entry_id)).delete()
 
     def entries_list_voters(
         self,
@@ -719,11 +922,27 @@ class _WykopApiClientEntriesMixin(_WykopApiClientBase):
         """
         Pobiera nazwy użytkowników którzy głosowali na wpis z mikrobloga. Wynik jest paginowany.
         """
-        return ApiRequester(
-            url=_urls.ENTRIES_ENTRY_VOTES_URL(entry_id),
-            token=self.auth.get_jwt_token()
-        ).get(params={"page": page})
-    
+        return self._requester(_urls.ENTRIES_ENTRY_VOTES_URL(entry_id)).get(params={"page": page})
+
+    def iter_entries_list_voters(
+            self,
+            entry_id: str,
+            max_items: int | None = None,
+            max_pages: int | None = None
+        ) -> Iterator[dict]:
+        """
+        Generator zwracający kolejnych użytkowników którzy głosowali na wpis ze wszystkich stron.
+        Sam dobiera rodzaj paginacji (numer strony albo hash next) i pobiera kolejne strony dopiero gdy są potrzebne.
+
+        params max_items: maksymalna liczba zwróconych elementów
+        params max_pages: maksymalna liczba pobranych stron
+        """
+        return self._paginate(
+            lambda page: self.entries_list_voters(entry_id, page=page),
+            max_items=max_items,
+            max_pages=max_pages
+        )
+
     @auth_user_required
     def entries_vote_up_entry(
         self,
@@ -734,10 +953,7 @@ class _WykopApiClientEntriesMixin(_WykopApiClientBase):
 
         Głosowanie na wpis z mikrobloga
         """
-        return ApiRequester(
-            url=_urls.ENTRIES_ENTRY_VOTES_URL(entry_id),
-            token=self.auth.get_jwt_token()
-        ).post()
+        return self._requester(_urls.ENTRIES_ENTRY_VOTES_URL(entry_id)).post()
     
     @auth_user_required
     def entries_vote_revoke_entry(
@@ -749,10 +965,7 @@ class _WykopApiClientEntriesMixin(_WykopApiClientBase):
 
         Cofnięcie głosu na wpis z mikrobloga
         """
-        return ApiRequester(
-            url=_urls.ENTRIES_ENTRY_VOTES_URL(entry_id),
-            token=self.auth.get_jwt_token()
-        ).delete()
+        return self._requester(_urls.ENTRIES_ENTRY_VOTES_URL(entry_id)).delete()
 
 
 class _WykopApiClientEntryCommentsMixin(_WykopApiClientBase):
@@ -768,14 +981,31 @@ class _WykopApiClientEntryCommentsMixin(_WykopApiClientBase):
         """
         Komentarze do wpisu z mikrobloga
         """
-        return ApiRequester(
-            url=_urls.ENTRY_COMMENTS_URL(entry_id),
-            token=self.auth.get_jwt_token()
-        ).get(params={
+        return self._requester(_urls.ENTRY_COMMENTS_URL(entry_id)).get(params={
             "page": page,
             "limit": limit
         })
-    
+
+    def iter_entry_comments_list_comments(
+            self,
+            entry_id: str,
+            limit: int | None = None,
+            max_items: int | None = None,
+            max_pages: int | None = None
+        ) -> Iterator[dict]:
+        """
+        Generator zwracający kolejne komentarze do wpisu ze wszystkich stron.
+        Sam dobiera rodzaj paginacji (numer strony albo hash next) i pobiera kolejne strony dopiero gdy są potrzebne.
+
+        params max_items: maksymalna liczba zwróconych elementów
+        params max_pages: maksymalna liczba pobranych stron
+        """
+        return self._paginate(
+            lambda page: self.entry_comments_list_comments(entry_id, page=page, limit=limit),
+            max_items=max_items,
+            max_pages=max_pages
+        )
+
     @auth_user_required
     def entry_comments_create_comment(
             self,
@@ -791,10 +1021,7 @@ class _WykopApiClientEntryCommentsMixin(_WykopApiClientBase):
 
         Dodawanie nowego komentarza do wpisu na mikroblogu
         """
-        return ApiRequester(
-            url=_urls.ENTRY_COMMENTS_URL(entry_id),
-            token=self.auth.get_jwt_token()
-        ).post(data={
+        return self._requester(_urls.ENTRY_COMMENTS_URL(entry_id)).post(data={
             "content": content,
             "photo": photo,
             "embed": embed,
@@ -817,10 +1044,7 @@ class _WykopApiClientEntryCommentsMixin(_WykopApiClientBase):
 
         Edycja komentarza do wpisu na mikroblogu
         """
-        return ApiRequester(
-            url=_urls.ENTRY_COMMENTS_COMMENT_URL(entry_id, comment_id),
-            token=self.auth.get_jwt_token()
-        ).put(data={
+        return self._requester(_urls.ENTRY_COMMENTS_COMMENT_URL(entry_id, comment_id)).put(data={
             "content": content,
             "photo": photo,
             "embed": embed,
@@ -838,10 +1062,7 @@ class _WykopApiClientEntryCommentsMixin(_WykopApiClientBase):
 
         Usuwanie komentarza do wpisu z mikrobloga
         """
-        return ApiRequester(
-            url=_urls.ENTRY_COMMENTS_COMMENT_URL(entry_id, comment_id),
-            token=self.auth.get_jwt_token()
-        ).delete()
+        return self._requester(_urls.ENTRY_COMMENTS_COMMENT_URL(entry_id, comment_id)).delete()
     
     @auth_user_required
     def entry_comments_vote_up_comment(
@@ -854,10 +1075,7 @@ class _WykopApiClientEntryCommentsMixin(_WykopApiClientBase):
 
         Głosowanie na komentarz do wpisu z mikrobloga
         """
-        return ApiRequester(
-            url=_urls.ENTRY_COMMENTS_VOTES_URL(entry_id, comment_id),
-            token=self.auth.get_jwt_token()
-        ).post()
+        return self._requester(_urls.ENTRY_COMMENTS_VOTES_URL(entry_id, comment_id)).post()
     
     @auth_user_required
     def entry_comments_vote_revoke_comment(
@@ -870,10 +1088,7 @@ class _WykopApiClientEntryCommentsMixin(_WykopApiClientBase):
 
         Cofanie głosu na komentarz do wpisu z mikrobloga
         """
-        return ApiRequester(
-            url=_urls.ENTRY_COMMENTS_VOTES_URL(entry_id, comment_id),
-            token=self.auth.get_jwt_token()
-        ).delete()
+        return self._requester(_urls.ENTRY_COMMENTS_VOTES_URL(entry_id, comment_id)).delete()
 
 
 class _WykopApiClientNotificationsMixin(_WykopApiClientBase):
@@ -887,10 +1102,7 @@ class _WykopApiClientNotificationsMixin(_WykopApiClientBase):
 
         Sprawdzenie czy zalogowany użytkownik posiada nowe powiadomienia
         """
-        return ApiRequester(
-            url=_urls.NOTIFICATIONS_STATUS_URL,
-            token=self.auth.get_jwt_token()
-        ).get()
+        return self._requester(_urls.NOTIFICATIONS_STATUS_URL).get()
 
     @auth_user_required
     def notifinations_list_entries(self) -> dict:
@@ -899,10 +1111,7 @@ class _WykopApiClientNotificationsMixin(_WykopApiClientBase):
 
         Pobranie notyfikacji
         """
-        return ApiRequester(
-            url=_urls.NOTIFICATIONS_ENTRIES_URL,
-            token=self.auth.get_jwt_token()
-        ).get()
+        return self._requester(_urls.NOTIFICATIONS_ENTRIES_URL).get()
 
     @auth_user_required
     def notifinations_mark_all_entries_readed(self):
@@ -911,10 +1120,7 @@ class _WykopApiClientNotificationsMixin(_WykopApiClientBase):
 
         Oznaczenie powiadomień użytkownika jako przeczytane
         """
-        return ApiRequester(
-            url=_urls.NOTIFICATIONS_ENTRIES_ALL_URL,
-            token=self.auth.get_jwt_token()
-        ).put()
+        return self._requester(_urls.NOTIFICATIONS_ENTRIES_ALL_URL).put()
     
     @auth_user_required
     def notifinations_delete_all_entries(self):
@@ -923,10 +1129,7 @@ class _WykopApiClientNotificationsMixin(_WykopApiClientBase):
 
         Usunięcie wszystkich powiadomień użytkownika
         """
-        return ApiRequester(
-            url=_urls.NOTIFICATIONS_ENTRIES_ALL_URL,
-            token=self.auth.get_jwt_token()
-        ).delete()
+        return self._requester(_urls.NOTIFICATIONS_ENTRIES_ALL_URL).delete()
 
     @auth_user_required
     def notifinations_get_entry(self, entry_id: str) -> dict:
@@ -935,10 +1138,7 @@ class _WykopApiClientNotificationsMixin(_WykopApiClientBase):
 
         Pobranie jednej notyfikacji dla zalogowanego użytkownika
         """
-        return ApiRequester(
-            url=_urls.NOTIFICATIONS_ENTRY_URL(entry_id),
-            token=self.auth.get_jwt_token()
-        ).get()
+        return self._requester(_urls.NOTIFICATIONS_ENTRY_URL(entry_id)).get()
 
     @auth_user_required
     def notifinations_mark_entry_readed(self, entry_id: str):
@@ -947,10 +1147,7 @@ class _WykopApiClientNotificationsMixin(_WykopApiClientBase):
 
         Ustawienie powiadomienia jako przeczytane
         """
-        return ApiRequester(
-            url=_urls.NOTIFICATIONS_ENTRY_URL(entry_id),
-            token=self.auth.get_jwt_token()
-        ).put()
+        return self._requester(_urls.NOTIFICATIONS_ENTRY_URL(entry_id)).put()
 
     @auth_user_required
     def notifinations_delete_entry(self, entry_id: str):
@@ -959,10 +1156,7 @@ class _WykopApiClientNotificationsMixin(_WykopApiClientBase):
 
         Usunięcie powiadomienia
         """
-        return ApiRequester(
-            url=_urls.NOTIFICATIONS_ENTRY_URL(entry_id),
-            token=self.auth.get_jwt_token()
-        ).delete()
+        return self._requester(_urls.NOTIFICATIONS_ENTRY_URL(entry_id)).delete()
     
     @auth_user_required
     def notifinations_list_pms(self) -> dict:
@@ -971,10 +1165,7 @@ class _WykopApiClientNotificationsMixin(_WykopApiClientBase):
 
         Pobranie listy notyfikacji o prywatnych wiadomościach użytkownika
         """
-        return ApiRequester(
-            url=_urls.NOTIFICATIONS_PMS_URL,
-            token=self.auth.get_jwt_token()
-        ).get()
+        return self._requester(_urls.NOTIFICATIONS_PMS_URL).get()
 
     @auth_user_required
     def notifinations_mark_all_pms_readed(self):
@@ -983,10 +1174,7 @@ class _WykopApiClientNotificationsMixin(_WykopApiClientBase):
 
         Ustawienie wszystkich powiadomień z prywatnych wiadomości jako przeczytane
         """
-        return ApiRequester(
-            url=_urls.NOTIFICATIONS_PMS_ALL_URL,
-            token=self.auth.get_jwt_token()
-        ).put()
+        return self._requester(_urls.NOTIFICATIONS_PMS_ALL_URL).put()
     
     @auth_user_required
     def notifinations_delete_all_pms(self):
@@ -995,10 +1183,7 @@ class _WykopApiClientNotificationsMixin(_WykopApiClientBase):
 
         Usunięcie wszystkich powiadomień z prywatnych wiadomości
         """
-        return ApiRequester(
-            url=_urls.NOTIFICATIONS_PMS_ALL_URL,
-            token=self.auth.get_jwt_token()
-        ).delete()
+        return self._requester(_urls.NOTIFICATIONS_PMS_ALL_URL).delete()
 
     @auth_user_required
     def notifinations_get_pm(self, pm_id: str) -> dict:
@@ -1007,10 +1192,7 @@ class _WykopApiClientNotificationsMixin(_WykopApiClientBase):
 
         Pobranie pw dla zalogowanego użytkownika
         """
-        return ApiRequester(
-            url=_urls.NOTIFICATIONS_PM_URL(pm_id),
-            token=self.auth.get_jwt_token()
-        ).get()
+        return self._requester(_urls.NOTIFICATIONS_PM_URL(pm_id)).get()
 
     @auth_user_required
     def notifinations_mark_pm_readed(self, pm_id: str):
@@ -1019,10 +1201,7 @@ class _WykopApiClientNotificationsMixin(_WykopApiClientBase):
 
         Ustawienie pw jako przeczytanej
         """
-        return ApiRequester(
-            url=_urls.NOTIFICATIONS_PM_URL(pm_id),
-            token=self.auth.get_jwt_token()
-        ).put()
+        return self._requester(_urls.NOTIFICATIONS_PM_URL(pm_id)).put()
 
     @auth_user_required
     def notifinations_delete_pm(self, pm_id: str):
@@ -1031,10 +1210,7 @@ class _WykopApiClientNotificationsMixin(_WykopApiClientBase):
 
         Usunięcie pw
         """
-        return ApiRequester(
-            url=_urls.NOTIFICATIONS_PM_URL(pm_id),
-            token=self.auth.get_jwt_token()
-        ).delete()
+        return self._requester(_urls.NOTIFICATIONS_PM_URL(pm_id)).delete()
 
 
 class _WykopApiClientMediaPhotosMixin(_WykopApiClientBase):
@@ -1051,10 +1227,7 @@ class _WykopApiClientMediaPhotosMixin(_WykopApiClientBase):
         mimetype: 'image/jpeg', 'image/jpg', 'image/pjpeg', 'image/gif', 'image/png', 'image/x-png'. 
         Maksymalny rozmiar pliku to 10 MB.
         """
-        return ApiRequester(
-            url=_urls.MEDIA_PHOTOS_UPLOAD_URL,
-            token=self.auth.get_jwt_token()
-        ).post(data={"url": url}, params={"type": type.value})
+        return self._requester(_urls.MEDIA_PHOTOS_UPLOAD_URL).post(data={"url": url}, params={"type": type.value})
     
     @auth_user_required
     def photos_upload_file(self, picf: str, type: MediaPhotosType) -> dict | None:
@@ -1066,10 +1239,7 @@ class _WykopApiClientMediaPhotosMixin(_WykopApiClientBase):
         mimetype: 'image/jpeg', 'image/jpg', 'image/pjpeg', 'image/gif', 'image/png', 'image/x-png'. 
         Maksymalny rozmiar pliku to 10 MB.
         """
-        return ApiRequester(
-            url=_urls.MEDIA_PHOTOS_UPLOAD_FILE,
-            token=self.auth.get_jwt_token()
-            ).post(files={"file": open(picf,"rb")}, params={"type": type.value})
+        return self._requester(_urls.MEDIA_PHOTOS_UPLOAD_FILE).post(files={"file": open(picf,"rb")}, params={"type": type.value})
 
 
     @auth_user_required
@@ -1079,10 +1249,7 @@ class _WykopApiClientMediaPhotosMixin(_WykopApiClientBase):
 
         Właściciel pliku posiada możliwość jego usunięcia z serwera.
         """
-        return ApiRequester(
-            url=_urls.MEDIA_PHOTOS_GET_PHOTO_URL(key),
-            token=self.auth.get_jwt_token()
-        ).delete()
+        return self._requester(_urls.MEDIA_PHOTOS_GET_PHOTO_URL(key)).delete()
 
 
 class _WykopApiClientMediaEmedMixin(_WykopApiClientBase):
@@ -1096,10 +1263,7 @@ class _WykopApiClientMediaEmedMixin(_WykopApiClientBase):
 
         Wgrywanie podglądu embed przez URL na serwer
         """
-        return ApiRequester(
-            url=_urls.MEDIA_EMBED_UPLOAD_URL,
-            token=self.auth.get_jwt_token()
-        ).post({"url": url})
+        return self._requester(_urls.MEDIA_EMBED_UPLOAD_URL).post({"url": url})
 
 
 class _WykopApiClientProfileMixin(_WykopApiClientBase):
@@ -1111,74 +1275,110 @@ class _WykopApiClientProfileMixin(_WykopApiClientBase):
         """
         Pobranie danych publicznych i prywatnych zalogowanego użytkownika.
         """
-        return ApiRequester(
-            url=_urls.PROFILES_OWN_PROFILE_URL,
-            token=self.auth.get_jwt_token()
-        ).get()
+        return self._requester(_urls.PROFILES_OWN_PROFILE_URL).get()
 
     @auth_user_required
     def profiles_get_my_profile_short(self) -> dict:
         """
         Pobranie danych publicznych zalogowanego użytkownika - wersja skrócona.
         """
-        return ApiRequester(
-            url=_urls.PROFILES_OWN_SHORT_PROFILE_URL,
-            token=self.auth.get_jwt_token()
-        ).get()
+        return self._requester(_urls.PROFILES_OWN_SHORT_PROFILE_URL).get()
 
     def profiles_get_profile(self, username: str) -> dict:
         """
         Pobranie danych publicznych danego użytkownika.
         """
-        return ApiRequester(
-            url=_urls.PROFILES_PROFILE_URL(username),
-            token=self.auth.get_jwt_token()
-        ).get()
+        return self._requester(_urls.PROFILES_PROFILE_URL(username)).get()
 
     def profiles_get_profile_short(self, username: str) -> dict:
         """
         Pobranie danych publicznych danego użytkownika - wersja skrócona.
         """
-        return ApiRequester(
-            url=_urls.PROFILES_PROFILE_SHORT_URL(username),
-            token=self.auth.get_jwt_token()
-        ).get()
+        return self._requester(_urls.PROFILES_PROFILE_SHORT_URL(username)).get()
 
     def profiles_get_profile_actions(self, username: str) -> dict:
         """
         Lista akcji (wpisy i znaleziska) autorstwa danego użytkownika
         """
-        return ApiRequester(
-            url=_urls.PROFILES_PROFILE_ACTIONS_URL(username),
-            token=self.auth.get_jwt_token()
-        ).get()
+        return self._requester(_urls.PROFILES_PROFILE_ACTIONS_URL(username)).get()
 
     def profiles_get_profile_entries_added(self, username: str, page: str | None = None, limit: int | None = None) -> dict:
         """
         Lista wpisów autorstwa danego użytkownika
         """
-        return ApiRequester(
-            url=_urls.PROFILES_PROFILE_ENTRIES_ADDED_URL(username),
-            token=self.auth.get_jwt_token()
-        ).get({"page": page, "limit": limit})
+        return self._requester(_urls.PROFILES_PROFILE_ENTRIES_ADDED_URL(username)).get({"page": page, "limit": limit})
+
+    def iter_profiles_get_profile_entries_added(
+            self,
+            username: str,
+            limit: int | None = None,
+            max_items: int | None = None,
+            max_pages: int | None = None
+        ) -> Iterator[dict]:
+        """
+        Generator zwracający kolejne wpisy autorstwa danego użytkownika ze wszystkich stron.
+        Sam dobiera rodzaj paginacji (numer strony albo hash next) i pobiera kolejne strony dopiero gdy są potrzebne.
+
+        params max_items: maksymalna liczba zwróconych elementów
+        params max_pages: maksymalna liczba pobranych stron
+        """
+        return self._paginate(
+            lambda page: self.profiles_get_profile_entries_added(username, page=page, limit=limit),
+            max_items=max_items,
+            max_pages=max_pages
+        )
 
     def profiles_get_profile_entries_voted(self, username: str, page: str | None = None, limit: int | None = None) -> dict:
         """
         Lista plusowanych wpisów przez użytkownika
         """
-        return ApiRequester(
-            url=_urls.PROFILES_PROFILE_ENTRIES_VOTED_URL(username),
-            token=self.auth.get_jwt_token()
-        ).get({"page": page, "limit": limit})
+        return self._requester(_urls.PROFILES_PROFILE_ENTRIES_VOTED_URL(username)).get({"page": page, "limit": limit})
+
+    def iter_profiles_get_profile_entries_voted(
+            self,
+            username: str,
+            limit: int | None = None,
+            max_items: int | None = None,
+            max_pages: int | None = None
+        ) -> Iterator[dict]:
+        """
+        Generator zwracający kolejne wpisy plusowane przez użytkownika ze wszystkich stron.
+        Sam dobiera rodzaj paginacji (numer strony albo hash next) i pobiera kolejne strony dopiero gdy są potrzebne.
+
+        params max_items: maksymalna liczba zwróconych elementów
+        params max_pages: maksymalna liczba pobranych stron
+        """
+        return self._paginate(
+            lambda page: self.profiles_get_profile_entries_voted(username, page=page, limit=limit),
+            max_items=max_items,
+            max_pages=max_pages
+        )
 
     def profiles_get_profile_entries_commented(self, username: str, page: str | None = None, limit: int | None = None) -> dict:
         """
         Lista komentarzy autorstwa danego użytkownika wraz z wpisem
         """
-        return ApiRequester(
-            url=_urls.PROFILES_PROFILE_ENTRIES_COMMENTED_URL(username),
-            token=self.auth.get_jwt_token()
-        ).get({"page": page, "limit": limit})
+        return self._requester(_urls.PROFILES_PROFILE_ENTRIES_COMMENTED_URL(username)).get({"page": page, "limit": limit})
+
+    def iter_profiles_get_profile_entries_commented(
+            self,
+            username: str,
+            limit: int | None = None,
+            max_items: int | None = None,
+            max_pages: int | None = None
+        ) -> Iterator[dict]:
+        """
+        Generator zwracający kolejne komentarze autorstwa danego użytkownika wraz z wpisem ze wszystkich stron.
+        Sam dobiera rodzaj paginacji (numer strony albo hash next) i pobiera kolejne strony dopiero gdy są potrzebne.
+
+        params max_items: maksymalna liczba zwróconych elementów
+        params max_pages: maksymalna liczba pobranych stron
+        """
+        return self._paginate(
+            lambda page: self.profiles_get_profile_entries_commented(username, page=page, limit=limit),
+            max_items=max_items,
+            max_pages=max_pages
+        )
 
     def profiles_get_profile_links_added(
             self,
@@ -1189,101 +1389,219 @@ class _WykopApiClientProfileMixin(_WykopApiClientBase):
         """
         Lista znalezisk autorstwa danego użytkownika
         """
-        return ApiRequester(
-            url=_urls.PROFILES_PROFILE_LINKS_ADDED_URL(username),
-            token=self.auth.get_jwt_token()
-        ).get({"page": page, "limit": limit})
-    
+        return self._requester(_urls.PROFILES_PROFILE_LINKS_ADDED_URL(username)).get({"page": page, "limit": limit})
+
+    def iter_profiles_get_profile_links_added(
+            self,
+            username: str,
+            limit: int | None = None,
+            max_items: int | None = None,
+            max_pages: int | None = None
+        ) -> Iterator[dict]:
+        """
+        Generator zwracający kolejne znaleziska autorstwa danego użytkownika ze wszystkich stron.
+        Sam dobiera rodzaj paginacji (numer strony albo hash next) i pobiera kolejne strony dopiero gdy są potrzebne.
+
+        params max_items: maksymalna liczba zwróconych elementów
+        params max_pages: maksymalna liczba pobranych stron
+        """
+        return self._paginate(
+            lambda page: self.profiles_get_profile_links_added(username, page=page, limit=limit),
+            max_items=max_items,
+            max_pages=max_pages
+        )
+
     def profiles_get_profile_links_published(self, username: str, page: str | None = None, limit: int | None = None) -> dict:
         """
         Lista znalezisk autorstwa danego użytkownika, które trafiły na stronę główną
         """
-        return ApiRequester(
-            url=_urls.PROFILES_PROFILE_LINKS_PUBLISHED_URL(username),
-            token=self.auth.get_jwt_token()
-        ).get({"page": page, "limit": limit})
+        return self._requester(_urls.PROFILES_PROFILE_LINKS_PUBLISHED_URL(username)).get({"page": page, "limit": limit})
+
+    def iter_profiles_get_profile_links_published(
+            self,
+            username: str,
+            limit: int | None = None,
+            max_items: int | None = None,
+            max_pages: int | None = None
+        ) -> Iterator[dict]:
+        """
+        Generator zwracający kolejne znaleziska danego użytkownika, które trafiły na stronę główną ze wszystkich stron.
+        Sam dobiera rodzaj paginacji (numer strony albo hash next) i pobiera kolejne strony dopiero gdy są potrzebne.
+
+        params max_items: maksymalna liczba zwróconych elementów
+        params max_pages: maksymalna liczba pobranych stron
+        """
+        return self._paginate(
+            lambda page: self.profiles_get_profile_links_published(username, page=page, limit=limit),
+            max_items=max_items,
+            max_pages=max_pages
+        )
 
     def profiles_get_profile_links_up(self, username: str, page: str | None = None, limit: int | None = None) -> dict:
         """
         Lista znalezisk wykopanych przez danego użytkownika
         """
-        return ApiRequester(
-            url=_urls.PROFILES_PROFILE_LINKS_UP_URL(username),
-            token=self.auth.get_jwt_token()
-        ).get({"page": page, "limit": limit})
+        return self._requester(_urls.PROFILES_PROFILE_LINKS_UP_URL(username)).get({"page": page, "limit": limit})
+
+    def iter_profiles_get_profile_links_up(
+            self,
+            username: str,
+            limit: int | None = None,
+            max_items: int | None = None,
+            max_pages: int | None = None
+        ) -> Iterator[dict]:
+        """
+        Generator zwracający kolejne znaleziska wykopane przez danego użytkownika ze wszystkich stron.
+        Sam dobiera rodzaj paginacji (numer strony albo hash next) i pobiera kolejne strony dopiero gdy są potrzebne.
+
+        params max_items: maksymalna liczba zwróconych elementów
+        params max_pages: maksymalna liczba pobranych stron
+        """
+        return self._paginate(
+            lambda page: self.profiles_get_profile_links_up(username, page=page, limit=limit),
+            max_items=max_items,
+            max_pages=max_pages
+        )
 
     @auth_user_required
     def profiles_get_profile_links_down(self, username: str, page: str | None = None, limit: int | None = None) -> dict:
         """
         Lista znalezisk zakopanych przez zalogowanego użytkownika
         """
-        return ApiRequester(
-            url=_urls.PROFILES_PROFILE_LINKS_DOWN_URL(username),
-            token=self.auth.get_jwt_token()
-        ).get({"page": page, "limit": limit})
+        return self._requester(_urls.PROFILES_PROFILE_LINKS_DOWN_URL(username)).get({"page": page, "limit": limit})
+
+    @auth_user_required
+    def iter_profiles_get_profile_links_down(
+            self,
+            username: str,
+            limit: int | None = None,
+            max_items: int | None = None,
+            max_pages: int | None = None
+        ) -> Iterator[dict]:
+        """
+        Generator zwracający kolejne znaleziska zakopane przez zalogowanego użytkownika ze wszystkich stron.
+        Sam dobiera rodzaj paginacji (numer strony albo hash next) i pobiera kolejne strony dopiero gdy są potrzebne.
+
+        params max_items: maksymalna liczba zwróconych elementów
+        params max_pages: maksymalna liczba pobranych stron
+        """
+        return self._paginate(
+            lambda page: self.profiles_get_profile_links_down(username, page=page, limit=limit),
+            max_items=max_items,
+            max_pages=max_pages
+        )
 
     def profiles_get_profile_links_commented(self, username: str, page: str | None = None, limit: int | None = None) -> dict:
         """
         Lista komentarzy autorstwa danego użytkownika wraz ze znaleziskiem
         """
-        return ApiRequester(
-            url=_urls.PROFILES_PROFILE_LINKS_COMMENTED_URL(username),
-            token=self.auth.get_jwt_token()
-        ).get({"page": page, "limit": limit})
+        return self._requester(_urls.PROFILES_PROFILE_LINKS_COMMENTED_URL(username)).get({"page": page, "limit": limit})
+
+    def iter_profiles_get_profile_links_commented(
+            self,
+            username: str,
+            limit: int | None = None,
+            max_items: int | None = None,
+            max_pages: int | None = None
+        ) -> Iterator[dict]:
+        """
+        Generator zwracający kolejne komentarze autorstwa danego użytkownika wraz ze znaleziskiem ze wszystkich stron.
+        Sam dobiera rodzaj paginacji (numer strony albo hash next) i pobiera kolejne strony dopiero gdy są potrzebne.
+
+        params max_items: maksymalna liczba zwróconych elementów
+        params max_pages: maksymalna liczba pobranych stron
+        """
+        return self._paginate(
+            lambda page: self.profiles_get_profile_links_commented(username, page=page, limit=limit),
+            max_items=max_items,
+            max_pages=max_pages
+        )
 
     def profiles_get_profile_links_related(self, username: str, page: str | None = None, limit: int | None = None) -> dict:
         """
         Lista linków powiązanych autorstwa danego użytkownika wraz ze znaleziskiem
         """
-        return ApiRequester(
-            url=_urls.PROFILES_PROFILE_LINKS_RELATED_URL(username),
-            token=self.auth.get_jwt_token()
-        ).get({"page": page, "limit": limit})
+        return self._requester(_urls.PROFILES_PROFILE_LINKS_RELATED_URL(username)).get({"page": page, "limit": limit})
+
+    def iter_profiles_get_profile_links_related(
+            self,
+            username: str,
+            limit: int | None = None,
+            max_items: int | None = None,
+            max_pages: int | None = None
+        ) -> Iterator[dict]:
+        """
+        Generator zwracający kolejne linki powiązane autorstwa danego użytkownika ze wszystkich stron.
+        Sam dobiera rodzaj paginacji (numer strony albo hash next) i pobiera kolejne strony dopiero gdy są potrzebne.
+
+        params max_items: maksymalna liczba zwróconych elementów
+        params max_pages: maksymalna liczba pobranych stron
+        """
+        return self._paginate(
+            lambda page: self.profiles_get_profile_links_related(username, page=page, limit=limit),
+            max_items=max_items,
+            max_pages=max_pages
+        )
 
     def profiles_get_profile_badges(self, username: str) -> dict:
         """
         Pobiera listę osiągnięć użytkownika
         """
-        return ApiRequester(
-            url=_urls.PROFILES_PROFILE_BADGES_URL(username),
-            token=self.auth.get_jwt_token()
-        ).get()
+        return self._requester(_urls.PROFILES_PROFILE_BADGES_URL(username)).get()
 
     def profiles_get_profile_tags(self, username: str) -> dict:
         """
         Lista tagów autorskich użytkownika
         """
-        return ApiRequester(
-            url=_urls.PROFILES_PROFILE_TAGS_URL(username),
-            token=self.auth.get_jwt_token()
-        ).get()
+        return self._requester(_urls.PROFILES_PROFILE_TAGS_URL(username)).get()
 
     def profiles_get_profile_observed_tags(self, username: str) -> dict:
         """
         Pobranie obserwowanych tagów użytkownika
         """
-        return ApiRequester(
-            url=_urls.PROFILES_PROFILE_OBSERVED_TAGS_URL(username),
-            token=self.auth.get_jwt_token()
-        ).get()
+        return self._requester(_urls.PROFILES_PROFILE_OBSERVED_TAGS_URL(username)).get()
 
     def profiles_get_profile_users_following(self, username: str) -> dict:
         """
         Lista osób obserwowanych przez danego użytkownika
         """
-        return ApiRequester(
-            url=_urls.PROFILES_PROFILE_OBSERVED_FOLLOWING_URL(username),
-            token=self.auth.get_jwt_token()
-        ).get()
+        return self._requester(_urls.PROFILES_PROFILE_OBSERVED_FOLLOWING_URL(username)).get()
 
     def profiles_get_profile_users_followers(self, username: str) -> dict:
         """
         Lista osób obserwujących danego użytkownika
         """
-        return ApiRequester(
-            url=_urls.PROFILES_PROFILE_OBSERVED_FOLLOWERS_URL(username),
-            token=self.auth.get_jwt_token()
-        ).get()
+        return self._requester(_urls.PROFILES_PROFILE_OBSERVED_FOLLOWERS_URL(username)).get()
+
+    def iter_profiles_enriched(
+            self,
+            usernames: Iterable[str],
+            short: bool = True,
+            follow_counts: bool = False,
+            concurrency: int = 8,
+            cache: dict | None = None,
+            on_error: BulkErrorHandler | None = None
+        ) -> Iterator[dict]:
+        """
+        Pobiera jednocześnie profile wielu użytkowników razem z osiągnięciami i tagami autorskimi i zwraca
+        w kolejności zakończenia pobierania rekordy {"username", "profile", "badges", "tags"}
+        (oraz "followers" i "following" z liczbą obserwujących i obserwowanych przy follow_counts=True,
+        albo None, gdy API nie zwróciło łącznej liczby w paginacji).
+
+        Powtórzone nazwy użytkowników są pobierane i zwracane raz. Wszystkie zapytania (do 5 na użytkownika)
+        są wykonywane jednocześnie, co najwyżej concurrency naraz, a limit zapytań sesji (RateLimiter)
+        obowiązuje dla każdego z nich.
+
+        params usernames: nazwy użytkowników, mogą być generatorem - są pobierane w miarę przetwarzania
+        params short: czy pobierać skrócony profil (profiles_get_profile_short) zamiast pełnego
+        params follow_counts: czy pobierać liczbę obserwujących i obserwowanych
+        params concurrency: maksymalna liczba jednoczesnych zapytań
+        params cache: słownik nazwa użytkownika -> rekord; przekazany do kolejnych wywołań pozwala
+            nie pobierać ponownie użytkowników z poprzednich wywołań
+        params on_error: funkcja wywoływana z nazwą użytkownika i błędem API (np. WykopApiNotFoundError dla usuniętego
+            konta), po którym użytkownik jest pomijany. Domyślnie błąd przerywa pobieranie
+        """
+        return self._unordered(self._bulk().profiles(usernames, short, follow_counts, concurrency, cache, on_error))
 
 class _WykopApiClientPMMixin(_WykopApiClientBase):
     """
@@ -1296,10 +1614,7 @@ class _WykopApiClientPMMixin(_WykopApiClientBase):
 
         Wymaga zalogowania uzytkownika.
         """
-        return ApiRequester(
-            url=_urls.PMS_READ_ALL_URL,
-            token=self.auth.get_jwt_token()
-        ).put()
+        return self._requester(_urls.PMS_READ_ALL_URL).put()
     
     @auth_user_required
     def pms_list_conversations(self, username: str | None = None):
@@ -1310,10 +1625,7 @@ class _WykopApiClientPMMixin(_WykopApiClientBase):
 
         Wymaga zalogowania uzytkownika.
         """
-        return ApiRequester(
-            url=_urls.PMS_CONVERSATIONS_URL,
-            token=self.auth.get_jwt_token()
-        ).get({"query": username})
+        return self._requester(_urls.PMS_CONVERSATIONS_URL).get({"query": username})
 
     @auth_user_required
     def pms_create_pm(
@@ -1327,10 +1639,7 @@ class _WykopApiClientPMMixin(_WykopApiClientBase):
 
         Wymaga zalogowania uzytkownika.
         """
-        return ApiRequester(
-            url=_urls.PMS_CONVERSATION_URL(username),
-            token=self.auth.get_jwt_token()
-        ).post({"content": content, "photo": photo, "embed": embed})
+        return self._requester(_urls.PMS_CONVERSATION_URL(username)).post({"content": content, "photo": photo, "embed": embed})
 
     @auth_user_required
     def pms_get_conversation(
@@ -1347,10 +1656,7 @@ class _WykopApiClientPMMixin(_WykopApiClientBase):
 
         Wymaga zalogowania uzytkownika.
         """
-        return ApiRequester(
-            url=_urls.PMS_CONVERSATION_URL(username),
-            token=self.auth.get_jwt_token()
-        ).get({"prev_message": prev_message, "next_message": next_message})
+        return self._requester(_urls.PMS_CONVERSATION_URL(username)).get({"prev_message": prev_message, "next_message": next_message})
 
     @auth_user_required
     def pms_delete_conversation(
@@ -1362,10 +1668,7 @@ class _WykopApiClientPMMixin(_WykopApiClientBase):
 
         Wymaga zalogowania uzytkownika.
         """
-        return ApiRequester(
-            url=_urls.PMS_CONVERSATION_URL(username),
-            token=self.auth.get_jwt_token()
-        ).delete()
+        return self._requester(_urls.PMS_CONVERSATION_URL(username)).delete()
 
 
 class WykopApiClient(
@@ -1385,4 +1688,17 @@ class WykopApiClient(
     """
     Główna klasa klienta, zbiór mixinów.
     """
-    pass
+    def batch(self, calls: Iterable[BatchCall], concurrency: int = 8) -> list[BatchResult]:
+        """
+        Wykonuje równolegle wiele niezależnych akcji klienta.
+
+        Wyniki są zwracane w kolejności wywołań. Błąd pojedynczego wywołania (np. WykopApiNotFoundError)
+        trafia do BatchResult.error i nie przerywa pozostałych.
+        UWAGA: przy concurrency większym niż rozmiar puli połączeń (ApiSession(pool_maxsize=...))
+        nadmiarowe połączenia nie będą ponownie wykorzystywane.
+
+        params calls: krotki (nazwa_metody, *argumenty) albo funkcje bez argumentów, np.
+            [("entries_get_entry", "123"), functools.partial(api.links_get_link, "456")]
+        params concurrency: maksymalna liczba jednocześnie wykonywanych zapytań
+        """
+        return run_batch(self, calls, concurrency)
@@ -0,0 +1,212 @@
+import bisect
+import threading
+from collections import defaultdict
+from typing import Iterator
+
+try:
+    from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, HistogramMetricFamily
+except ImportError:
+    CounterMetricFamily = GaugeMetricFamily = HistogramMetricFamily = None
+
+from ._hooks import RequestEvent
+from ._urls import AUTH_URL, REFRESH_TOKEN_URL
+from ..exceptions import WykopApiLimitExceededError
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_TOKEN_TEMPLATES = frozenset({AUTH_URL.template, REFRESH_TOKEN_URL.template})
+
+
+def _status_class(event: RequestEvent) -> str:
+    if event.status_code is None:
+        return "error"
+
+    return f"{event.status_code // 100}xx"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: tuple[str, ...], values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        result = []
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            result.append((_number(bound), total))
+
+        result.append(("+Inf", self.count))
+        return result
+
+
+class SdkMetrics:
+    """
+    Metryki SDK zbierane przez hooki sesji (RequestHooks) w formacie Prometheusa/OpenMetrics.
+
+    Zbierane są:
+        - wykop_sdk_requests_total{method, template, status_class} - wykonane zapytania HTTP
+        - wykop_sdk_request_duration_seconds{method, template} - histogram czasu zapytań
+        - wykop_sdk_retries_total{template} - ponowione próby
+        - wykop_sdk_rate_limit_errors_total{template} - przekroczenia limitu (WykopApiLimitExceededError, HTTP 429)
+        - wykop_sdk_tokens_issued_total{template} - pobrane tokeny (/auth) i ich odświeżenia (/refresh-token)
+        - wykop_sdk_cache_requests_total{result} - trafienia (hit), chybienia (miss) i rewalidacje cache
+        - wykop_sdk_requests_in_flight - zapytania w trakcie wykonywania
+
+    Metryki można pobrać jako tekst w formacie OpenMetrics przez render() albo zarejestrować
+    w prometheus_client (pip install wykop_sdk_reloaded[metrics]): REGISTRY.register(metrics)
+
+    Przykład:
+        metrics = SdkMetrics().attach(session)
+        ...
+        print(metrics.render())
+
+    params buckets: górne granice przedziałów histogramu czasu zapytań w sekundach
+    """
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+
+        self.requests = defaultdict(int)
+        self.durations = {}
+        self.retries = defaultdict(int)
+        self.rate_limit_errors = defaultdict(int)
+        self.tokens_issued = defaultdict(int)
+        self.cache_requests = defaultdict(int)
+        self.in_flight = 0
+
+    def attach(self, session) -> "SdkMetrics":
+        """
+        Rejestruje hooki w sesji (ApiSession albo AsyncApiSession). Jedne metryki można podpiąć pod wiele sesji
+        """
+        session.hooks.on_request(self.on_request)
+        session.hooks.on_response(self.on_finish)
+        session.hooks.on_error(self.on_finish)
+        return self
+
+    def on_request(self, event: RequestEvent):
+        with self._lock:
+            self.in_flight += 1
+            if event.attempt:
+                self.retries[(event.template,)] += 1
+
+    def on_finish(self, event: RequestEvent):
+        with self._lock:
+            self.in_flight -= 1
+
+            if event.cache is not None:
+                self.cache_requests[(event.cache,)] += 1
+            if event.cache == "hit":
+                return
+
+            self.requests[(event.method, event.template, _status_class(event))] += 1
+
+            histogram = self.durations.get((event.method, event.template))
+            if histogram is None:
+                histogram = self.durations[(event.method, event.template)] = _Histogram(self.buckets)
+            histogram.observe(event.timings.get("total", 0.0))
+
+            if isinstance(event.error, WykopApiLimitExceededError) or event.status_code == 429:
+                self.rate_limit_errors[(event.template,)] += 1
+
+            if event.error is None and event.template in _TOKEN_TEMPLATES:
+                self.tokens_issued[(event.template,)] += 1
+
+    def _counters(self) -> Iterator[tuple[str, str, tuple[str, ...], dict]]:
+        yield "wykop_sdk_requests", "Wykonane zapytania HTTP", ("method", "template", "status_class"), self.requests
+        yield "wykop_sdk_retries", "Ponowione próby zapytań", ("template",), self.retries
+        yield "wykop_sdk_rate_limit_errors", "Przekroczenia limitu zapytań", ("template",), self.rate_limit_errors
+        yield "wykop_sdk_tokens_issued", "Pobrane i odświeżone tokeny", ("template",), self.tokens_issued
+        yield "wykop_sdk_cache_requests", "Odczyty z cache odpowiedzi", ("result",), self.cache_requests
+
+    def render(self) -> str:
+        """
+        Zwraca metryki w formacie tekstowym OpenMetrics
+        """
+        lines = []
+
+        with self._lock:
+            for name, description, label_names, values in self._counters():
+                lines.append(f"# TYPE {name} counter")
+                lines.append(f"# HELP {name} {description}")
+                for labels, value in values.items():
+                    lines.append(f"{name}_total{_labels(label_names, labels)} {value}")
+
+            name = "wykop_sdk_request_duration_seconds"
+            lines.append(f"# TYPE {name} histogram")
+            lines.append(f"# HELP {name} Czas wykonania zapytań HTTP")
+            lines.append(f"# UNIT {name} seconds")
+            label_names = ("method", "template")
+            for labels, histogram in self.durations.items():
+                for bound, count in histogram.cumulative():
+                    bucket = _labels(label_names, labels, 'le="%s"' % bound)
+                    lines.append(f"{name}_bucket{bucket} {count}")
+                lines.append(f"{name}_count{_labels(label_names, labels)} {histogram.count}")
+                lines.append(f"{name}_sum{_labels(label_names, labels)} {_number(histogram.sum)}")
+
+            name = "wykop_sdk_requests_in_flight"
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"# HELP {name} Zapytania w trakcie wykonywania")
+            lines.append(f"{name} {self.in_flight}")
+
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def collect(self):
+        """
+        Zwraca metryki w postaci rodzin metryk prometheus_client, dzięki czemu obiekt można zarejestrować
+        jako kolektor: prometheus_client.REGISTRY.register(metrics)
+        """
+        if CounterMetricFamily is None:
+            raise ImportError("SdkMetrics.collect wymaga biblioteki prometheus_client. Zainstaluj wykop_sdk_reloaded[metrics]")
+
+        with self._lock:
+            families = []
+
+            for name, description, label_names, values in self._counters():
+                family = CounterMetricFamily(name, description, labels=label_names)
+                for labels, value in values.items():
+                    family.add_metric(labels, value)
+                families.append(family)
+
+            family = HistogramMetricFamily(
+                "wykop_sdk_request_duration_seconds", "Czas wykonania zapytań HTTP", labels=("method", "template")
+            )
+            for labels, histogram in self.durations.items():
+                family.add_metric(labels, histogram.cumulative(), histogram.sum)
+            families.append(family)
+
+            family = GaugeMetricFamily("wykop_sdk_requests_in_flight", "Zapytania w trakcie wykonywania")
+            family.add_metric((), self.in_flight)
+            families.append(family)
+
+        return families
@@ -0,0 +1,292 @@
+from fnmatch import fnmatchcase
+from typing import Any, Callable
+
+from ._urls import endpoint_path
+
+
+class _Nested:
+    """
+    Pole z zagnieżdżonym obiektem (np. author, media, votes), zamieniane na model dopiero przy pierwszym odczycie
+    """
+    def __init__(self, convert: Callable[[Any], Any]):
+        self.convert = convert
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+        self.slot = f"_{name}"
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        value = getattr(instance, self.slot)
+        bit = 1 << owner._nested.index(self.name)
+
+        if value is not None and not instance._parsed & bit:
+            value = self.convert(value)
+            setattr(instance, self.slot, value)
+            instance._parsed |= bit
+
+        return value
+
+
+class Model:
+    """
+    Bazowa klasa modeli odpowiedzi.
+
+    Modele przechowują pola w __slots__ zamiast w słowniku, a zagnieżdżone obiekty (autor, media, głosy, komentarze)
+    są zamieniane na modele dopiero przy pierwszym odczycie. Pola, których model nie zna, trafiają do atrybutu extra,
+    więc zmiany w API nie powodują utraty danych.
+    """
+    __slots__ = ("extra", "_parsed")
+
+    _fields: tuple[str, ...] = ()
+    _nested: tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._known = frozenset(cls._fields + cls._nested)
+
+    def __init__(self, data: dict):
+        for field in self._fields:
+            setattr(self, field, data.get(field))
+        for field in self._nested:
+            setattr(self, f"_{field}", data.get(field))
+
+        self._parsed = 0
+        self.extra = {k: v for k, v in data.items() if k not in self._known} or None
+
+    def to_dict(self) -> dict:
+        """
+        Zwraca dane modelu w postaci słownika zgodnego z odpowiedzią API
+        """
+        data = {field: getattr(self, field) for field in self._fields}
+        for field in self._nested:
+            data[field] = _to_dict(getattr(self, f"_{field}"))
+
+        if self.extra:
+            data.update(self.extra)
+
+        return data
+
+    def __repr__(self) -> str:
+        key = next((getattr(self, f) for f in ("id", "username", "name") if f in self._fields), None)
+        return f"{type(self).__name__}({key!r})"
+
+
+def _to_dict(value: Any) -> Any:
+    if isinstance(value, Model):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_to_dict(item) for item in value]
+    return value
+
+
+def _model_list(model: type) -> Callable[[list], list]:
+    return lambda items: [model(item) if isinstance(item, dict) else item for item in items]
+
+
+class Profile(Model):
+    """
+    Profil użytkownika (także autor wpisu, komentarza czy znaleziska)
+    """
+    _fields = (
+        "username", "gender", "company", "avatar", "color", "status", "verified", "online",
+        "rank", "background", "summary", "note", "follow", "blacklist", "created_at"
+    )
+    __slots__ = _fields
+
+
+class Media(Model):
+    """
+    Załączniki: zdjęcie, embed albo ankieta
+    """
+    _fields = ("photo", "embed", "survey")
+    __slots__ = _fields
+
+
+class Votes(Model):
+    """
+    Głosy oddane na wpis, komentarz albo znalezisko
+    """
+    _fields = ("up", "down", "count", "users")
+    __slots__ = _fields
+
+
+class _Commentable(Model):
+    __slots__ = ()
+
+    author = _Nested(Profile)
+    media = _Nested(Media)
+    votes = _Nested(Votes)
+
+
+class EntryComment(_Commentable):
+    """
+    Komentarz do wpisu z mikrobloga
+    """
+    _fields = (
+        "id", "parent_id", "slug", "created_at", "content", "adult", "resource",
+        "voted", "favourite", "deletable", "editable", "deleted", "device"
+    )
+    _nested = ("author", "media", "votes")
+    __slots__ = _fields + tuple(f"_{n}" for n in _nested)
+
+
+class _Comments(Model):
+    """
+    Podsumowanie komentarzy: liczba i (częściowa) lista
+    """
+    _fields = ("count",)
+    __slots__ = _fields + ("items",)
+
+    def __init__(self, data: dict, model: type):
+        items = data.get("items")
+        self.items = _model_list(model)(items) if items else items
+
+        super().__init__({k: v for k, v in data.items() if k != "items"})
+
+    def to_dict(self) -> dict:
+        data = super().to_dict()
+        data["items"] = _to_dict(self.items)
+        return data
+
+
+class Entry(_Commentable):
+    """
+    Wpis z mikrobloga
+    """
+    _fields = (
+        "id", "slug", "created_at", "content", "adult", "tags", "resource",
+        "voted", "favourite", "deletable", "editable", "deleted", "device"
+    )
+    _nested = ("author", "media", "votes", "comments")
+    __slots__ = _fields + tuple(f"_{n}" for n in _nested)
+
+    comments = _Nested(lambda data: _Comments(data, EntryComment) if isinstance(data, dict) else data)
+
+
+class LinkComment(_Commentable):
+    """
+    Komentarz do znaleziska
+    """
+    _fields = (
+        "id", "parent_id", "slug", "created_at", "content", "adult", "resource",
+        "voted", "favourite", "deletable", "editable", "deleted", "blacklist", "device"
+    )
+    _nested = ("author", "media", "votes", "comments")
+    __slots__ = _fields + tuple(f"_{n}" for n in _nested)
+
+    comments = _Nested(lambda data: _Comments(data, LinkComment) if isinstance(data, dict) else data)
+
+
+class Link(_Commentable):
+    """
+    Znalezisko
+    """
+    _fields = (
+        "id", "slug", "title", "description", "source", "created_at", "published_at", "hot",
+        "adult", "tags", "resource", "voted", "favourite", "deletable", "editable", "deleted", "archive"
+    )
+    _nested = ("author", "media", "votes", "comments")
+    __slots__ = _fields + tuple(f"_{n}" for n in _nested)
+
+    comments = _Nested(lambda data: _Comments(data, LinkComment) if isinstance(data, dict) else data)
+
+
+class Tag(Model):
+    """
+    Tag
+    """
+    _fields = (
+        "name", "created_at", "description", "personal", "blacklist",
+        "followers", "follow", "notifications", "editable", "actions"
+    )
+    _nested = ("author", "media")
+    __slots__ = _fields + tuple(f"_{n}" for n in _nested)
+
+    author = _Nested(Profile)
+    media = _Nested(Media)
+
+
+class Conversation(Model):
+    """
+    Konwersacja w prywatnych wiadomościach
+    """
+    _fields = ("last_message", "unread", "read")
+    _nested = ("user",)
+    __slots__ = _fields + tuple(f"_{n}" for n in _nested)
+
+    user = _Nested(Profile)
+
+
+_RESOURCE_MODELS = {
+    "entry": Entry,
+    "entry_comment": EntryComment,
+    "link": Link,
+    "link_comment": LinkComment,
+}
+
+# modele dla endpointów, których elementy nie mają pola resource.
+# Wygrywa pierwszy pasujący wzorzec, a * pasuje także do "/", więc szczegółowe wzorce muszą być przed ogólnymi
+_ENDPOINT_MODELS = (
+    ("profile", Profile),
+    ("profile/short", Profile),
+    ("profile/users/*/short", Profile),
+    ("profile/users/*/observed/users/*", Profile),
+    ("profile/users/*/observed/tags", Tag),
+    ("profile/users/*/tags", Tag),
+    ("profile/users/*/*", None),
+    ("profile/users/*", Profile),
+    ("tags/*/users", Profile),
+    ("tags/popular", Tag),
+    ("tags/popular-user-tags", Tag),
+    ("tags/*/related", Tag),
+    ("tags/*/*", None),
+    ("tags/*", Tag),
+    ("pm/conversations", Conversation),
+)
+
+
+def _endpoint_model(url: str) -> type | None:
+    path = endpoint_path(url)
+
+    for pattern, model in _ENDPOINT_MODELS:
+        if fnmatchcase(path, pattern):
+            return model
+
+    return None
+
+
+def _to_model(item: Any, fallback: type | None) -> Any:
+    if not isinstance(item, dict):
+        return item
+
+    model = _RESOURCE_MODELS.get(item.get("resource")) or fallback
+    return model(item) if model else item
+
+
+def item_converter(url: str) -> Callable[[Any], Any]:
+    """
+    Zwraca funkcję zamieniającą pojedynczy element data odpowiedzi z danego adresu na model
+    """
+    fallback = _endpoint_model(url)
+    return lambda item: _to_model(item, fallback)
+
+
+def to_models(url: str, response: dict | None) -> dict | None:
+    """
+    Zamienia pole data odpowiedzi API na modele. Elementy, dla których nie ma modelu, pozostają słownikami.
+    """
+    if not isinstance(response, dict) or "data" not in response:
+        return response
+
+    convert = item_converter(url)
+    data = response["data"]
+
+    if isinstance(data, list):
+        data = [convert(item) for item in data]
+    else:
+        data = convert(data)
+
+    return {**response, "data": data}
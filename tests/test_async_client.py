@@ -0,0 +1,136 @@
+import asyncio
+import gzip
+import inspect
+import json
+import os
+import tempfile
+from unittest import IsolatedAsyncioTestCase
+
+import httpx
+
+from src.wykop_sdk_reloaded.v3.async_client import AsyncApiSession, AsyncAuthClient, AsyncWykopApiClient, Cassette
+from src.wykop_sdk_reloaded.v3._replay import AsyncRecordReplayTransport
+from src.wykop_sdk_reloaded.v3.client import WykopApiClient
+from src.wykop_sdk_reloaded.exceptions import AuthError, WykopApiAuthorizationError
+
+
+class TestAsyncWykopApiClient(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.requests = []
+
+        async def handler(request: httpx.Request):
+            self.requests.append(request)
+
+            if request.url.path.endswith("/slow"):
+                await asyncio.sleep(0.05)
+                return httpx.Response(200, json={"data": {"slow": True}})
+
+            if request.url.path.endswith("/auth"):
+                return httpx.Response(200, json={"data": {"token": "app-token"}})
+            if request.url.path.endswith("/list/stream"):
+                return httpx.Response(200, json={"data": [{"id": 1}, {"id": 2}], "pagination": {"next": None}})
+            if request.url.path.endswith("/forbidden"):
+                return httpx.Response(403, json={"error": {"message": "forbidden"}})
+            return httpx.Response(200, json={"data": {"path": request.url.path, "query": str(request.url.query)}})
+
+        self.session = AsyncApiSession()
+        self.session.http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        self.auth = AsyncAuthClient(session=self.session)
+        await self.auth.authenticate_app("key", "secret")
+        self.api = AsyncWykopApiClient(self.auth)
+
+    async def asyncTearDown(self):
+        await self.session.close()
+
+    def test_every_sync_action_has_coroutine_version(self):
+        for name, func in inspect.getmembers(WykopApiClient, inspect.isfunction):
+            if name.startswith(("iter_", "watch_")):
+                self.assertFalse(inspect.iscoroutinefunction(getattr(AsyncWykopApiClient, name)), name)
+            elif not name.startswith("_"):
+                self.assertTrue(inspect.iscoroutinefunction(getattr(AsyncWykopApiClient, name)), name)
+
+    async def test_get(self):
+        response = await self.api.tags_get_stream_of_tag("wykop", limit=10)
+
+        self.assertEqual(response["data"]["path"], "/api/v3/tags/wykop/stream")
+        self.assertIn("limit=10", response["data"]["query"])
+        self.assertEqual(self.requests[-1].headers["Authorization"], "Bearer app-token")
+
+    async def test_iter(self):
+        items = [item async for item in self.api.iter_entries_list_entries(max_items=1)]
+
+        self.assertEqual(len(items), 1)
+
+    async def test_iter_streamed_pages(self):
+        api = AsyncWykopApiClient(self.auth, stream_pages=True)
+
+        items = [item async for item in api.iter_tags_get_stream_of_tag("list")]
+
+        self.assertEqual(items, [{"id": 1}, {"id": 2}])
+
+    async def test_batch(self):
+        results = await self.api.batch(
+            [("entries_get_entry", str(i)) for i in range(5)] + [("raw_request", "https://wykop.pl/api/v3/forbidden", "get")],
+            concurrency=2
+        )
+
+        self.assertEqual([r.result["data"]["path"] for r in results[:5]], [f"/api/v3/entries/{i}" for i in range(5)])
+        self.assertIsInstance(results[5].error, WykopApiAuthorizationError)
+
+    async def test_identical_gets_are_coalesced(self):
+        coalescing_session = AsyncApiSession(coalesce=True)
+        coalescing_session.http = self.session.http
+        self.api.session = coalescing_session
+
+        results = await asyncio.gather(*(self.api.tags_get_detail_of_tag("slow") for _ in range(10)))
+
+        self.assertEqual(len(results), 10)
+        self.assertEqual(len(self.requests), 1 + 1)
+
+        # anulowanie lidera nie anuluje oczekujących - jeden z nich ponawia zapytanie
+        leader = asyncio.create_task(self.api.tags_get_detail_of_tag("slow"))
+        await asyncio.sleep(0)
+        followers = asyncio.gather(*(self.api.tags_get_detail_of_tag("slow") for _ in range(3)))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        self.assertEqual(len(await followers), 3)
+        self.assertEqual(len(self.requests), 2 + 2)
+
+    async def test_record_and_replay_gzip(self):
+        path = os.path.join(tempfile.mkdtemp(), "cassette.jsonl")
+
+        async def gzip_handler(request: httpx.Request):
+            body = json.dumps({"data": {"path": request.url.path}}).encode()
+            return httpx.Response(200, headers={"Content-Encoding": "gzip"}, content=gzip.compress(body))
+
+        with Cassette(path, mode="record") as cassette:
+            transport = AsyncRecordReplayTransport(cassette, httpx.MockTransport(gzip_handler))
+            self.session.http = httpx.AsyncClient(transport=transport)
+            recorded = await self.api.entries_get_entry("1")
+
+        self.assertEqual(recorded, {"data": {"path": "/api/v3/entries/1"}})
+
+        session = AsyncApiSession(cassette=Cassette(path))
+        self.api.session = session
+        try:
+            self.assertEqual(await self.api.entries_get_entry("1"), recorded)
+        finally:
+            await session.close()
+
+    async def test_errors_are_mapped(self):
+        with self.assertRaises(WykopApiAuthorizationError):
+            await self.api.raw_request("https://wykop.pl/api/v3/forbidden", "get")
+
+    async def test_user_token_without_refresh_token_is_not_refreshed(self):
+        self.auth.jwt_user_token = "user-token"
+
+        with self.assertRaises(WykopApiAuthorizationError):
+            await self.api.raw_request("https://wykop.pl/api/v3/forbidden", "get")
+
+        self.assertEqual([r.url.path for r in self.requests[1:]], ["/api/v3/forbidden"])
+
+    async def test_user_required(self):
+        with self.assertRaises(AuthError):
+            await self.api.entries_create_entry("lorem")
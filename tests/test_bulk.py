@@ -0,0 +1,153 @@
+import re
+from typing import Callable
+from unittest import TestCase
+from urllib.parse import parse_qs, urlparse
+
+from src.wykop_sdk_reloaded.v3.client import ApiSession, AuthClient, WykopApiClient
+from src.wykop_sdk_reloaded.exceptions import WykopApiNotFoundError
+
+from .utils import mount_fake
+
+
+NOT_FOUND = 404, {"error": {"message": "not found"}}
+
+
+def numbered_page(items: list, page: int, per_page: int = 2) -> tuple[int, dict]:
+    """
+    Strona listy stronicowanej numerami stron, tak jak komentarze w API
+    """
+    data = items[(page - 1) * per_page:page * per_page]
+    return 200, {"data": data, "pagination": {"per_page": per_page, "total": len(items)}}
+
+
+class FakeWykopApi:
+    """
+    Responder dla FakeAdapter: odpowiada na /auth, a pozostałe zapytania przekazuje do funkcji zarejestrowanej
+    dla pasującej ścieżki (względem /api/v3), razem z numerem strony i grupami wyrażenia regularnego
+    """
+    def __init__(self):
+        self.routes: list[tuple[re.Pattern, Callable]] = []
+
+    def route(self, pattern: str, handler: Callable[..., tuple[int, dict]]):
+        self.routes.append((re.compile(pattern), handler))
+
+    def __call__(self, request):
+        url = urlparse(request.url)
+        path = url.path.removeprefix("/api/v3")
+
+        if path == "/auth":
+            return 200, {"data": {"token": "app-token"}}
+
+        page = int(parse_qs(url.query).get("page", [1])[0])
+        for pattern, handler in self.routes:
+            if match := pattern.fullmatch(path):
+                return handler(page, *match.groups())
+
+        return NOT_FOUND
+
+
+class TestBulk(TestCase):
+    def setUp(self):
+        self.session = ApiSession()
+        self.fake = FakeWykopApi()
+        self.adapter = mount_fake(self.session, self.fake)
+
+        auth = AuthClient(session=self.session)
+        auth.authenticate_app("key", "secret")
+        self.api = WykopApiClient(auth)
+
+    def api_requests(self) -> list[str]:
+        return [request.url for request in self.adapter.requests if not request.url.endswith("/auth")]
+
+    def route_link_comments(self, count: int = 5):
+        def comment(i: int) -> dict:
+            replies = [{"id": f"{i}.{j}"} for j in range(3)]
+            # API zwraca przy liście tylko część odpowiedzi pod co drugim komentarzem
+            return {"id": i, "comments": {"count": 3, "items": replies[:2] if i % 2 else replies}}
+
+        comments = [comment(i) for i in range(count)]
+        self.fake.route(r"/links/1/comments", lambda page: numbered_page(comments, page))
+        self.fake.route(
+            r"/links/1/comments/(\d+)",
+            lambda page, i: (200, {"data": {"id": int(i), "comments": {"count": 3, "items": [{"id": f"{i}.{j}"} for j in range(3)]}}})
+        )
+
+    def test_link_comment_tree(self):
+        self.route_link_comments()
+
+        tree = self.api.link_comments_get_comment_tree("1", concurrency=3)
+
+        self.assertEqual([item["id"] for item in tree], [0, 1, 2, 3, 4])
+        self.assertTrue(all(len(item["comments"]["items"]) == 3 for item in tree))
+        # 3 strony i 2 komentarze z niepełną listą odpowiedzi
+        self.assertEqual(len(self.api_requests()), 3 + 2)
+        self.assertEqual(sorted(item["id"] for item in self.api.iter_link_comments_comment_tree("1")), [0, 1, 2, 3, 4])
+
+    def test_link_comment_tree_expansion_error(self):
+        self.fake.route(r"/links/1/comments/3", lambda page: NOT_FOUND)
+        self.route_link_comments()
+        errors = []
+
+        tree = self.api.link_comments_get_comment_tree("1", on_error=lambda *e: errors.append(e))
+
+        self.assertEqual([comment_id for comment_id, _ in errors], [3])
+        # komentarz, którego nie udało się uzupełnić, zostaje z odpowiedziami zwróconymi przy liście
+        self.assertEqual([len(item["comments"]["items"]) for item in tree], [3, 3, 3, 2, 3])
+
+        with self.assertRaises(WykopApiNotFoundError):
+            self.api.link_comments_get_comment_tree("1")
+
+    def test_entries_with_comments(self):
+        comments = [{"id": i} for i in range(5)]
+        self.fake.route(r"/entries/3", lambda page: NOT_FOUND)
+        self.fake.route(r"/entries/\d+/comments", lambda page: numbered_page(comments, page))
+        self.fake.route(
+            r"/entries/(\d+)",
+            lambda page, i: (200, {"data": {"id": int(i), "comments": {"count": 5 if i == "2" else 1, "items": [{"id": 0}]}}})
+        )
+        errors = []
+
+        pairs = list(self.api.iter_entries_with_comments(["1", "2", "3"], concurrency=2, on_error=lambda *e: errors.append(e)))
+
+        self.assertEqual(
+            sorted((entry["id"], len(comments)) for entry, comments in pairs),
+            [(1, 1), (2, 5)]
+        )
+        self.assertEqual([entry_id for entry_id, _ in errors], ["3"])
+        # wpisy 1-3 i trzy strony komentarzy wpisu 2
+        self.assertEqual(len(self.api_requests()), 3 + 3)
+
+    def test_profiles_enriched(self):
+        self.fake.route(r"/profile/users/gone(/.*)?", lambda page, part: NOT_FOUND)
+        self.fake.route(
+            r"/profile/users/\w+/observed/users/followers",
+            lambda page: (200, {"data": [{"username": "x"}], "pagination": {"per_page": 1, "total": 7}})
+        )
+        self.fake.route(
+            r"/profile/users/\w+/observed/users/following",
+            lambda page: (200, {"data": [{"username": "x"}, {"username": "y"}]})
+        )
+        self.fake.route(r"/profile/users/\w+/(badges|tags)", lambda page, part: (200, {"data": [part]}))
+        self.fake.route(r"/profile/users/\w+/short", lambda page: (200, {"data": {"part": "short"}}))
+        errors = []
+        cache = {"cached": {"username": "cached"}}
+
+        records = list(self.api.iter_profiles_enriched(
+            ["a", "b", "a", "gone", "cached"],
+            follow_counts=True,
+            concurrency=3,
+            cache=cache,
+            on_error=lambda *e: errors.append(e)
+        ))
+
+        self.assertEqual(sorted(record["username"] for record in records), ["a", "b", "cached"])
+        record = next(record for record in records if record["username"] == "a")
+        self.assertEqual(record["profile"], {"part": "short"})
+        self.assertEqual(record["badges"], ["badges"])
+        self.assertEqual(record["tags"], ["tags"])
+        # bez pagination.total liczba obserwowanych jest nieznana, a nie równa długości pierwszej strony
+        self.assertEqual((record["followers"], record["following"]), (7, None))
+        self.assertEqual([username for username, _ in errors], ["gone"])
+        self.assertIn("b", cache)
+        # "a" i "b" po 5 zapytań, "gone" co najwyżej 5, "cached" bez zapytań
+        self.assertLessEqual(len(self.api_requests()), 15)
@@ -0,0 +1,169 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from unittest import TestCase
+
+from src.wykop_sdk_reloaded.v3.client import ApiSession, AuthClient, ResponseCache, SqliteResponseCache, WykopApiClient
+from src.wykop_sdk_reloaded.v3._cache import cache_key
+
+from .utils import mount_fake
+
+
+class TestResponseCache(TestCase):
+    def setUp(self):
+        self.cache = ResponseCache(ttl=60, max_entries=2, ttls={"tags/*/related": 0.05, "tags/*/stream": 0.05, "notifications/*": 0})
+        self.session = ApiSession(cache=self.cache)
+
+        def responder(request):
+            if request.url.endswith("/auth"):
+                return 200, {"data": {"token": "app-token"}}
+            if "stream" in request.url:
+                if request.headers.get("If-None-Match") == '"v1"':
+                    return 304, None
+                return 200, {"data": [{"id": 1}]}, {"ETag": '"v1"'}
+            return 200, {"data": {"url": request.url}}
+
+        self.adapter = mount_fake(self.session, responder)
+
+        auth = AuthClient(session=self.session)
+        auth.authenticate_app("key", "secret")
+        self.api = WykopApiClient(auth)
+
+    def test_get_is_cached(self):
+        first = self.api.tags_get_detail_of_tag("wykop")
+        second = self.api.tags_get_detail_of_tag("wykop")
+
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertEqual(len(self.adapter.requests), 2)
+
+    def test_key_contains_params_and_token_scope(self):
+        url = "https://wykop.pl/api/v3/entries"
+
+        self.assertEqual(cache_key(url, {"page": 1, "limit": 2}, "a"), cache_key(url, {"limit": 2, "page": 1}, "a"))
+        self.assertNotEqual(cache_key(url, {"page": 1}, "a"), cache_key(url, {"page": 2}, "a"))
+        self.assertNotEqual(cache_key(url, None, "user-token"), cache_key(url, None, "app-token"))
+        self.assertNotIn("user-token", cache_key(url, None, "user-token"))
+
+    def test_token_change_bypasses_cache(self):
+        self.api.tags_get_detail_of_tag("wykop")
+        self.api.auth.jwt_user_token = "user-token"
+        self.api.tags_get_detail_of_tag("wykop")
+
+        self.assertEqual(len(self.adapter.requests), 3)
+
+    def test_per_endpoint_ttl(self):
+        self.assertEqual(self.cache.ttl_for("https://wykop.pl/api/v3/tags/wykop/related"), 0.05)
+        self.assertEqual(self.cache.ttl_for("https://wykop.pl/api/v3/tags/wykop"), 60)
+
+        self.api.tags_get_related_tag("wykop")
+        time.sleep(0.06)
+        self.api.tags_get_related_tag("wykop")
+
+        self.assertEqual(len(self.adapter.requests), 3)
+
+    def test_lru_eviction(self):
+        for tag in ("a", "b", "a", "c", "a", "b"):
+            self.api.tags_get_detail_of_tag(tag)
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(len(self.adapter.requests), 1 + 4)
+
+    def test_conditional_revalidation(self):
+        first = self.api.tags_get_stream_of_tag("wykop")
+        time.sleep(0.06)
+        second = self.api.tags_get_stream_of_tag("wykop")
+        third = self.api.tags_get_stream_of_tag("wykop")
+
+        self.assertEqual(first, second)
+        self.assertEqual(second, third)
+        self.assertEqual(len(self.adapter.requests), 3)
+        self.assertEqual(self.adapter.requests[-1].headers["If-None-Match"], '"v1"')
+        self.assertNotIn("If-None-Match", self.adapter.requests[-2].headers)
+
+
+class TestSqliteResponseCache(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "cache.sqlite")
+
+    def test_shared_between_instances(self):
+        writer = SqliteResponseCache(self.path, ttl=60)
+        reader = SqliteResponseCache(self.path, ttl=60)
+
+        writer.set("key", "https://wykop.pl/api/v3/tags/wykop", b'{"data": 1}', etag='"v1"')
+        entry = reader.get("key")
+
+        self.assertEqual(entry.body, b'{"data": 1}')
+        self.assertEqual(entry.validators(), {"If-None-Match": '"v1"'})
+        self.assertTrue(entry.fresh)
+
+    def test_expiry_and_purge(self):
+        cache = SqliteResponseCache(self.path, ttl=0.01)
+
+        cache.set("plain", "https://wykop.pl/api/v3/tags/a", b"{}")
+        cache.set("validated", "https://wykop.pl/api/v3/tags/b", b"{}", last_modified="yesterday")
+        time.sleep(0.02)
+
+        self.assertIsNone(cache.get("plain"))
+        self.assertFalse(cache.get("validated").fresh)
+        # get() niczego nie usuwa, wygasłe wpisy zostają do purge_expired()
+        self.assertEqual(cache.stats()["expired"], 2)
+        self.assertEqual(cache.purge_expired(), 2)
+        self.assertEqual(len(cache), 0)
+
+    def test_size_eviction(self):
+        cache = SqliteResponseCache(self.path, max_entries=3, max_size=25)
+
+        for i in range(5):
+            cache.set(f"k{i}", f"https://wykop.pl/api/v3/entries/{i}", b"x" * 10)
+            time.sleep(0.001)
+
+        self.assertEqual(cache.stats()["size"], 20)
+        self.assertIsNotNone(cache.get("k4"))
+        self.assertIsNone(cache.get("k0"))
+
+        self.assertEqual(cache.delete("%/entries/4"), 1)
+
+    def test_reads_do_not_write(self):
+        cache = SqliteResponseCache(self.path, max_entries=3, timeout=0.01)
+        for i in range(3):
+            cache.set(f"k{i}", f"https://wykop.pl/api/v3/entries/{i}", b"{}")
+            time.sleep(0.001)
+
+        # inny proces trzyma blokadę zapisu: odczyt działa, a zapis jest pomijany zamiast rzucać błąd
+        other = sqlite3.connect(self.path, isolation_level=None)
+        other.execute("BEGIN IMMEDIATE")
+        self.assertIsNotNone(cache.get("k0"))
+        cache.set("k3", "https://wykop.pl/api/v3/entries/3", b"{}")
+        other.execute("ROLLBACK")
+        other.close()
+
+        self.assertIsNone(cache.get("k3"))
+
+        # odczyt k0 zapisany przy kolejnym set() chroni go przed usunięciem jako najdawniej używanego
+        cache.set("k3", "https://wykop.pl/api/v3/entries/3", b"{}")
+        self.assertIsNotNone(cache.get("k0"))
+        self.assertIsNone(cache.get("k1"))
+
+    def test_close_connections(self):
+        cache = SqliteResponseCache(self.path)
+        cache.set("main", "https://wykop.pl/api/v3/tags/a", b"{}")
+
+        worker = threading.Thread(target=cache.set, args=("worker", "https://wykop.pl/api/v3/tags/b", b"{}"))
+        worker.start()
+        worker.join()
+
+        cache.close()
+        self.assertEqual(len(cache), 2)
+
+        connections = list(cache._connections)
+        cache.close_all()
+
+        self.assertEqual(len(cache._connections), 0)
+        for connection in connections:
+            with self.assertRaises(sqlite3.ProgrammingError):
+                connection.execute("SELECT 1")
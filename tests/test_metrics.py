@@ -0,0 +1,45 @@
+from unittest import TestCase
+
+from src.wykop_sdk_reloaded.v3.client import ApiSession, AuthClient, ResponseCache, RetryPolicy, WykopApiClient
+from src.wykop_sdk_reloaded.v3.metrics import SdkMetrics
+from src.wykop_sdk_reloaded.exceptions import WykopApiLimitExceededError
+
+from .utils import mount_fake
+
+
+class TestSdkMetrics(TestCase):
+    def setUp(self):
+        self.session = ApiSession(retry=RetryPolicy(max_retries=1, backoff=0.01), cache=ResponseCache())
+        self.metrics = SdkMetrics(buckets=(0.1, 1.0)).attach(self.session)
+
+        def responder(request):
+            if request.url.endswith("/auth"):
+                return 200, {"data": {"token": "app-token"}}
+            if "limit" in request.url:
+                return 400, {"error": {"message": "limit"}}
+            return 200, {"data": {}}
+
+        mount_fake(self.session, responder)
+
+        auth = AuthClient(session=self.session)
+        auth.authenticate_app("key", "secret")
+        self.api = WykopApiClient(auth)
+
+    def test_render(self):
+        self.api.entries_get_entry("1")
+        self.api.entries_get_entry("2")
+        self.api.entries_get_entry("1")
+        with self.assertRaises(WykopApiLimitExceededError):
+            self.api.entries_get_entry("limit")
+
+        lines = self.metrics.render().splitlines()
+
+        self.assertIn('wykop_sdk_requests_total{method="GET",template="/entries/{id}",status_class="2xx"} 2', lines)
+        self.assertIn('wykop_sdk_requests_total{method="GET",template="/entries/{id}",status_class="4xx"} 2', lines)
+        self.assertIn('wykop_sdk_request_duration_seconds_bucket{method="GET",template="/entries/{id}",le="+Inf"} 4', lines)
+        self.assertIn('wykop_sdk_rate_limit_errors_total{template="/entries/{id}"} 2', lines)
+        self.assertIn('wykop_sdk_retries_total{template="/entries/{id}"} 1', lines)
+        self.assertIn('wykop_sdk_tokens_issued_total{template="/auth"} 1', lines)
+        self.assertIn('wykop_sdk_cache_requests_total{result="hit"} 1', lines)
+        self.assertIn("wykop_sdk_requests_in_flight 0", lines)
+        self.assertEqual(lines[-1], "# EOF")
@@ -0,0 +1,76 @@
+from unittest import TestCase
+
+from src.wykop_sdk_reloaded.v3.client import ApiSession, AuthClient, WykopApiClient
+from src.wykop_sdk_reloaded.v3.models import Entry, EntryComment, Link, Profile, Tag, item_converter
+
+from .utils import mount_fake
+
+
+AUTHOR = {"username": "m__b", "color": "orange", "avatar": "https://wykop.pl/a.jpg"}
+ENTRY = {
+    "id": 1,
+    "resource": "entry",
+    "content": "treść",
+    "author": AUTHOR,
+    "votes": {"up": 3, "down": 0},
+    "comments": {"count": 1, "items": [{"id": 2, "resource": "entry_comment", "author": AUTHOR}]},
+    "new_field": True,
+}
+
+
+class TestModels(TestCase):
+    def setUp(self):
+        self.session = ApiSession()
+
+        def responder(request):
+            if request.url.endswith("/auth"):
+                return 200, {"data": {"token": "app-token"}}
+            if "/profile/users/" in request.url:
+                return 200, {"data": AUTHOR}
+            if "/tags/" in request.url:
+                return 200, {"data": [ENTRY, {"id": 3, "resource": "link", "title": "tytuł"}], "pagination": {}}
+
+            return 200, {"data": ENTRY}
+
+        mount_fake(self.session, responder)
+
+        auth = AuthClient(session=self.session)
+        auth.authenticate_app("key", "secret")
+        self.api = WykopApiClient(auth, models=True)
+
+    def test_entry(self):
+        entry = self.api.entries_get_entry("1")["data"]
+
+        self.assertIsInstance(entry, Entry)
+        self.assertFalse(hasattr(entry, "__dict__"))
+        self.assertIsInstance(entry._author, dict)
+        self.assertIsInstance(entry.author, Profile)
+        self.assertIs(entry.author, entry.author)
+        self.assertEqual(entry.votes.up, 3)
+        self.assertIsInstance(entry.comments.items[0], EntryComment)
+        self.assertEqual(entry.extra, {"new_field": True})
+        self.assertEqual(entry.to_dict()["comments"]["items"][0]["author"]["username"], "m__b")
+        self.assertTrue(entry.to_dict()["new_field"])
+
+    def test_mixed_stream_and_endpoint_fallback(self):
+        stream = self.api.tags_get_stream_of_tag("wykop")["data"]
+
+        self.assertEqual([type(item) for item in stream], [Entry, Link])
+        self.assertEqual(self.api.profiles_get_profile("m__b")["data"].username, "m__b")
+
+    def test_profile_subresources(self):
+        self.assertIsInstance(self.api.profiles_get_profile_short("m__b")["data"], Profile)
+
+        for path, model in [
+            ("profile/users/m__b/tags", Tag),
+            ("profile/users/m__b/observed/tags", Tag),
+            ("profile/users/m__b/observed/users/followers", Profile),
+            ("profile/users/m__b/badges", dict),
+        ]:
+            item = item_converter(f"https://wykop.pl/api/v3/{path}")({"name": "wykop"})
+            self.assertIsInstance(item, model, path)
+
+    def test_disabled_by_default(self):
+        self.api.models = False
+
+        self.assertIsInstance(self.api.entries_get_entry("1")["data"], dict)
@@ -0,0 +1,137 @@
+import json
+from unittest import TestCase
+from urllib.parse import parse_qs, urlparse
+
+from src.wykop_sdk_reloaded.v3.client import ApiSession, AuthClient, WykopApiClient
+from src.wykop_sdk_reloaded.v3.types import LinkType
+from src.wykop_sdk_reloaded.v3._stream import ListPageParser
+
+from .utils import mount_fake
+
+
+PAGES = {
+    None: ["a", "b"],
+    "h2": ["c", "d"],
+    "h3": ["e"],
+}
+NEXT = {None: "h2", "h2": "h3", "h3": None}
+
+
+class TestPagination(TestCase):
+    def setUp(self):
+        self.session = ApiSession()
+        self.hash_mode = True
+
+        def responder(request):
+            if request.url.endswith("/auth"):
+                return 200, {"data": {"token": "app-token"}}
+
+            page = parse_qs(urlparse(request.url).query).get("page", [None])[0]
+
+            if self.hash_mode:
+                return 200, {"data": [{"id": i} for i in PAGES[page]], "pagination": {"next": NEXT[page], "prev": None}}
+
+            page = int(page or 1)
+            data = [{"id": i} for i in range((page - 1) * 2, min(page * 2, 5))]
+            return 200, {"data": data, "pagination": {"per_page": 2, "total": 5}}
+
+        self.adapter = mount_fake(self.session, responder)
+
+        auth = AuthClient(session=self.session)
+        auth.authenticate_app("key", "secret")
+        self.api = WykopApiClient(auth)
+
+    def test_hash_pagination(self):
+        ids = [item["id"] for item in self.api.iter_tags_get_stream_of_tag("wykop")]
+
+        self.assertEqual(ids, ["a", "b", "c", "d", "e"])
+        self.assertEqual(len(self.adapter.requests), 4)
+
+    def test_page_number_pagination(self):
+        self.hash_mode = False
+
+        ids = [item["id"] for item in self.api.iter_entries_list_entries()]
+
+        self.assertEqual(ids, [0, 1, 2, 3, 4])
+        self.assertEqual(len(self.adapter.requests), 4)
+
+    def test_limits(self):
+        self.assertEqual(len(list(self.api.iter_links_list_links(LinkType.HOMEPAGE, max_items=3))), 3)
+        self.assertEqual(len(list(self.api.iter_profiles_get_profile_links_added("m__b", max_pages=1))), 2)
+
+    def test_streamed_pages(self):
+        self.api.stream_pages = True
+
+        ids = [item["id"] for item in self.api.iter_tags_get_stream_of_tag("wykop")]
+        self.assertEqual(ids, ["a", "b", "c", "d", "e"])
+
+        self.hash_mode = False
+        self.assertEqual(len(list(self.api.iter_entries_list_entries(max_items=3))), 3)
+
+    def test_list_page_parser(self):
+        body = '{"pagination": {"next": "h2"}, "data": [{"id": 1, "tags": ["a"]}, 12345, "żółw"], "x": null}'.encode()
+        parser = ListPageParser()
+
+        items = []
+        for i in range(len(body)):
+            items += parser.feed(body[i:i + 1])
+        items += parser.close()
+
+        self.assertEqual(items, [{"id": 1, "tags": ["a"]}, 12345, "żółw"])
+        self.assertEqual(parser.meta, {"pagination": {"next": "h2"}, "x": None})
+
+        truncated = ListPageParser()
+        truncated.feed(b'{"data": [{"id": 1}, {"id"')
+        with self.assertRaises(ValueError):
+            truncated.close()
+
+    def test_list_page_parser_uses_session_decoder(self):
+        decoded = []
+
+        def json_loads(value: bytes):
+            decoded.append(value)
+            return json.loads(value)
+
+        item = {"content": 'a "} ]\\' * 5000, "tags": [["x"]]}
+        body = json.dumps({"data": [item, item], "pagination": {"total": 2}}).encode()
+        parser = ListPageParser(json_loads)
+
+        items = []
+        for i in range(0, len(body), 1000):
+            items += parser.feed(body[i:i + 1000])
+        items += parser.close()
+
+        self.assertEqual(items, [item, item])
+        self.assertEqual(parser.meta, {"pagination": {"total": 2}})
+        # każda wartość (klucze, elementy, pagination) jest dekodowana raz, w całości
+        self.assertEqual(len(decoded), 5)
+
+    def test_watch_tag(self):
+        stream = [{"resource": "entry", "id": i, "created_at": f"2024-01-0{i}"} for i in (3, 2, 1)]
+        # kolejne elementy pojawiają się w tagu przed wybranymi zapytaniami (numerowanymi od 1)
+        arrivals = {
+            2: [{"resource": "link", "id": 3, "created_at": "2023-12-31"}, {"resource": "entry", "id": 4}],
+            3: [{"resource": "entry", "id": 5}],
+            6: [{"resource": "entry", "id": 6}],
+        }
+
+        def responder(request):
+            if request.url.endswith("/auth"):
+                return 200, {"data": {"token": "app-token"}}
+            if len(adapter.requests) == 5:
+                return 404, {"error": {"message": "not found"}}
+
+            stream[:0] = arrivals.pop(len(adapter.requests), [])
+            page = int(parse_qs(urlparse(request.url).query).get("page", [1])[0])
+            return 200, {"data": stream[(page - 1) * 2:page * 2], "pagination": {"per_page": 2, "total": len(stream)}}
+
+        adapter = mount_fake(self.session, responder)
+        errors = []
+        watcher = self.api.watch_tag("wykop", min_interval=0, max_interval=0, on_error=errors.append)
+
+        new = [(item["resource"], item["id"]) for item in (next(watcher) for _ in range(4))]
+
+        # znalezisko starsze od najnowszego wpisu nie jest pomijane, a przesunięcie stron nie dubluje wpisu 4
+        self.assertEqual(new, [("entry", 4), ("link", 3), ("entry", 5), ("entry", 6)])
+        self.assertEqual(len(adapter.requests), 6)
+        self.assertEqual(len(errors), 1)
@@ -0,0 +1,28 @@
+import time
+from unittest import TestCase
+
+from src.wykop_sdk_reloaded.v3._rate_limit import RateLimiter, TokenBucket, endpoint_group
+
+
+class TestRateLimiter(TestCase):
+    def test_endpoint_group(self):
+        self.assertEqual(endpoint_group("https://wykop.pl/api/v3/entries/1/comments"), "entries")
+        self.assertEqual(endpoint_group("https://wykop.pl/api/v3/profile/users/m__b"), "profile")
+
+    def test_bucket_reservations(self):
+        bucket = TokenBucket(rate=10, capacity=2)
+
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertAlmostEqual(bucket.reserve(), 0.1, delta=0.01)
+        self.assertAlmostEqual(bucket.reserve(), 0.2, delta=0.01)
+
+    def test_group_budget(self):
+        limiter = RateLimiter(rate=1000, groups={"entries": (20, 1)})
+
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.acquire("https://wykop.pl/api/v3/entries/1")
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+        self.assertEqual(limiter.reserve("https://wykop.pl/api/v3/tags/wykop"), 0)
@@ -0,0 +1,376 @@
+import asyncio
+import base64
+import json
+import os
+import tempfile
+import threading
+import time
+from unittest import TestCase
+
+from benchmarks.fake_server import create_server
+from src.wykop_sdk_reloaded.v3.async_client import AsyncApiSession
+from src.wykop_sdk_reloaded.v3.client import (
+    ApiSession, AuthClient, Cassette, NotificationWatcher, RateLimiter, RetryPolicy, Timeouts, WykopApiClient, deadline
+)
+from src.wykop_sdk_reloaded.exceptions import (
+    AuthError,
+    ReplayError,
+    WykopApiAuthorizationError,
+    WykopApiDeadlineExceededError,
+    WykopApiError,
+    WykopApiNotFoundError
+)
+
+from src.wykop_sdk_reloaded.v3._coalesce import SingleFlight
+from src.wykop_sdk_reloaded.v3._replay import RecordReplayAdapter
+
+from .utils import mount_fake
+
+
+def jwt(exp: float) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode().rstrip("=")
+    return f"header.{payload}.signature"
+
+
+class TestApiSession(TestCase):
+    def setUp(self):
+        self.session = ApiSession(pool_maxsize=4, retry=RetryPolicy(backoff=0.01))
+        self.flaky = 0
+        self.retry_after = "0"
+        self.valid_token = "app-token"
+        self.issued = 0
+
+        def responder(request):
+            if request.url.endswith("/auth"):
+                self.issued += 1
+                return 200, {"data": {"token": self.valid_token}}
+            if request.headers.get("Authorization") != f"Bearer {self.valid_token}":
+                return 403, {"error": {"message": "token expired"}}
+            if "missing" in request.url:
+                return 404, {"error": {"message": "not found"}}
+            if "slow" in request.url:
+                time.sleep(0.1)
+            if "flaky" in request.url and self.flaky:
+                self.flaky -= 1
+                return 503, None, {"Retry-After": self.retry_after}
+            return 200, {"data": {"url": request.url}}
+
+        self.adapter = mount_fake(self.session, responder)
+
+        auth = AuthClient(session=self.session)
+        auth.authenticate_app("key", "secret")
+        self.api = WykopApiClient(auth)
+
+    def test_client_shares_auth_session(self):
+        self.assertIs(self.api.session, self.session)
+
+        self.api.tags_get_detail_of_tag("wykop")
+        self.api.links_get_link("1")
+
+        self.assertEqual(len(self.adapter.requests), 3)
+        self.assertEqual(self.adapter.requests[-1].headers["Authorization"], "Bearer app-token")
+
+    def test_errors_are_mapped(self):
+        with self.assertRaises(WykopApiNotFoundError):
+            self.api.tags_get_detail_of_tag("missing")
+
+    def test_custom_json_decoder_parses_body_once(self):
+        decoded = []
+
+        def json_loads(body):
+            decoded.append(body)
+            return json.loads(body)
+
+        self.session.json_loads = json_loads
+
+        self.api.tags_get_detail_of_tag("wykop")
+        with self.assertRaises(WykopApiNotFoundError) as error:
+            self.api.tags_get_detail_of_tag("missing")
+
+        self.assertEqual(len(decoded), 2)
+        self.assertEqual(error.exception.args[0], {"message": "not found"})
+
+    def test_timeouts(self):
+        self.session.timeout = Timeouts(connect=2, read=10, endpoints={"tags/*": 4})
+
+        self.api.links_get_link("1")
+        self.api.tags_get_detail_of_tag("wykop")
+        with deadline(1):
+            self.api.links_get_link("1")
+
+        self.assertEqual([kwargs["timeout"] for kwargs in self.adapter.send_kwargs[-3:-1]], [(2, 10), (4, 4)])
+        self.assertTrue(all(timeout <= 1 for timeout in self.adapter.send_kwargs[-1]["timeout"]))
+
+    def test_deadline_covers_retries(self):
+        self.flaky = 10
+        self.session.retry = RetryPolicy(max_retries=10, backoff=0.2, jitter=False)
+
+        started = time.monotonic()
+        with self.assertRaises(WykopApiDeadlineExceededError):
+            with deadline(0.5):
+                self.api.tags_get_detail_of_tag("flaky")
+
+        self.assertLess(time.monotonic() - started, 0.5)
+
+        with self.assertRaises(WykopApiDeadlineExceededError):
+            with deadline(0.05):
+                for _ in range(3):
+                    self.api.tags_get_detail_of_tag("slow")
+
+        # deadline obowiązuje też w wątkach batch
+        with deadline(0.05):
+            self.api.batch([("tags_get_detail_of_tag", "wykop")] * 2, concurrency=2)
+        self.assertTrue(all(max(kwargs["timeout"]) <= 0.05 for kwargs in self.adapter.send_kwargs[-2:]))
+
+        # oczekiwanie na limit zapytań dłuższe niż deadline() kończy się od razu
+        self.session.rate_limiter = RateLimiter(rate=1)
+        self.api.tags_get_detail_of_tag("wykop")
+        started = time.monotonic()
+        with self.assertRaises(WykopApiDeadlineExceededError):
+            with deadline(0.2):
+                self.api.tags_get_detail_of_tag("wykop")
+        self.assertLess(time.monotonic() - started, 0.1)
+
+    def test_hooks(self):
+        events = []
+        self.session.hooks.on_request(lambda event: events.append(("request", event.template, event.attempt)))
+        self.session.hooks.on_response(lambda event: events.append(("response", event.status_code, event.response_bytes)))
+        self.session.hooks.on_error(lambda event: events.append(("error", event.status_code, type(event.error))))
+
+        self.flaky = 1
+        self.api.entry_comments_list_comments("flaky")
+        with self.assertRaises(WykopApiNotFoundError):
+            self.api.tags_get_detail_of_tag("missing")
+
+        body_size = len(self.adapter.requests[1].url) + len('{"data": {"url": ""}}')
+        self.assertEqual(events, [
+            ("request", "/entries/{id}/comments", 0),
+            ("error", 503, WykopApiError),
+            ("request", "/entries/{id}/comments", 1),
+            ("response", 200, body_size),
+            ("request", "/tags/{tag}", 0),
+            ("error", 404, WykopApiNotFoundError),
+        ])
+
+        # oczekiwanie na limiter zapytań jest raportowane osobno i nie wlicza się do czasu zapytania
+        timings = []
+        self.session.hooks.on_response(lambda event: timings.append(event.timings))
+        self.session.rate_limiter = RateLimiter(rate=10, burst=1)
+        self.api.tags_get_detail_of_tag("wykop")
+        self.api.tags_get_detail_of_tag("wykop")
+
+        self.assertGreater(timings[-1]["queued"], 0.05)
+        self.assertLess(timings[-1]["total"], 0.05)
+
+    def test_sync_and_async_timings_have_same_keys(self):
+        server = create_server()
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        url = f"http://127.0.0.1:{server.server_address[1]}/api/v3/tags/popular"
+
+        def sync_timings() -> list[set]:
+            keys = []
+            with ApiSession() as session:
+                for _ in range(2):
+                    timings = {}
+                    session.request("GET", url, timings=timings)
+                    keys.append(set(timings))
+            return keys
+
+        async def async_timings() -> list[set]:
+            keys = []
+            session = AsyncApiSession()
+            try:
+                for _ in range(2):
+                    timings = {}
+                    await session.request("GET", url, timings=timings)
+                    keys.append(set(timings))
+            finally:
+                await session.close()
+            return keys
+
+        # nowe połączenie (bez TLS na lokalnym serwerze), a potem połączenie z puli
+        expected = [{"connect", "ttfb"}, {"ttfb"}]
+        self.assertEqual(sync_timings(), expected)
+        self.assertEqual(asyncio.run(async_timings()), expected)
+
+    def test_record_and_replay(self):
+        path = os.path.join(tempfile.mkdtemp(), "cassette.jsonl.gz")
+
+        with Cassette(path, mode="record") as cassette:
+            self.session.http.mount("https://", RecordReplayAdapter(cassette, self.adapter))
+            self.api.auth.authenticate_app("key", "secret")
+            recorded = [
+                self.api.entries_get_entry("1"),
+                self.api.entries_list_entries(page=2),
+            ]
+            with self.assertRaises(WykopApiNotFoundError):
+                self.api.tags_get_detail_of_tag("missing")
+
+        auth = AuthClient(session=ApiSession(cassette=Cassette(path)))
+        auth.authenticate_app("key", "secret")
+        api = WykopApiClient(auth)
+
+        self.assertEqual([api.entries_get_entry("1"), api.entries_list_entries(page=2)], recorded)
+        with self.assertRaises(WykopApiNotFoundError):
+            api.tags_get_detail_of_tag("missing")
+        with self.assertRaises(ReplayError):
+            api.entries_list_entries(page=3)
+
+        auth = AuthClient(session=ApiSession(cassette=Cassette(path, match="template")))
+        auth.authenticate_app("key", "secret")
+        self.assertEqual(WykopApiClient(auth).entries_get_entry("2"), recorded[0])
+
+    def test_notification_watcher(self):
+        status = {"entry_notification": 1, "pm_notification": 0}
+        notifications = [{"id": 1}]
+
+        def responder(request):
+            if request.url.endswith("/notifications/status"):
+                return 200, {"data": status}
+            return 200, {"data": notifications}
+
+        adapter = mount_fake(self.session, responder)
+        self.api.auth.jwt_user_token = "user-token"
+
+        watcher = NotificationWatcher(self.api)
+        received = []
+        watcher.on_entries(received.append)
+        watcher.on_pms(received.append)
+
+        self.assertEqual(watcher.poll(), 1)
+        self.assertEqual(watcher.poll(), 0)
+
+        status["entry_notification"] = 2
+        notifications.insert(0, {"id": 2})
+        self.assertEqual(watcher.poll(), 1)
+
+        self.assertEqual(received, [[{"id": 1}], [{"id": 2}]])
+        self.assertEqual(
+            [request.url.rsplit("/", 2)[-2:] for request in adapter.requests],
+            [["notifications", "status"], ["notifications", "entries"], ["notifications", "status"],
+             ["notifications", "status"], ["notifications", "entries"]]
+        )
+
+    def test_keep_alive_disabled(self):
+        session = ApiSession(keep_alive=False)
+        self.assertEqual(session.http.headers["Connection"], "close")
+
+    def test_batch(self):
+        results = self.api.batch(
+            [("entries_get_entry", str(i)) for i in range(20)]
+            + [("tags_get_detail_of_tag", "missing"), ("entries_create_entry", "lorem")],
+            concurrency=4
+        )
+
+        self.assertEqual(len(results), 22)
+        for i, result in enumerate(results[:20]):
+            self.assertTrue(result.ok)
+            self.assertTrue(result.result["data"]["url"].endswith(f"/entries/{i}"))
+
+        self.assertIsInstance(results[20].error, WykopApiNotFoundError)
+        self.assertIsInstance(results[21].error, AuthError)
+        with self.assertRaises(WykopApiNotFoundError):
+            results[20].unwrap()
+
+    def test_retry_idempotent_requests(self):
+        self.flaky = 2
+        self.api.tags_get_detail_of_tag("flaky")
+
+        self.assertEqual(len(self.adapter.requests), 4)
+        self.assertEqual(self.flaky, 0)
+
+    def test_retry_gives_up(self):
+        self.flaky = 10
+
+        with self.assertRaises(WykopApiError) as e:
+            self.api.tags_get_detail_of_tag("flaky")
+
+        self.assertEqual(e.exception.status_code, 503)
+        self.assertEqual(len(self.adapter.requests), 5)
+
+    def test_retry_after_above_max_backoff_is_not_waited_for(self):
+        self.flaky = 1
+        self.retry_after = "3600"
+
+        started = time.monotonic()
+        with self.assertRaises(WykopApiError) as e:
+            self.api.tags_get_detail_of_tag("flaky")
+
+        self.assertEqual(e.exception.status_code, 503)
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(len(self.adapter.requests), 2)
+
+    def test_post_is_not_retried_by_default(self):
+        self.flaky = 1
+
+        with self.assertRaises(WykopApiError):
+            self.api.raw_request("https://wykop.pl/api/v3/flaky", "post")
+
+        self.session.retry = RetryPolicy(backoff=0.01, methods={"GET", "POST"})
+        self.flaky = 1
+        self.api.raw_request("https://wykop.pl/api/v3/flaky", "post")
+
+    def test_expired_token_is_refreshed_once(self):
+        self.valid_token = "app-token-2"
+
+        threads = [threading.Thread(target=self.api.tags_get_detail_of_tag, args=("wykop",)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.issued, 2)
+        self.assertEqual(self.api.auth.jwt_app_token, "app-token-2")
+
+    def test_expired_token_without_auto_refresh(self):
+        self.api.auth.auto_refresh_token = False
+        self.valid_token = "app-token-2"
+
+        with self.assertRaises(WykopApiAuthorizationError):
+            self.api.tags_get_detail_of_tag("wykop")
+
+    def test_expiring_token_is_refreshed_before_request(self):
+        self.api.auth.jwt_app_token = jwt(time.time() + 30)
+        self.valid_token = jwt(time.time() + 3600)
+
+        self.api.tags_get_detail_of_tag("wykop")
+
+        self.assertEqual(self.issued, 2)
+        self.assertEqual([r.url.endswith("/auth") for r in self.adapter.requests[-2:]], [True, False])
+
+        self.api.tags_get_detail_of_tag("wykop")
+        self.assertEqual(self.issued, 2)
+
+    def test_user_token_without_refresh_token_is_not_replaced_by_app_token(self):
+        self.api.auth.jwt_user_token = self.valid_token = jwt(time.time() + 30)
+
+        self.api.tags_get_detail_of_tag("wykop")
+        self.api.tags_get_detail_of_tag("wykop")
+
+        self.assertEqual(self.issued, 1)
+        self.assertFalse(any(r.url.endswith("/auth") for r in self.adapter.requests[1:]))
+
+        self.valid_token = "app-token"
+        with self.assertRaises(WykopApiAuthorizationError):
+            self.api.tags_get_detail_of_tag("wykop")
+        self.assertEqual(self.issued, 1)
+
+    def test_identical_gets_are_coalesced(self):
+        self.session.coalescing = SingleFlight()
+        results = []
+
+        def fetch(tag):
+            results.append(self.api.tags_get_detail_of_tag(tag))
+
+        threads = [threading.Thread(target=fetch, args=("slow",)) for _ in range(10)]
+        threads.append(threading.Thread(target=fetch, args=("slow-other",)))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(results), 11)
+        self.assertEqual(len(self.adapter.requests), 1 + 2)
+
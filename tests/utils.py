@@ -0,0 +1,43 @@
+import json
+import threading
+
+import requests
+from requests.adapters import BaseAdapter
+
+
+class FakeAdapter(BaseAdapter):
+    """
+    Adapter requests zwracający przygotowane odpowiedzi zamiast łączyć się z wykopem
+    """
+    def __init__(self, responder):
+        super().__init__()
+        self.responder = responder
+        self.requests = []
+        self.send_kwargs = []
+        self.lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        with self.lock:
+            self.requests.append(request)
+            self.send_kwargs.append(kwargs)
+
+        status, body, *rest = self.responder(request)
+        headers = rest[0] if rest else {}
+
+        response = requests.Response()
+        response.status_code = status
+        response.request = request
+        response.url = request.url
+        response.headers.update(headers)
+        response._content = json.dumps(body).encode() if body is not None else b""
+        response._content_consumed = True
+        return response
+
+    def close(self):
+        pass
+
+
+def mount_fake(session, responder) -> FakeAdapter:
+    adapter = FakeAdapter(responder)
+    session.http.mount("https://", adapter)
+    return adapter